@@ -3,24 +3,28 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import sleep
-from collections.abc import KeysView
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator, Iterable, KeysView
+import importlib
 import logging
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlsplit
 
-from aiohttp import ClientSession
-import requests
-import xmltodict
+from aiohttp import ClientError, ClientSession, ClientTimeout
 
-from pyvizio.api._protocol import KEY_CODE, async_invoke_api, async_invoke_api_auth
+from pyvizio.api._protocol import (
+    ENDPOINT,
+    EXTRACT_MODEL,
+    KEY_CODE,
+    async_invoke_api,
+    async_invoke_api_auth,
+    async_validate_response,
+)
 from pyvizio.api.apps import (
     AppConfig,
     GetCurrentAppConfigCommand,
     GetCurrentAppNameCommand,
     LaunchAppConfigCommand,
     LaunchAppNameCommand,
+    get_app_index,
 )
 from pyvizio.api.base import CommandBase
 from pyvizio.api.input import (
@@ -55,7 +59,6 @@ from pyvizio.api.settings import (
 )
 from pyvizio.const import (
     APP_HOME,
-    APPS,
     DEFAULT_DEVICE_CLASS,
     DEFAULT_PORTS,
     DEFAULT_TIMEOUT,
@@ -63,10 +66,10 @@ from pyvizio.const import (
     DEVICE_CLASS_SPEAKER,
     DEVICE_CLASS_TV,
     DEVICE_CONFIGS,
+    DEVICE_TYPE_UNKNOWN as DEVICE_TYPE_UNKNOWN,
     MAX_VOLUME as MAX_VOLUME,
+    TV_ONLY_PORT,
 )
-from pyvizio.discovery.ssdp import SSDPDevice, discover as discover_ssdp
-from pyvizio.discovery.zeroconf import ZeroconfDevice, discover as discover_zc
 from pyvizio.errors import (
     VizioAuthError,
     VizioConnectionError as VizioConnectionError,
@@ -75,11 +78,31 @@ from pyvizio.errors import (
     VizioResponseError as VizioResponseError,
 )
 from pyvizio.helpers import async_to_sync, open_port
-from pyvizio.util import gen_apps_list_from_url
+from pyvizio.sync import get_sync_runner, run_on_sync_runner
 from pyvizio.version import __version__ as __version__
 
+if TYPE_CHECKING:
+    from pyvizio.discovery.service import DiscoveredDevice
+    from pyvizio.discovery.ssdp import SSDPDevice
+    from pyvizio.discovery.zeroconf import ZeroconfDevice
+
 _LOGGER = logging.getLogger(__name__)
 
+# Discovery backends pull in zeroconf and xmltodict, so they are only
+# imported once something uses them
+_LAZY_ATTRS = {
+    "DiscoveredDevice": "pyvizio.discovery.service",
+    "SSDPDevice": "pyvizio.discovery.ssdp",
+    "ZeroconfDevice": "pyvizio.discovery.zeroconf",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import discovery classes lazily on first access."""
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class VizioAsync:
     """Asynchronous class to interact with Vizio SmartCast devices."""
@@ -92,7 +115,7 @@ class VizioAsync:
         auth_token: str | None = "",
         device_type: str = DEFAULT_DEVICE_CLASS,
         session: ClientSession | None = None,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float = DEFAULT_TIMEOUT,
         max_concurrent_requests: int = 1,
     ) -> None:
         """Initialize asynchronous class to interact with Vizio SmartCast devices."""
@@ -114,8 +137,6 @@ class VizioAsync:
             raise VizioInvalidParameterError("max_concurrent_requests must be >= 1")
         self._max_concurrent_requests = max_concurrent_requests
         self._semaphore: asyncio.Semaphore | None = None
-        self._latest_apps: list[dict[str, Any]] | None = None
-        self._latest_apps_last_updated: datetime | None = None
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.__dict__})"
@@ -136,6 +157,10 @@ class VizioAsync:
             self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
         return self._semaphore
 
+    def _get_session(self) -> ClientSession | None:
+        """Return session to send requests with (None to use a temporary one)."""
+        return self._session
+
     async def __add_port(self) -> None:
         """Asynchronously add first open port from known ports list to `ip` property."""
         for port in DEFAULT_PORTS:
@@ -164,7 +189,7 @@ class VizioAsync:
                 _LOGGER,
                 custom_timeout=self._timeout,
                 log_api_exception=log_api_exception,
-                session=self._session,
+                session=self._get_session(),
             )
 
     async def __invoke_api_auth(
@@ -182,7 +207,7 @@ class VizioAsync:
                 auth_token=self._auth_token,
                 custom_timeout=self._timeout,
                 log_api_exception=log_api_exception,
-                session=self._session,
+                session=self._get_session(),
             )
 
     async def __invoke_api_may_need_auth(
@@ -235,57 +260,54 @@ class VizioAsync:
         return await self.__remote(key_codes, log_api_exception=log_api_exception)
 
     async def __get_cached_apps_list(self) -> list[dict[str, Any]]:
-        if (
-            self._latest_apps
-            and self._latest_apps_last_updated is not None
-            and datetime.now() - self._latest_apps_last_updated < timedelta(days=1)
-        ):
-            await sleep(0)
-            return self._latest_apps
-        else:
-            result: list[dict[str, Any]] = (
-                await gen_apps_list_from_url(session=self._session) or APPS
-            )
-            self._latest_apps = result
-            self._latest_apps_last_updated = datetime.now()
-            return self._latest_apps
+        """Asynchronously get apps list from the catalog shared by all devices."""
+        from pyvizio.catalog import get_app_catalog
+
+        return await get_app_catalog().async_get_apps(session=self._get_session())
 
     @staticmethod
     def discovery_zeroconf(timeout: int = DEFAULT_TIMEOUT) -> list[ZeroconfDevice]:
         """Discover Vizio devices on network using zeroconf."""
-        results = discover_zc("_viziocast._tcp.local.", timeout=timeout)
+        from pyvizio.discovery.zeroconf import (
+            VIZIO_SERVICE_TYPE,
+            discover as discover_zc,
+        )
+
+        results = discover_zc(VIZIO_SERVICE_TYPE, timeout=timeout)
         _LOGGER.info(results)
         return results
 
     @staticmethod
-    def discovery_ssdp(timeout: int = DEFAULT_TIMEOUT) -> list[SSDPDevice]:
-        """Discover Vizio devices on network using SSDP."""
-        results = []
-
-        devices = discover_ssdp(
-            "urn:dial-multiscreen-org:device:dial:1", timeout=timeout
-        )
+    def async_discovery_zeroconf(
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[ZeroconfDevice]:
+        """Yield Vizio devices on network found using zeroconf as soon as they are resolved."""
+        from pyvizio.discovery.zeroconf import VIZIO_SERVICE_TYPE, async_discover
 
-        for dev in devices:
-            data = xmltodict.parse(
-                requests.get(dev.location, verify=False, timeout=timeout).text
-            )
+        return async_discover(VIZIO_SERVICE_TYPE, timeout=timeout)
 
-            if "root" not in data or "device" not in data["root"]:
-                continue
+    @staticmethod
+    def async_discovery_ssdp(
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> AsyncIterator[SSDPDevice]:
+        """Yield Vizio devices on network found using SSDP as soon as they are confirmed."""
+        from pyvizio.discovery.ssdp import SSDP_DIAL_SERVICE, async_discover
 
-            root = data["root"]["device"]
-            manufacturer = root["manufacturer"]
+        return async_discover(SSDP_DIAL_SERVICE, timeout=timeout)
 
-            if manufacturer is None or "VIZIO" != manufacturer:
-                continue
+    @staticmethod
+    async def discovery_ssdp(timeout: float = DEFAULT_TIMEOUT) -> list[SSDPDevice]:
+        """Asynchronously discover Vizio devices on network using SSDP."""
+        results = [device async for device in VizioAsync.async_discovery_ssdp(timeout)]
+        _LOGGER.info(results)
+        return results
 
-            split_url = urlsplit(dev.location)
-            device = SSDPDevice(
-                split_url.hostname, root["friendlyName"], root["modelName"], root["UDN"]
-            )
+    @staticmethod
+    async def discovery(timeout: float = DEFAULT_TIMEOUT) -> list[DiscoveredDevice]:
+        """Asynchronously discover Vizio devices on network using zeroconf and SSDP in parallel."""
+        from pyvizio.discovery.service import async_discover as async_discover_all
 
-            results.append(device)
+        results = await async_discover_all(timeout)
         _LOGGER.info(results)
         return results
 
@@ -758,41 +780,37 @@ class VizioAsync:
         session: ClientSession | None = None,
     ) -> list[str]:
         """Get list of known apps by name optionally filtered by supported country."""
-        # Assumes "*" means all countries are supported
         if not apps_list:
-            fetched: list[dict[str, Any]] = (
-                await gen_apps_list_from_url(session=session) or APPS
-            )
-            apps_list = fetched
-
-        home_name = str(APP_HOME["name"])
-        if country.lower() != "all":
-            return [
-                home_name,
-                *sorted(
-                    [
-                        str(app["name"])
-                        for app in apps_list
-                        if "*" in app["country"] or country.lower() in app["country"]
-                    ]
-                ),
-            ]
+            from pyvizio.catalog import get_app_catalog
 
-        return [home_name, *sorted([str(app["name"]) for app in apps_list])]
+            apps_list = await get_app_catalog().async_get_apps(session=session)
+
+        return [
+            str(APP_HOME["name"]),
+            *get_app_index(apps_list).app_names(country),
+        ]
 
     async def launch_app(
         self,
         app_name: str,
         apps_list: list[dict[str, Any]] | None = None,
         log_api_exception: bool = True,
+        fuzzy: bool = False,
     ) -> bool | None:
-        """Asynchronously launch known app by name."""
+        """Asynchronously launch known app by name (closest matching name if `fuzzy` is set)."""
         if not apps_list:
             apps_list = await self.__get_cached_apps_list()
 
+        try:
+            cmd = LaunchAppNameCommand(
+                self.device_type, app_name, apps_list, fuzzy=fuzzy
+            )
+        except VizioInvalidParameterError as err:
+            _LOGGER.error("%s", err)
+            return False
+
         return await self.__invoke_api_may_need_auth(
-            LaunchAppNameCommand(self.device_type, app_name, apps_list),
-            log_api_exception=log_api_exception,
+            cmd, log_api_exception=log_api_exception
         )
 
     async def launch_app_config(
@@ -832,12 +850,53 @@ class VizioAsync:
         )
 
 
+def device_type_from_device_info(device_info: dict[str, Any] | None) -> str | None:
+    """Return TV if unauthenticated device info has a TV model name path, else None."""
+    if not device_info:
+        return None
+    if EXTRACT_MODEL[DEVICE_CLASS_TV](device_info):
+        return DEVICE_CLASS_TV
+    return None
+
+
+async def _async_probe_speaker_settings(
+    host: str, timeout: float, session: ClientSession
+) -> bool | None:
+    """Return whether or not audio settings can be read without auth (None if unreachable)."""
+    url = f"https://{host}{ENDPOINT[DEVICE_CLASS_SPEAKER]['SETTINGS']}/audio/volume"
+    try:
+        async with session.get(
+            url, ssl=False, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            await async_validate_response(response)
+    except (ClientError, asyncio.TimeoutError):
+        return None
+    except VizioError:
+        return False
+    return True
+
+
+async def _async_find_open_port(ip: str) -> int | None:
+    """Return first port in DEFAULT_PORTS that is open on ip (None if none are)."""
+    is_open = await asyncio.gather(*(open_port(ip, port) for port in DEFAULT_PORTS))
+    return next((port for port, open_ in zip(DEFAULT_PORTS, is_open) if open_), None)
+
+
 async def async_guess_device_type(
-    ip: str, port: str | None = None, timeout: int = DEFAULT_TIMEOUT
+    ip: str,
+    port: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: ClientSession | None = None,
+    device_info: dict[str, Any] | None = None,
 ) -> str:
     """
-    Attempt to guess the device type by getting power state with no auth
-    token.
+    Attempt to guess the device type.
+
+    Devices on the TV only port, or whose `device_info` (the unauthenticated
+    device info response, if already fetched) has a TV model name, are TVs.
+    Otherwise a single audio setting is read with no auth token: speakers
+    allow it and TVs refuse it. Returns DEVICE_TYPE_UNKNOWN if the device
+    can't be reached.
 
     NOTE:
     The `ip` and `port` values passed in have to be valid for the device in
@@ -851,30 +910,104 @@ async def async_guess_device_type(
             raise VizioInvalidParameterError(
                 "Port can't be included in both `ip` and `port` parameters"
             )
-
-        device = VizioAsync(
-            "test", f"{ip}:{port}", "test", "", DEVICE_CLASS_SPEAKER, timeout=timeout
-        )
+        host = f"{ip}:{port}"
     else:
-        if ":" not in ip:
+        host = ip
+
+    device_type = device_type_from_device_info(device_info)
+    if device_type:
+        return device_type
+
+    if ":" not in host:
+        open_device_port = await _async_find_open_port(host)
+        if open_device_port is None:
             _LOGGER.warning(
                 "May not return correct device type since a port was not specified."
             )
-        device = VizioAsync(
-            "test", ip, "test", "", DEVICE_CLASS_SPEAKER, timeout=timeout
+        else:
+            host = f"{host}:{open_device_port}"
+
+    if host.rpartition(":")[2] == str(TV_ONLY_PORT):
+        return DEVICE_CLASS_TV
+
+    if session is None or session.closed:
+        async with ClientSession() as local_session:
+            can_read = await _async_probe_speaker_settings(host, timeout, local_session)
+    else:
+        can_read = await _async_probe_speaker_settings(host, timeout, session)
+
+    if can_read is None:
+        return DEVICE_TYPE_UNKNOWN
+    return DEVICE_CLASS_SPEAKER if can_read else DEVICE_CLASS_TV
+
+
+# Device types guessed by async_guess_device_types keyed by device ID (or address)
+_guessed_device_types: dict[str, str] = {}
+
+
+async def async_guess_device_types(
+    devices: Iterable[Any],
+    timeout: int = DEFAULT_TIMEOUT,
+    session: ClientSession | None = None,
+) -> list[str]:
+    """
+    Concurrently guess the device type of each discovered device.
+
+    `devices` are objects with `ip` and `port` (and optionally `id`) attributes,
+    such as the results of `VizioAsync.discovery`. Types are returned in the
+    same order. Guesses are remembered per device ID for the rest of the
+    process, so devices seen by a previous call aren't probed again.
+    """
+    devices = list(devices)
+    keys = [getattr(dev, "id", None) or f"{dev.ip}:{dev.port or ''}" for dev in devices]
+
+    to_guess = {
+        key: dev for key, dev in zip(keys, devices) if key not in _guessed_device_types
+    }
+    if not to_guess:
+        return [_guessed_device_types.get(key, DEVICE_TYPE_UNKNOWN) for key in keys]
+
+    async def async_guess(active_session: ClientSession) -> None:
+        results = await asyncio.gather(
+            *(
+                async_guess_device_type(
+                    dev.ip,
+                    str(dev.port) if dev.port else None,
+                    timeout=timeout,
+                    session=active_session,
+                )
+                for dev in to_guess.values()
+            )
+        )
+        # Unreachable devices are tried again next time
+        _guessed_device_types.update(
+            (key, device_type)
+            for key, device_type in zip(to_guess, results)
+            if device_type != DEVICE_TYPE_UNKNOWN
         )
 
-    if await device.can_connect_with_auth_check():
-        return DEVICE_CLASS_SPEAKER
+    if session is None or session.closed:
+        async with ClientSession() as local_session:
+            await async_guess(local_session)
     else:
-        return DEVICE_CLASS_TV
+        await async_guess(session)
+
+    return [_guessed_device_types.get(key, DEVICE_TYPE_UNKNOWN) for key in keys]
+
+
+def clear_guessed_device_types() -> None:
+    """Forget device types remembered by async_guess_device_types."""
+    _guessed_device_types.clear()
 
 
 class Vizio(VizioAsync):
     """Synchronous class to interact with Vizio SmartCast devices.
 
     All async methods from VizioAsync are automatically available as synchronous
-    methods via auto-wrapping with asyncio.run().
+    methods. They run on one event loop thread shared by every instance in the
+    process (see `pyvizio.sync.SyncRunner`), so instances are safe to call from
+    any thread. Calls share a connection pool, and requests to the same device
+    share one `max_concurrent_requests` limit across instances.
     """
 
     def __init__(
@@ -899,15 +1032,36 @@ class Vizio(VizioAsync):
             max_concurrent_requests=max_concurrent_requests,
         )
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return semaphore shared by every instance talking to the same device."""
+        return get_sync_runner().get_semaphore(
+            self.ip.partition(":")[0], self._max_concurrent_requests
+        )
+
+    def _get_session(self) -> ClientSession:
+        """Return session shared by every instance."""
+        return get_sync_runner().get_session()
+
+    @staticmethod
+    @run_on_sync_runner
+    async def discovery(  # type: ignore[override]
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> list[DiscoveredDevice]:
+        """Discover Vizio devices on network using zeroconf and SSDP in parallel."""
+        return await VizioAsync.discovery(timeout)
+
     @staticmethod
     def discovery_zeroconf(timeout: int = DEFAULT_TIMEOUT) -> list[ZeroconfDevice]:
         """Discover Vizio devices on network using zeroconf."""
         return super(Vizio, Vizio).discovery_zeroconf(timeout)
 
     @staticmethod
-    def discovery_ssdp(timeout: int = DEFAULT_TIMEOUT) -> list[SSDPDevice]:
+    @run_on_sync_runner
+    async def discovery_ssdp(  # type: ignore[override]
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> list[SSDPDevice]:
         """Discover Vizio devices on network using SSDP."""
-        return super(Vizio, Vizio).discovery_ssdp(timeout)
+        return await VizioAsync.discovery_ssdp(timeout)
 
     @staticmethod
     @async_to_sync
@@ -932,17 +1086,101 @@ class Vizio(VizioAsync):
         return await super(Vizio, Vizio).get_unique_id(ip, device_type, timeout=timeout)
 
     @staticmethod
-    @async_to_sync
-    async def get_apps_list(
+    @run_on_sync_runner
+    async def get_apps_list(  # type: ignore[override]
         country: str = "all",
         apps_list: list[dict[str, Any]] | None = None,
         session: ClientSession | None = None,
     ) -> list[str]:
         """Get list of known apps by name optionally filtered by supported country."""
-        return await super(Vizio, Vizio).get_apps_list(
+        return await VizioAsync.get_apps_list(
             country=country, apps_list=apps_list, session=session
         )
 
+    def batch(self) -> VizioBatch:
+        """Return batch recording method calls to run concurrently (see VizioBatch)."""
+        return VizioBatch(self)
+
+    def gather(self, *calls: str | tuple[Any, ...]) -> list[Any]:
+        """Run method calls concurrently and return their results in order.
+
+        Each call is a method name or a tuple of method name and positional
+        arguments, e.g. `vizio.gather("get_power_state", ("get_setting",
+        "audio", "volume"))`. Use `batch` to pass keyword arguments.
+        """
+        batch = self.batch()
+        for call in calls:
+            name, *args = (call,) if isinstance(call, str) else call
+            getattr(batch, name)(*args)
+        return batch.run()
+
+
+class VizioBatch:
+    """Vizio method calls recorded to run concurrently on the shared loop.
+
+    Calling a method on the batch records it and returns its index in the
+    results instead of its result. `run` (or leaving the batch's `with` block)
+    runs every recorded call at once over the shared session and returns the
+    results in the order they were recorded. Requests are still limited by the
+    device's `max_concurrent_requests`.
+    """
+
+    def __init__(self, vizio: Vizio) -> None:
+        """Initialize empty batch of calls to `vizio`."""
+        self._vizio = vizio
+        self._calls: list[tuple[Any, tuple[Any, ...], dict[str, Any]]] = []
+        self.results: list[Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(calls={len(self._calls)})"
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __getattr__(self, name: str) -> Any:
+        method = vars(VizioAsync).get(name)
+        if name.startswith("_") or not asyncio.iscoroutinefunction(method):
+            raise AttributeError(f"{name!r} is not a Vizio method that can be batched")
+
+        def record(*args: Any, **kwargs: Any) -> int:
+            self._calls.append((method, args, kwargs))
+            return len(self._calls) - 1
+
+        record.__name__ = name
+        return record
+
+    def __enter__(self) -> VizioBatch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.run()
+
+    def run(self) -> list[Any]:
+        """Run recorded calls concurrently and return their results in order.
+
+        Every call runs to completion. If any raised, the first exception (in
+        recorded order) is raised afterwards.
+        """
+        calls, self._calls = self._calls, []
+
+        async def async_run() -> list[Any]:
+            return await asyncio.gather(
+                *(
+                    method(self._vizio, *args, **kwargs)
+                    for method, args, kwargs in calls
+                ),
+                return_exceptions=True,
+            )
+
+        results = get_sync_runner().run(async_run())
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        self.results = results
+        return results
+
 
 # Auto-wrap all public async instance methods from VizioAsync onto Vizio
 def _generate_sync_wrappers() -> None:
@@ -954,7 +1192,7 @@ def _generate_sync_wrappers() -> None:
             continue
         attr = getattr(VizioAsync, name)
         if asyncio.iscoroutinefunction(attr) and name not in vizio_vars:
-            wrapper = async_to_sync(attr)
+            wrapper = run_on_sync_runner(attr)
             wrapper.__qualname__ = f"Vizio.{name}"
             doc = (wrapper.__doc__ or "").removeprefix("Asynchronously ")
             if doc:
@@ -978,6 +1216,12 @@ if TYPE_CHECKING:
         @staticmethod
         def get_unique_id(ip: str, device_type: str, timeout: int = DEFAULT_TIMEOUT) -> str | None: ...  # type: ignore[override]
         @staticmethod
+        def discovery(timeout: float = DEFAULT_TIMEOUT) -> list[DiscoveredDevice]: ...  # type: ignore[override]
+        @staticmethod
+        def discovery_ssdp(timeout: float = DEFAULT_TIMEOUT) -> list[SSDPDevice]: ...  # type: ignore[override]
+        def batch(self) -> VizioBatch: ...
+        def gather(self, *calls: str | tuple[Any, ...]) -> list[Any]: ...
+        @staticmethod
         def get_apps_list(country: str = "all", apps_list: list[dict[str, Any]] | None = None, session: ClientSession | None = None) -> list[str]: ...  # type: ignore[override]
         def can_connect_no_auth_check(self) -> bool: ...  # type: ignore[override]
         def can_connect_with_auth_check(self) -> bool: ...  # type: ignore[override]
@@ -1008,7 +1252,7 @@ if TYPE_CHECKING:
         def get_setting_types_list(self, log_api_exception: bool = True) -> list[str] | None: ...  # type: ignore[override]
         def get_version(self, log_api_exception: bool = True) -> str | None: ...  # type: ignore[override]
         def is_muted(self, log_api_exception: bool = True) -> bool | None: ...  # type: ignore[override]
-        def launch_app(self, app_name: str, apps_list: list[dict[str, Any]] | None = None, log_api_exception: bool = True) -> bool | None: ...  # type: ignore[override]
+        def launch_app(self, app_name: str, apps_list: list[dict[str, Any]] | None = None, log_api_exception: bool = True, fuzzy: bool = False) -> bool | None: ...  # type: ignore[override]
         def launch_app_config(self, APP_ID: str, NAME_SPACE: int, MESSAGE: str | None = None, log_api_exception: bool = True) -> bool | None: ...  # type: ignore[override]
         def mute_off(self, log_api_exception: bool = True) -> bool | None: ...  # type: ignore[override]
         def mute_on(self, log_api_exception: bool = True) -> bool | None: ...  # type: ignore[override]
@@ -1036,8 +1280,7 @@ async def guess_device_type(
     ip: str, port: str | None = None, timeout: int = DEFAULT_TIMEOUT
 ) -> str:
     """
-    Attempt to guess the device type by getting power state with no auth
-    token.
+    Attempt to guess the device type (see `async_guess_device_type`).
 
     NOTE:
     The `ip` and `port` values passed in have to be valid for the device in
@@ -16,7 +16,7 @@ from pyvizio.errors import (
     VizioInvalidParameterError,
     VizioResponseError,
 )
-from pyvizio.helpers import dict_get_case_insensitive
+from pyvizio.helpers import compile_extractor
 
 _LOGGER = getLogger(__name__)
 
@@ -86,6 +86,35 @@ class ResponseKey:
     CENTER = "center"
 
 
+# Accessors for known response shapes, compiled once at import
+extract_item = compile_extractor([[ResponseKey.ITEM]])
+extract_items = compile_extractor([[ResponseKey.ITEMS]])
+extract_first_item = compile_extractor([[ResponseKey.ITEMS, 0]])
+extract_item_value = compile_extractor([[ResponseKey.ITEM, ResponseKey.VALUE]])
+extract_value = compile_extractor([[ResponseKey.VALUE]])
+extract_cname = compile_extractor([[ResponseKey.CNAME]])
+extract_name = compile_extractor([[ResponseKey.NAME]])
+extract_metadata = compile_extractor([[ResponseKey.METADATA]])
+extract_challenge_type = compile_extractor(
+    [[ResponseKey.ITEM, PairingResponseKey.CHALLENGE_TYPE]]
+)
+extract_pairing_req_token = compile_extractor(
+    [[ResponseKey.ITEM, PairingResponseKey.PAIRING_REQ_TOKEN]]
+)
+extract_auth_token = compile_extractor(
+    [[ResponseKey.ITEM, PairingResponseKey.AUTH_TOKEN]]
+)
+extract_status = compile_extractor([["status"]])
+extract_status_result = compile_extractor([["result"]])
+extract_status_detail = compile_extractor([["detail"]])
+
+# Model name from the device info item returned by GetDeviceInfoCommand
+EXTRACT_MODEL = {
+    device_type: compile_extractor([[ResponseKey.VALUE, *path] for path in paths])
+    for device_type, paths in PATH_MODEL.items()
+}
+
+
 async def async_validate_response(web_response: ClientResponse) -> dict[str, Any]:
     """Validate response to API command is as expected and return response."""
     if HTTP_OK != web_response.status:
@@ -101,20 +130,18 @@ async def async_validate_response(web_response: ClientResponse) -> dict[str, Any
             f"Failed to parse response: {web_response.content}"
         ) from err
 
-    status_obj = dict_get_case_insensitive(data, "status")
+    status_obj = extract_status(data)
 
     if not status_obj:
         raise VizioResponseError("Unknown response")
 
-    result_status = dict_get_case_insensitive(status_obj, "result")
+    result_status = extract_status_result(status_obj)
 
     if result_status and result_status.lower() == STATUS_INVALID_PARAMETER:
         raise VizioInvalidParameterError("invalid value specified")
     elif not result_status or result_status.lower() != STATUS_SUCCESS:
         raise VizioResponseError(
-            "unexpected status {}: {}".format(
-                result_status, dict_get_case_insensitive(status_obj, "detail")
-            )
+            f"unexpected status {result_status}: {extract_status_detail(status_obj)}"
         )
 
     return data
@@ -151,7 +178,7 @@ async def async_invoke_api(
     ip: str,
     command: CommandBase,
     logger: Logger,
-    custom_timeout: int = None,
+    custom_timeout: float | None = None,
     headers: dict[str, Any] = None,
     log_api_exception: bool = True,
     session: ClientSession = None,
@@ -193,7 +220,7 @@ async def async_invoke_api_auth(
     command: CommandBase,
     logger: Logger,
     auth_token: str = None,
-    custom_timeout: int = None,
+    custom_timeout: float | None = None,
     log_api_exception: bool = True,
     session: ClientSession = None,
 ) -> Any:
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import difflib
+import re
 from typing import Any
 
-from pyvizio.api._protocol import ENDPOINT, ResponseKey
+from pyvizio.api._protocol import ENDPOINT, extract_item_value
 from pyvizio.api.base import CommandBase
 from pyvizio.api.input import ItemInfoCommandBase
 from pyvizio.const import (
@@ -14,12 +16,26 @@ from pyvizio.const import (
     NO_APP_RUNNING,
     UNKNOWN_APP,
 )
-from pyvizio.helpers import dict_get_case_insensitive
+from pyvizio.errors import VizioInvalidParameterError
+from pyvizio.helpers import slots_to_dict
+
+ALL_COUNTRIES = "all"
+ALL_COUNTRIES_WILDCARD = "*"
+
+# Minimum difflib similarity ratio for an app name to count as a close match
+FUZZY_MATCH_CUTOFF = 0.6
+
+
+def _normalize_app_name(app_name: str) -> str:
+    """Lowercase app name and drop everything but letters and digits."""
+    return re.sub(r"[^0-9a-z]", "", app_name.lower())
 
 
 class AppConfig:
     """Vizio SmartCast app config."""
 
+    __slots__ = ("APP_ID", "NAME_SPACE", "MESSAGE")
+
     def __init__(
         self,
         APP_ID: str | None = None,
@@ -31,15 +47,207 @@ class AppConfig:
         self.MESSAGE = MESSAGE
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
 
     def __bool__(self) -> bool:
         return self != AppConfig()
 
 
+class AppIndex:
+    """Lookup tables prebuilt over a list of apps."""
+
+    __slots__ = (
+        "_by_config",
+        "_by_equivalent_config",
+        "_by_name",
+        "_by_normalized_name",
+        "_names_by_country",
+        "_size",
+        "apps",
+    )
+
+    def __init__(
+        self, apps_list: list[dict[str, Any]], include_home: bool = False
+    ) -> None:
+        """Index `apps_list` (preceded by APP_HOME if `include_home` is set)."""
+        self.apps = apps_list
+        self._size = len(apps_list)
+        self._by_config: dict[tuple[str, int], str] = {}
+        self._by_equivalent_config: dict[str, str] = {}
+        self._by_name: dict[str, dict[str, Any]] = {}
+        self._by_normalized_name: dict[str, dict[str, Any]] = {}
+        self._names_by_country: dict[str, tuple[str, ...]] | None = None
+
+        for app_def in [APP_HOME, *apps_list] if include_home else apps_list:
+            self._by_name.setdefault(app_def["name"].lower(), app_def)
+            self._by_normalized_name.setdefault(
+                _normalize_app_name(app_def["name"]), app_def
+            )
+
+            configs = app_def["config"]
+            if isinstance(configs, dict):
+                configs = [configs]
+            elif not isinstance(configs, list):
+                continue
+
+            # First definition wins, matching a linear scan of the list
+            for config in configs:
+                self._by_config.setdefault(
+                    (config["APP_ID"], config["NAME_SPACE"]), app_def["name"]
+                )
+                if config["NAME_SPACE"] in EQUIVALENT_NAME_SPACES:
+                    self._by_equivalent_config.setdefault(
+                        config["APP_ID"], app_def["name"]
+                    )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(apps={self._size})"
+
+    def is_current(self, apps_list: list[dict[str, Any]]) -> bool:
+        """Return whether or not index was built from `apps_list` as it is now."""
+        return self.apps is apps_list and self._size == len(apps_list)
+
+    def get_app(self, app_name: str, fuzzy: bool = False) -> dict[str, Any] | None:
+        """Return app definition by case insensitive name.
+
+        With `fuzzy` set, fall back to the best of `suggest_app_names` when there
+        is no exact match.
+        """
+        app_def = self._by_name.get(app_name.lower())
+        if app_def is not None or not fuzzy:
+            return app_def
+
+        suggestions = self.suggest_app_names(app_name, limit=1)
+        if suggestions:
+            return self._by_name[suggestions[0].lower()]
+
+        return None
+
+    def suggest_app_names(self, app_name: str, limit: int = 3) -> list[str]:
+        """Return up to `limit` names of apps similar to `app_name`, best first.
+
+        Names are compared ignoring case, spaces and punctuation. Names that start
+        with `app_name` come first (shortest first), followed by close matches by
+        edit similarity.
+        """
+        key = _normalize_app_name(app_name)
+        if not key:
+            return []
+
+        matches: list[str] = []
+        if key in self._by_normalized_name:
+            matches.append(key)
+        matches.extend(
+            sorted(
+                (
+                    name
+                    for name in self._by_normalized_name
+                    if name.startswith(key) and name != key
+                ),
+                key=len,
+            )
+        )
+        matches.extend(
+            name
+            for name in difflib.get_close_matches(
+                key, self._by_normalized_name, n=limit, cutoff=FUZZY_MATCH_CUTOFF
+            )
+            if name not in matches
+        )
+
+        return [self._by_normalized_name[name]["name"] for name in matches[:limit]]
+
+    def app_names(self, country: str = ALL_COUNTRIES) -> tuple[str, ...]:
+        """Return sorted names of apps supported in `country` ("*" apps are supported everywhere)."""
+        if self._names_by_country is None:
+            self._names_by_country = self._build_names_by_country()
+
+        country = country.lower()
+        if country in self._names_by_country:
+            return self._names_by_country[country]
+        return self._names_by_country[ALL_COUNTRIES_WILDCARD]
+
+    def _build_names_by_country(self) -> dict[str, tuple[str, ...]]:
+        """Partition sorted app names by every country code in the apps list."""
+        apps = sorted(
+            (
+                (str(app_def["name"]), frozenset(app_def.get("country", ())))
+                for app_def in self.apps
+            ),
+            key=lambda app: app[0],
+        )
+        codes = set().union(*(countries for _, countries in apps))
+        codes.discard(ALL_COUNTRIES_WILDCARD)
+
+        names_by_country: dict[str, list[str]] = {
+            code: [] for code in (ALL_COUNTRIES_WILDCARD, *codes)
+        }
+        for name, countries in apps:
+            # Apps supported everywhere belong to every partition
+            codes_for_app = (
+                names_by_country.keys()
+                if ALL_COUNTRIES_WILDCARD in countries
+                else countries
+            )
+            for code in codes_for_app:
+                names_by_country[code].append(name)
+
+        return {
+            ALL_COUNTRIES: tuple(name for name, _ in apps),
+            **{code: tuple(names) for code, names in names_by_country.items()},
+        }
+
+    def find_app_name(self, config_to_check: AppConfig | None) -> str:
+        """Return the app name for a given AppConfig (see `find_app_name`)."""
+        if not config_to_check:
+            return NO_APP_RUNNING
+
+        # Attempt to find an exact match from known apps list
+        name = self._by_config.get(
+            (config_to_check.APP_ID, config_to_check.NAME_SPACE)  # type: ignore[arg-type]
+        )
+        if name is not None:
+            return name
+
+        # If exact match couldn't be find, swap in equivalent name spaces
+        # and attempt to find a match
+        if config_to_check.NAME_SPACE in EQUIVALENT_NAME_SPACES:
+            name = self._by_equivalent_config.get(config_to_check.APP_ID)  # type: ignore[arg-type]
+            if name is not None:
+                return name
+
+        # So far only the SmartCast home screen appears to use the NAME_SPACE of 0
+        if config_to_check.NAME_SPACE == 0:
+            return APP_CAST
+
+        # If no match, app is unknown
+        return UNKNOWN_APP
+
+
+# Indexes of recently used apps lists keyed by (list identity, include_home).
+# Each index holds a reference to its list so the identity can't be reused.
+_APP_INDEX_CACHE_SIZE = 8
+_app_indexes: dict[tuple[int, bool], AppIndex] = {}
+
+
+def get_app_index(
+    apps_list: list[dict[str, Any]], include_home: bool = False
+) -> AppIndex:
+    """Return index for apps list, reusing the one built the last time it was seen."""
+    key = (id(apps_list), include_home)
+    index = _app_indexes.get(key)
+    if index is None or not index.is_current(apps_list):
+        index = AppIndex(apps_list, include_home=include_home)
+        _app_indexes.pop(key, None)
+        _app_indexes[key] = index
+        while len(_app_indexes) > _APP_INDEX_CACHE_SIZE:
+            del _app_indexes[next(iter(_app_indexes))]
+    return index
+
+
 def find_app_name(
     config_to_check: AppConfig | None, app_list: list[dict[str, Any]]
 ) -> str:
@@ -48,49 +256,7 @@ def find_app_name(
 
     Returns UNKNOWN_APP if app name can't be found in APPS list for given AppConfig.
     """
-    if not config_to_check:
-        return NO_APP_RUNNING
-
-    # Attempt to find an exact match from known apps list
-    for app_def in app_list:
-        if isinstance(app_def["config"], list):
-            for config in app_def["config"]:
-                if (
-                    config["APP_ID"] == config_to_check.APP_ID
-                    and config["NAME_SPACE"] == config_to_check.NAME_SPACE
-                ):
-                    return app_def["name"]
-        elif (
-            isinstance(app_def["config"], dict)
-            and app_def["config"]["APP_ID"] == config_to_check.APP_ID
-            and app_def["config"]["NAME_SPACE"] == config_to_check.NAME_SPACE
-        ):
-            return app_def["name"]
-
-    # If exact match couldn't be find, swap in equivalent name spaces
-    # and attempt to find a match
-    if config_to_check.NAME_SPACE in EQUIVALENT_NAME_SPACES:
-        for app_def in app_list:
-            if isinstance(app_def["config"], list):
-                for config in app_def["config"]:
-                    if (
-                        config["APP_ID"] == config_to_check.APP_ID
-                        and config["NAME_SPACE"] in EQUIVALENT_NAME_SPACES
-                    ):
-                        return app_def["name"]
-            elif (
-                isinstance(app_def["config"], dict)
-                and app_def["config"]["APP_ID"] == config_to_check.APP_ID
-                and app_def["config"]["NAME_SPACE"] in EQUIVALENT_NAME_SPACES
-            ):
-                return app_def["name"]
-
-    # So far only the SmartCast home screen appears to use the NAME_SPACE of 0
-    if config_to_check.NAME_SPACE == 0:
-        return APP_CAST
-
-    # If no match, app is unknown
-    return UNKNOWN_APP
+    return get_app_index(app_list).find_app_name(config_to_check)
 
 
 class LaunchAppConfigCommand(CommandBase):
@@ -117,16 +283,25 @@ class LaunchAppNameCommand(LaunchAppConfigCommand):
         device_type: str,
         app_name: str,
         apps_list: list[dict[str, Any]],
+        fuzzy: bool = False,
     ) -> None:
-        """Initialize command to launch app by name."""
-        app_def: dict[str, Any] = next(
-            (
-                app_def
-                for app_def in [APP_HOME, *apps_list]
-                if app_def["name"].lower() == app_name.lower()
-            ),
-            {},
-        )
+        """Initialize command to launch app by name.
+
+        Raises VizioInvalidParameterError, naming similar apps, if there is no app
+        called `app_name` (or, with `fuzzy` set, nothing similar to it).
+        """
+        index = get_app_index(apps_list, include_home=True)
+        app_def = index.get_app(app_name, fuzzy=fuzzy)
+        if app_def is None:
+            suggestions = index.suggest_app_names(app_name)
+            raise VizioInvalidParameterError(
+                f"Unknown app '{app_name}'"
+                + (
+                    f", did you mean: {', '.join(repr(s) for s in suggestions)}"
+                    if suggestions
+                    else ""
+                )
+            )
 
         # Unpack config dict into expected key/value argument pairs
         config_list: list[dict[str, Any]] = app_def.get("config", [{}])
@@ -142,8 +317,7 @@ class GetCurrentAppConfigCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> AppConfig:
         """Return response to command to get currently running app's config."""
-        item = dict_get_case_insensitive(json_obj, ResponseKey.ITEM, {})
-        current_app_id = dict_get_case_insensitive(item, ResponseKey.VALUE)
+        current_app_id = extract_item_value(json_obj)
 
         if current_app_id:
             return AppConfig(**current_app_id)
@@ -173,7 +347,9 @@ class GetCurrentAppNameCommand(GetCurrentAppConfigCommand):
         current_app_config = super().process_response(json_obj)
 
         if current_app_config:
-            return find_app_name(current_app_config, [APP_HOME, *self.apps_list])
+            return get_app_index(self.apps_list, include_home=True).find_app_name(
+                current_app_config
+            )
 
         # Return NO_APP_RUNNING if value from response was None
         return NO_APP_RUNNING
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from pyvizio.helpers import slots_to_dict
+
 
 class CommandBase:
     """Base command to send data to Vizio device."""
@@ -24,11 +26,12 @@ class CommandBase:
         def _serialize(obj: Any) -> Any:
             if isinstance(obj, list):
                 return [_serialize(item) for item in obj]
-            if hasattr(obj, "__dict__") and not isinstance(obj, type):
+            if isinstance(obj, type):
+                return obj
+            if hasattr(obj, "__slots__") or hasattr(obj, "__dict__"):
+                attrs = slots_to_dict(obj) if hasattr(obj, "__slots__") else vars(obj)
                 return {
-                    k: _serialize(v)
-                    for k, v in obj.__dict__.items()
-                    if not k.startswith("_")
+                    k: _serialize(v) for k, v in attrs.items() if not k.startswith("_")
                 }
             return obj
 
@@ -4,26 +4,33 @@ from __future__ import annotations
 
 from typing import Any
 
-from pyvizio.api._protocol import ResponseKey
+from pyvizio.api._protocol import (
+    extract_cname,
+    extract_items,
+    extract_metadata,
+    extract_name,
+    extract_value,
+)
 from pyvizio.api.item import Item, ItemCommandBase, ItemInfoCommandBase
-from pyvizio.helpers import dict_get_case_insensitive
 
 
 class InputItem(Item):
     """Input device."""
 
+    __slots__ = ("meta_data", "meta_name")
+
     def __init__(self, json_item: dict[str, Any], is_extended_metadata: bool) -> None:
         """Initialize input device."""
         super().__init__(json_item)
         self.meta_name = None
         self.meta_data = None
 
-        meta = dict_get_case_insensitive(json_item, ResponseKey.VALUE)
+        meta = extract_value(json_item)
 
         if meta:
             if is_extended_metadata:
-                self.meta_name = dict_get_case_insensitive(meta, ResponseKey.NAME)
-                self.meta_data = dict_get_case_insensitive(meta, ResponseKey.METADATA)
+                self.meta_name = extract_name(meta)
+                self.meta_data = extract_metadata(meta)
             else:
                 self.meta_name = meta
 
@@ -40,13 +47,13 @@ class GetInputsListCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> list[InputItem] | None:
         """Return response to command to get list of available inputs."""
-        items = dict_get_case_insensitive(json_obj, ResponseKey.ITEMS)
+        items = extract_items(json_obj)
 
         if items:
             return [
                 InputItem(itm, True)
                 for itm in items
-                if dict_get_case_insensitive(itm, ResponseKey.CNAME) != "current_input"
+                if extract_cname(itm) != "current_input"
             ]
 
         return None
@@ -61,7 +68,7 @@ class GetCurrentInputCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> InputItem | None:
         """Return response to command to get currently active input."""
-        items = dict_get_case_insensitive(json_obj, ResponseKey.ITEMS)
+        items = extract_items(json_obj)
 
         v_input = None
 
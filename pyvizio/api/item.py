@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
 from pyvizio.api._protocol import (
     ACTION_MODIFY,
     ENDPOINT,
+    EXTRACT_MODEL,
     ITEM_CNAME,
     PATH_MODEL,
     ResponseKey,
+    extract_first_item,
+    extract_items,
 )
 from pyvizio.api.base import CommandBase, InfoCommandBase
-from pyvizio.helpers import dict_get_case_insensitive, get_value_from_path
+from pyvizio.helpers import slots_to_dict
 
 
 class GetDeviceInfoCommand(InfoCommandBase):
@@ -22,10 +26,11 @@ class GetDeviceInfoCommand(InfoCommandBase):
         """Initialize command to get device info."""
         super().__init__(ENDPOINT[device_type]["DEVICE_INFO"])
         self.paths = PATH_MODEL[device_type]
+        self._device_type = device_type
 
     def process_response(self, json_obj: dict[str, Any]) -> dict[str, Any]:
         """Return response to command to get device info."""
-        return dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [{}])[0]
+        return extract_first_item(json_obj) or {}
 
 
 class GetModelNameCommand(GetDeviceInfoCommand):
@@ -37,50 +42,114 @@ class GetModelNameCommand(GetDeviceInfoCommand):
 
     def process_response(self, json_obj: dict[str, Any]) -> str | None:  # type: ignore[override]
         """Return response to command to get device model name."""
-        return get_value_from_path(
-            dict_get_case_insensitive(
-                super().process_response(json_obj),
-                ResponseKey.VALUE,
-                {},
-            ),
-            self.paths,
+        return EXTRACT_MODEL[self._device_type](extract_first_item(json_obj)) or None
+
+
+class ItemView:
+    """Undecoded item in a response whose fields are only looked up when read.
+
+    Commands filter views by `type` and `c_name` and only build an `Item` for
+    the few that match.
+    """
+
+    __slots__ = ("_fields", "json_obj")
+
+    def __init__(self, json_obj: dict[str, Any]) -> None:
+        """Initialize view of item in a response."""
+        self.json_obj = json_obj
+        self._fields: dict[str, Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.json_obj})"
+
+    def __eq__(self, other) -> bool:
+        return self is other or (
+            isinstance(other, ItemView) and self.json_obj == other.json_obj
         )
 
+    def get(self, key: str, default_return: Any = None) -> Any:
+        """Case insensitive lookup of a single field."""
+        # Devices send upper case keys, so only lower case the item if they don't
+        upper_key = key.upper()
+        if upper_key in self.json_obj:
+            return self.json_obj[upper_key]
+
+        if self._fields is None:
+            self._fields = {k.lower(): v for k, v in self.json_obj.items()}
+        return self._fields.get(key.lower(), default_return)
+
+    @property
+    def c_name(self) -> str | None:
+        """Return item's CNAME."""
+        return self.get(ResponseKey.CNAME)
+
+    @property
+    def type(self) -> str | None:
+        """Return item's TYPE."""
+        return self.get(ResponseKey.TYPE)
+
+    def is_type(self, *types: str) -> bool:
+        """Return whether or not item's TYPE is one of `types` (in lower case)."""
+        return (self.type or "").lower() in types
+
+    def is_named(self, *c_names: str) -> bool:
+        """Return whether or not item's CNAME is one of `c_names` (in lower case)."""
+        return (self.c_name or "").lower() in c_names
+
+
+def iter_item_views(json_obj: dict[str, Any]) -> Iterator[ItemView]:
+    """Return views of every item in a response to a command."""
+    return (ItemView(item) for item in extract_items(json_obj) or [])
+
 
 class Item:
     """Individual item setting."""
 
-    def __init__(self, json_obj: dict[str, Any]) -> None:
+    __slots__ = (
+        "id",
+        "c_name",
+        "type",
+        "name",
+        "value",
+        "min",
+        "max",
+        "center",
+        "choices",
+    )
+
+    def __init__(self, json_obj: dict[str, Any] | ItemView) -> None:
         """Initialize individual item setting."""
+        view = json_obj if isinstance(json_obj, ItemView) else ItemView(json_obj)
+
         self.id = None
-        id = dict_get_case_insensitive(json_obj, ResponseKey.HASHVAL)
+        id = view.get(ResponseKey.HASHVAL)
         if id is not None:
             self.id = int(id)
 
-        self.c_name = dict_get_case_insensitive(json_obj, ResponseKey.CNAME)
-        self.type = dict_get_case_insensitive(json_obj, ResponseKey.TYPE)
-        self.name = dict_get_case_insensitive(json_obj, ResponseKey.NAME)
-        self.value = dict_get_case_insensitive(json_obj, ResponseKey.VALUE)
+        self.c_name = view.c_name
+        self.type = view.type
+        self.name = view.get(ResponseKey.NAME)
+        self.value = view.get(ResponseKey.VALUE)
 
         self.min = None
-        min = dict_get_case_insensitive(json_obj, ResponseKey.MINIMUM)
+        min = view.get(ResponseKey.MINIMUM)
         if min is not None:
             self.min = int(min)
 
         self.max = None
-        max = dict_get_case_insensitive(json_obj, ResponseKey.MAXIMUM)
+        max = view.get(ResponseKey.MAXIMUM)
         if max is not None:
             self.max = int(max)
 
         self.center = None
-        center = dict_get_case_insensitive(json_obj, ResponseKey.CENTER)
+        center = view.get(ResponseKey.CENTER)
         if center is not None:
             self.center = int(center)
 
-        self.choices = dict_get_case_insensitive(json_obj, ResponseKey.ELEMENTS, [])
+        self.choices = view.get(ResponseKey.ELEMENTS, [])
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
         return self is other or (
@@ -94,15 +163,17 @@ class Item:
 class DefaultReturnItem:
     """Mock individual item setting response when item is not found."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any) -> None:
         """Initialize mock individual item setting response when item is not found."""
         self.value = value
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
 
 
 class ItemInfoCommandBase(InfoCommandBase):
@@ -118,16 +189,12 @@ class ItemInfoCommandBase(InfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> Any:
         """Return response to command to get individual item setting."""
-        items = [
-            Item(item)
-            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
-        ]
-
-        for itm in items:
-            if itm.c_name.lower() in (
-                ITEM_CNAME.get(self.item_name, ""),
-                self.item_name,
-            ) and (
+        c_names = (ITEM_CNAME.get(self.item_name, ""), self.item_name)
+        for view in iter_item_views(json_obj):
+            if not view.is_named(*c_names):
+                continue
+            itm = Item(view)
+            if (
                 itm.value is not None
                 or itm.center is not None
                 or itm.choices is not None
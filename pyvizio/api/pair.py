@@ -4,9 +4,16 @@ from __future__ import annotations
 
 from typing import Any
 
-from pyvizio.api._protocol import ENDPOINT, PairingResponseKey, ResponseKey
+from pyvizio.api._protocol import (
+    ENDPOINT,
+    extract_auth_token,
+    extract_challenge_type,
+    extract_item,
+    extract_pairing_req_token,
+)
 from pyvizio.api.base import CommandBase
-from pyvizio.helpers import dict_get_case_insensitive
+from pyvizio.errors import VizioResponseError
+from pyvizio.helpers import slots_to_dict
 
 
 class PairCommandBase(CommandBase):
@@ -17,20 +24,28 @@ class PairCommandBase(CommandBase):
         super().__init__(ENDPOINT[device_type][endpoint])
         self.DEVICE_ID: str = device_id
 
+    @staticmethod
+    def _validate_item(json_obj: dict[str, Any]) -> None:
+        """Raise VizioResponseError if pairing response has no item to read."""
+        if not isinstance(extract_item(json_obj), dict):
+            raise VizioResponseError(f"Pairing response has no item: {json_obj}")
+
 
 class BeginPairResponse:
     """Response from command to begin pairing process."""
 
+    __slots__ = ("ch_type", "token")
+
     def __init__(self, ch_type: str, token: str) -> None:
         """Initialize response from command to begin pairing process."""
         self.ch_type: str = ch_type
         self.token: str = token
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
 
 
 class BeginPairCommand(PairCommandBase):
@@ -43,11 +58,9 @@ class BeginPairCommand(PairCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> BeginPairResponse:
         """Return response to command to begin pairing process."""
-        item = dict_get_case_insensitive(json_obj, ResponseKey.ITEM)
-
+        self._validate_item(json_obj)
         return BeginPairResponse(
-            dict_get_case_insensitive(item, PairingResponseKey.CHALLENGE_TYPE),
-            dict_get_case_insensitive(item, PairingResponseKey.PAIRING_REQ_TOKEN),
+            extract_challenge_type(json_obj), extract_pairing_req_token(json_obj)
         )
 
 
@@ -85,11 +98,8 @@ class PairChallengeCommand(PairCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> PairChallengeResponse:
         """Return response to command to complete pairing process."""
-        item = dict_get_case_insensitive(json_obj, ResponseKey.ITEM)
-
-        return PairChallengeResponse(
-            dict_get_case_insensitive(item, PairingResponseKey.AUTH_TOKEN)
-        )
+        self._validate_item(json_obj)
+        return PairChallengeResponse(extract_auth_token(json_obj))
 
 
 class CancelPairCommand(PairCommandBase):
@@ -6,11 +6,14 @@ from typing import Any
 
 from pyvizio.api._protocol import ENDPOINT, KEY_ACTION
 from pyvizio.api.base import CommandBase
+from pyvizio.helpers import slots_to_dict
 
 
 class KeyPressEvent:
     """Emulated remote key press."""
 
+    __slots__ = ("CODESET", "CODE", "ACTION")
+
     def __init__(
         self, key_code: tuple[int, int], action: str = KEY_ACTION["PRESS"]
     ) -> None:
@@ -20,10 +23,10 @@ class KeyPressEvent:
         self.ACTION: str = action
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
 
 
 class EmulateRemoteCommand(CommandBase):
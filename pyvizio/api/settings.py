@@ -13,8 +13,13 @@ from pyvizio.api._protocol import (
     TYPE_X_LIST,
     ResponseKey,
 )
-from pyvizio.api.item import Item, ItemCommandBase, ItemInfoCommandBase
-from pyvizio.helpers import dict_get_case_insensitive
+from pyvizio.api.item import (
+    Item,
+    ItemCommandBase,
+    ItemInfoCommandBase,
+    ItemView,
+    iter_item_views,
+)
 
 
 class GetAllSettingTypesCommand(ItemInfoCommandBase):
@@ -27,15 +32,12 @@ class GetAllSettingTypesCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> list[str]:
         """Return response to command to get list of all setting types."""
-        items = [
-            Item(item)
-            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
-        ]
         return [
-            item.c_name
-            for item in items
-            if item.type.lower() == TYPE_MENU
-            and item.c_name not in ("cast", "input", "devices", "network")
+            view.c_name
+            for view in iter_item_views(json_obj)
+            if view.is_type(TYPE_MENU)
+            and view.c_name is not None
+            and view.c_name not in ("cast", "input", "devices", "network")
         ]
 
 
@@ -50,14 +52,11 @@ class GetAllSettingsCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> dict[str, int | str]:
         """Return response to command to get list of all setting names and corresponding values."""
-        items = [
-            Item(item)
-            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
-        ]
         return {
-            item.c_name: item.value
-            for item in items
-            if item.type.lower() in (TYPE_LIST, TYPE_SLIDER, TYPE_VALUE)
+            view.c_name: view.get(ResponseKey.VALUE)
+            for view in iter_item_views(json_obj)
+            if view.is_type(TYPE_LIST, TYPE_SLIDER, TYPE_VALUE)
+            and view.c_name is not None
         }
 
 
@@ -85,23 +84,29 @@ class GetAllSettingsOptionsCommand(ItemInfoCommandBase):
         self, json_obj: dict[str, Any]
     ) -> dict[str, list[str] | dict[str, int | None]]:
         """Return response to command to get list of all setting names and corresponding options."""
-        items = [
-            Item(item)
-            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
-        ]
-
         settings_options: dict[str, list[str] | dict[str, int | None]] = {}
-        for item in items:
-            if item.type.lower() in (TYPE_SLIDER, TYPE_VALUE):
-                d: dict[str, int | None] = {"min": item.min, "max": item.max}
-                if item.center is not None:
-                    d["default"] = item.center
-                settings_options[item.c_name] = d
-            elif item.type.lower() == TYPE_LIST:
-                settings_options[item.c_name] = item.choices.copy()
+        for view in iter_item_views(json_obj):
+            if view.c_name is None:
+                continue
+            options = self._get_options(view)
+            if options is not None:
+                settings_options[view.c_name] = options
 
         return settings_options
 
+    @staticmethod
+    def _get_options(view: ItemView) -> list[str] | dict[str, int | None] | None:
+        """Return options of item if it is a setting with options."""
+        if view.is_type(TYPE_SLIDER, TYPE_VALUE):
+            item = Item(view)
+            d: dict[str, int | None] = {"min": item.min, "max": item.max}
+            if item.center is not None:
+                d["default"] = item.center
+            return d
+        if view.is_type(TYPE_LIST):
+            return Item(view).choices.copy()
+        return None
+
 
 class GetSettingOptionsCommand(GetAllSettingsOptionsCommand):
     """Command to get options of a setting by name."""
@@ -116,7 +121,13 @@ class GetSettingOptionsCommand(GetAllSettingsOptionsCommand):
         self, json_obj: dict[str, Any]
     ) -> list[str] | dict[str, int | None] | None:
         """Return response to command to get options of a setting by name."""
-        return super().process_response(json_obj).get(self.setting_name)
+        options = None
+        for view in iter_item_views(json_obj):
+            if view.c_name == self.setting_name:
+                view_options = self._get_options(view)
+                if view_options is not None:
+                    options = view_options
+        return options
 
 
 class GetAllSettingsOptionsXListCommand(ItemInfoCommandBase):
@@ -130,15 +141,10 @@ class GetAllSettingsOptionsXListCommand(ItemInfoCommandBase):
 
     def process_response(self, json_obj: dict[str, Any]) -> dict[str, list[str]]:
         """Return response to command to get list of all setting names and corresponding options for settings of type XList."""
-        items = [
-            Item(item)
-            for item in dict_get_case_insensitive(json_obj, ResponseKey.ITEMS, [])
-        ]
-
         return {
-            item.c_name: item.choices
-            for item in items
-            if item.type and item.type.lower() == TYPE_X_LIST
+            view.c_name: view.get(ResponseKey.ELEMENTS, [])
+            for view in iter_item_views(json_obj)
+            if view.is_type(TYPE_X_LIST) and view.c_name is not None
         }
 
 
@@ -153,7 +159,11 @@ class GetSettingOptionsXListCommand(GetAllSettingsOptionsXListCommand):
 
     def process_response(self, json_obj: dict[str, Any]) -> list[str] | None:  # type: ignore[override]
         """Return response to command to get options of an audio setting by name (used for setting of type XList)."""
-        return super().process_response(json_obj).get(self.setting_name)
+        options = None
+        for view in iter_item_views(json_obj):
+            if view.c_name == self.setting_name and view.is_type(TYPE_X_LIST):
+                options = view.get(ResponseKey.ELEMENTS, [])
+        return options
 
 
 class ChangeSettingCommand(ItemCommandBase):
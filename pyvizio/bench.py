@@ -0,0 +1,165 @@
+"""Measure latency and throughput of SmartCast API endpoints on a device."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Iterable
+from dataclasses import dataclass
+import math
+import time
+from typing import Any, Callable
+
+from aiohttp import TraceConfig
+
+from pyvizio import VizioAsync
+
+
+async def _async_key_press(vizio: VizioAsync, number: int) -> bool | None:
+    """Press VOL_UP and VOL_DOWN in turn so a run leaves the volume where it was."""
+    key = "VOL_DOWN" if number % 2 else "VOL_UP"
+    return await vizio.remote(key, log_api_exception=False) or None
+
+
+# Endpoint name and how to call it for the n-th request (None means it failed)
+BENCH_ENDPOINTS: dict[str, Callable[[VizioAsync, int], Awaitable[Any]]] = {
+    "power_mode": lambda vizio, _: vizio.get_power_state(log_api_exception=False),
+    "current_input": lambda vizio, _: vizio.get_current_input(log_api_exception=False),
+    "audio_settings": lambda vizio, _: vizio.get_all_audio_settings(
+        log_api_exception=False
+    ),
+    "settings_options": lambda vizio, _: vizio.get_all_audio_settings_options(
+        log_api_exception=False
+    ),
+    "key_press": _async_key_press,
+}
+
+# Endpoints benchmarked by default, which don't change anything on the device
+READ_ONLY_ENDPOINTS = (
+    "power_mode",
+    "current_input",
+    "audio_settings",
+    "settings_options",
+)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return nearest-rank percentile of sorted values (0.0 if there are none)."""
+    if not values:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(values))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+class ConnectionStats:
+    """Count connections opened and reused by sessions traced with `trace_config`."""
+
+    def __init__(self) -> None:
+        """Initialize counters and the trace config that updates them."""
+        self.created = 0
+        self.reused = 0
+        self.trace_config = TraceConfig()
+        self.trace_config.on_connection_create_end.append(self._async_on_create)
+        self.trace_config.on_connection_reuseconn.append(self._async_on_reuse)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(created={self.created}, reused={self.reused})"
+
+    async def _async_on_create(self, *_: Any) -> None:
+        self.created += 1
+
+    async def _async_on_reuse(self, *_: Any) -> None:
+        self.reused += 1
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Measurements from benchmarking one endpoint."""
+
+    endpoint: str
+    latencies: list[float]
+    errors: int
+    elapsed: float
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    @property
+    def requests(self) -> int:
+        """Return number of requests sent."""
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        """Return successful requests per second."""
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.requests - self.errors) / self.elapsed
+
+    def latency(self, percent: float) -> float:
+        """Return latency percentile in seconds."""
+        return percentile(sorted(self.latencies), percent)
+
+
+async def async_bench_endpoint(
+    vizio: VizioAsync,
+    endpoint: str,
+    requests: int,
+    concurrency: int = 1,
+    connections: ConnectionStats | None = None,
+) -> EndpointStats:
+    """Send `requests` requests to endpoint, at most `concurrency` at a time.
+
+    A request that returns None counts as an error. Connection
+    counts are only collected when `connections` traces vizio's session.
+    """
+    call = BENCH_ENDPOINTS[endpoint]
+    latencies: list[float] = []
+    errors = 0
+    created, reused = (
+        (connections.created, connections.reused) if connections else (0, 0)
+    )
+    # Workers share one iterator so exactly `requests` requests are sent
+    numbers = iter(range(requests))
+
+    async def async_worker() -> None:
+        nonlocal errors
+        for number in numbers:
+            start = time.perf_counter()
+            result = await call(vizio, number)
+            latencies.append(time.perf_counter() - start)
+            if result is None:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(async_worker() for _ in range(max(concurrency, 1))))
+    elapsed = time.perf_counter() - start
+
+    if connections is None:
+        return EndpointStats(endpoint, latencies, errors, elapsed)
+    return EndpointStats(
+        endpoint,
+        latencies,
+        errors,
+        elapsed,
+        connections.created - created,
+        connections.reused - reused,
+    )
+
+
+async def async_bench(
+    vizio: VizioAsync,
+    endpoints: Iterable[str] = READ_ONLY_ENDPOINTS,
+    requests: int = 20,
+    concurrency: int = 1,
+    connections: ConnectionStats | None = None,
+) -> list[EndpointStats]:
+    """Benchmark each endpoint in turn and return their stats.
+
+    Endpoints run one after another so they don't skew each other. vizio's
+    `max_concurrent_requests` still applies, so set it to at least
+    `concurrency`.
+    """
+    await vizio.connect()
+    return [
+        await async_bench_endpoint(vizio, endpoint, requests, concurrency, connections)
+        for endpoint in endpoints
+    ]
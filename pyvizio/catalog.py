@@ -0,0 +1,252 @@
+"""Process-wide app catalog shared by every pyvizio device instance."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from pyvizio.const import DEFAULT_TIMEOUT
+from pyvizio.data import load_bundled_apps
+from pyvizio.util import async_read_json, gen_apps_list
+from pyvizio.util.const import (
+    APP_NAMES_URL,
+    APP_PAYLOADS_URL,
+    MAX_APPS_RESPONSE_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "PYVIZIO_CACHE_DIR"
+CACHE_FILE = "app_catalog.json"
+CATALOG_TTL = timedelta(days=1)
+
+HTTP_NOT_MODIFIED = 304
+
+
+def default_cache_dir() -> Path:
+    """Return directory used to persist the app catalog between processes."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base / "pyvizio"
+
+
+class AppCatalog:
+    """App catalog fetched from the Vizio app service and cached in memory and on disk.
+
+    Refreshes use conditional requests (`If-None-Match`/`If-Modified-Since`) so an
+    unchanged catalog costs two empty 304 responses. When the catalog has never
+    been fetched and no cached copy exists, the bundled `APPS` list is returned.
+
+    Readers never wait on the network: a stale catalog is served as-is while a
+    single background refresh, shared by all callers, brings it up to date.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        ttl: timedelta = CATALOG_TTL,
+        app_names_url: str = APP_NAMES_URL,
+        app_payloads_url: str = APP_PAYLOADS_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_size: int = MAX_APPS_RESPONSE_SIZE,
+    ) -> None:
+        """Initialize app catalog. Set `cache_dir` to None to keep it in memory only."""
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_size = max_size
+        self._app_names_url = app_names_url
+        self._app_payloads_url = app_payloads_url
+        self._apps: list[dict[str, Any]] | None = None
+        self._last_checked: datetime | None = None
+        self._sources: dict[str, dict[str, Any]] = {}
+        self._disk_loaded = False
+        self._refresh_task: asyncio.Task[bool] | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(cache_dir={self._cache_dir!r}, "
+            f"last_checked={self._last_checked!r})"
+        )
+
+    @property
+    def cache_file(self) -> Path | None:
+        """Path of the on-disk copy of the catalog."""
+        if self._cache_dir is None:
+            return None
+        return self._cache_dir / CACHE_FILE
+
+    @property
+    def apps(self) -> list[dict[str, Any]]:
+        """Return last known apps list without touching the network."""
+        self._load_from_disk()
+        return self._apps or load_bundled_apps()
+
+    def is_stale(self) -> bool:
+        """Return whether or not the catalog should be refreshed."""
+        self._load_from_disk()
+        return (
+            self._last_checked is None
+            or datetime.now() - self._last_checked >= self.ttl
+        )
+
+    async def async_get_apps(
+        self, session: ClientSession | None = None
+    ) -> list[dict[str, Any]]:
+        """Return last known apps list, refreshing it in the background if it is stale."""
+        if self.is_stale():
+            self.schedule_refresh(session=session)
+        return self.apps
+
+    def schedule_refresh(self, session: ClientSession | None = None) -> None:
+        """Start a background refresh unless one is already running."""
+        self._get_refresh_task(session)
+
+    async def async_refresh(self, session: ClientSession | None = None) -> bool:
+        """Refresh catalog from the app service. Return whether or not it succeeded.
+
+        Concurrent callers share the same in-flight refresh.
+        """
+        return await asyncio.shield(self._get_refresh_task(session))
+
+    def _get_refresh_task(self, session: ClientSession | None) -> asyncio.Task[bool]:
+        """Return in-flight refresh task for the running loop, starting one if needed."""
+        loop = asyncio.get_running_loop()
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._async_refresh(session))
+            self._refresh_task = task
+        return task
+
+    async def _async_refresh(self, session: ClientSession | None) -> bool:
+        """Fetch catalog sources and update in-memory and on-disk copies."""
+        self._load_from_disk()
+
+        try:
+            if session and not session.closed:
+                sources = await self._async_fetch_sources(session)
+            else:
+                async with ClientSession() as local_session:
+                    sources = await self._async_fetch_sources(local_session)
+        except (ClientError, asyncio.TimeoutError, ValueError) as err:
+            _LOGGER.debug("Unable to refresh app catalog: %r", err)
+            # Don't hammer the app service; retry once the TTL expires again
+            self._last_checked = datetime.now()
+            return False
+
+        if all(
+            sources[url] is self._sources.get(url)
+            for url in (self._app_names_url, self._app_payloads_url)
+        ):
+            _LOGGER.debug("App catalog not modified")
+        else:
+            self._sources = sources
+            self._apps = gen_apps_list(
+                sources[self._app_names_url]["body"],
+                sources[self._app_payloads_url]["body"],
+            )
+
+        self._last_checked = datetime.now()
+        self._save_to_disk()
+        return True
+
+    async def _async_fetch_sources(
+        self, session: ClientSession
+    ) -> dict[str, dict[str, Any]]:
+        """Concurrently fetch both catalog sources, reusing cached bodies the server reports as unmodified."""
+        urls = (self._app_names_url, self._app_payloads_url)
+        sources = await asyncio.gather(
+            *(self._async_fetch_source(session, url) for url in urls)
+        )
+        return dict(zip(urls, sources))
+
+    async def _async_fetch_source(
+        self, session: ClientSession, url: str
+    ) -> dict[str, Any]:
+        """Conditionally fetch a single catalog source."""
+        cached = self._sources.get(url)
+        headers = {"Content-Type": "application/json"}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        async with session.get(
+            url,
+            headers=headers,
+            raise_for_status=True,
+            timeout=ClientTimeout(total=self.timeout),
+        ) as response:
+            if response.status == HTTP_NOT_MODIFIED and cached:
+                return cached
+
+            return {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "body": await async_read_json(response, self.max_size),
+            }
+
+    def _load_from_disk(self) -> None:
+        """Load persisted catalog the first time it is needed."""
+        if self._disk_loaded:
+            return
+        self._disk_loaded = True
+
+        if self.cache_file is None or self._apps is not None:
+            return
+
+        try:
+            data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            self._sources = data["sources"]
+            self._apps = data["apps"]
+            self._last_checked = datetime.fromisoformat(data["last_checked"])
+        except (OSError, ValueError, KeyError, TypeError) as err:
+            _LOGGER.debug("Unable to load cached app catalog: %s", err)
+
+    def _save_to_disk(self) -> None:
+        """Atomically persist catalog so other processes can reuse it."""
+        if self.cache_file is None or self._apps is None:
+            return
+
+        data = {
+            "last_checked": self._last_checked.isoformat()
+            if self._last_checked
+            else None,
+            "sources": self._sources,
+            "apps": self._apps,
+        }
+        tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, self.cache_file)
+        except OSError as err:
+            _LOGGER.debug("Unable to persist app catalog: %s", err)
+
+
+_CATALOG: AppCatalog | None = None
+
+
+def get_app_catalog() -> AppCatalog:
+    """Return the app catalog shared by all devices in this process."""
+    global _CATALOG
+    if _CATALOG is None:
+        _CATALOG = AppCatalog(cache_dir=default_cache_dir())
+    return _CATALOG
+
+
+def set_app_catalog(catalog: AppCatalog | None) -> None:
+    """Replace the shared app catalog (None restores the default on next use)."""
+    global _CATALOG
+    _CATALOG = catalog
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+from contextvars import ContextVar
+import csv
+from dataclasses import dataclass
+from functools import wraps
+import inspect
+import json
 import logging
+import time
+from typing import IO, Any, Callable
 
+from aiohttp import ClientSession
 import click
 from tabulate import tabulate
 
-from pyvizio import VizioAsync, guess_device_type
-from pyvizio.api.apps import find_app_name
+from pyvizio import VizioAsync, async_guess_device_types
+from pyvizio.api.apps import get_app_index
+from pyvizio.bench import (
+    BENCH_ENDPOINTS,
+    READ_ONLY_ENDPOINTS,
+    ConnectionStats,
+    async_bench,
+)
 from pyvizio.const import (
-    APP_HOME,
-    APPS,
     DEFAULT_DEVICE_CLASS,
     DEFAULT_DEVICE_ID,
     DEFAULT_DEVICE_NAME,
@@ -17,27 +31,268 @@ from pyvizio.const import (
     DEVICE_CLASS_CRAVE360,
     DEVICE_CLASS_SPEAKER,
     DEVICE_CLASS_TV,
+    DEVICE_CONFIGS,
     NO_APP_RUNNING,
     UNKNOWN_APP,
 )
+from pyvizio.discovery.sweep import async_sweep
+from pyvizio.errors import VizioInvalidParameterError
 from pyvizio.helpers import async_to_sync
-from pyvizio.util import gen_apps_list_from_url
+from pyvizio.script import async_run_script, parse_script
+from pyvizio.watch import DEFAULT_WATCH_INTERVAL, async_watch
 
 _LOGGER = logging.getLogger(__name__)
 
-pass_vizio = click.make_pass_decorator(VizioAsync)
+# Messages logged by a command while it runs against one of several devices
+_CAPTURED: ContextVar[list[logging.LogRecord] | None] = ContextVar(
+    "pyvizio_cli_captured", default=None
+)
+
+
+class _CaptureHandler(logging.Handler):
+    """Keep pyvizio records for the device being run against, passing others to root.
+
+    Attached to the `pyvizio` logger so failures logged by the library count
+    against the device as well as the CLI's own messages.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        captured = _CAPTURED.get()
+        if captured is None:
+            logging.getLogger().handle(record)
+        else:
+            captured.append(record)
+
+
+_CAPTURE_HANDLER = _CaptureHandler()
+
+
+@dataclass(frozen=True)
+class Target:
+    """Device to run a command against."""
+
+    ip: str
+    auth: str = ""
+    device_type: str = DEFAULT_DEVICE_CLASS
+
+    def get_vizio(self, **kwargs: Any) -> VizioAsync:
+        """Return VizioAsync for device."""
+        return VizioAsync(
+            DEFAULT_DEVICE_ID,
+            self.ip,
+            DEFAULT_DEVICE_NAME,
+            self.auth,
+            self.device_type,
+            **kwargs,
+        )
+
+
+@dataclass(frozen=True)
+class TargetResult:
+    """Outcome of running a command against one of several devices."""
+
+    target: Target
+    output: list[str]
+    elapsed: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether or not the command succeeded on the device."""
+        return self.error is None
+
+
+class Targets:
+    """Devices a command runs against, with how to fan it out and report it."""
+
+    def __init__(
+        self, targets: list[Target], max_concurrent_devices: int, output: str
+    ) -> None:
+        self.targets = targets
+        self.max_concurrent_devices = max_concurrent_devices
+        self.output = output
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__dict__})"
+
+    def __eq__(self, other) -> bool:
+        return self is other or self.__dict__ == other.__dict__
+
+    def __len__(self) -> int:
+        return len(self.targets)
+
+    async def _async_run_target(
+        self,
+        target: Target,
+        call: Callable[[Target], Any],
+        semaphore: asyncio.Semaphore,
+    ) -> TargetResult:
+        """Run call against target, keeping what it logs."""
+        records: list[logging.LogRecord] = []
+        _CAPTURED.set(records)
+        async with semaphore:
+            start = time.perf_counter()
+            error = None
+            try:
+                result = call(target)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as err:  # Reported against the device instead
+                error = str(err) or type(err).__name__
+            elapsed = time.perf_counter() - start
+
+        output = [record.getMessage().strip() for record in records]
+        if error is None:
+            errors = [
+                message
+                for record, message in zip(records, output)
+                if record.levelno >= logging.ERROR
+            ]
+            error = "; ".join(errors) or None
+        return TargetResult(target, output, elapsed, error)
+
+    async def async_run(self, call: Callable[[Target], Any]) -> None:
+        """Run call against every device concurrently and report the results.
+
+        At most `max_concurrent_devices` devices are talked to at once. Exits
+        with status 1 if the command failed on any device. A single device is
+        just called, leaving the command to report for itself.
+        """
+        if len(self.targets) == 1:
+            result = call(self.targets[0])
+            if inspect.isawaitable(result):
+                await result
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrent_devices)
+        results = await asyncio.gather(
+            *(
+                self._async_run_target(target, call, semaphore)
+                for target in self.targets
+            )
+        )
+
+        if self.output == "ndjson":
+            for result in results:
+                row = {
+                    "ip": result.target.ip,
+                    "device_type": result.target.device_type,
+                    "ok": result.ok,
+                    "output": result.output,
+                    "error": result.error,
+                    "elapsed_ms": round(result.elapsed * 1000, 3),
+                }
+                click.echo(json.dumps(row))
+        else:
+            data = [
+                {
+                    "IP": result.target.ip,
+                    "Device Type": result.target.device_type,
+                    "Status": "ok" if result.ok else "error",
+                    "Output": "\n".join(result.output) if result.ok else result.error,
+                    "Time (ms)": round(result.elapsed * 1000, 1),
+                }
+                for result in results
+            ]
+            click.echo(tabulate(data, "keys"))
+
+        if not all(result.ok for result in results):
+            click.get_current_context().exit(1)
+
+
+def _pass_targets(
+    f: Callable[..., Any], get_arg: Callable[[Target], Any]
+) -> Callable[..., Any]:
+    """Return command callback that calls `f` once per target device.
+
+    Async commands return a coroutine for `async_to_sync` to run.
+    """
+
+    @click.pass_obj
+    @wraps(f)
+    def wrapper(targets: Targets, *args, **kwargs):
+        def call(target: Target) -> Any:
+            return f(get_arg(target), *args, **kwargs)
+
+        run = targets.async_run(call)
+        return run if inspect.iscoroutinefunction(f) else asyncio.run(run)
+
+    return wrapper
+
+
+def pass_vizio(f: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator to pass a VizioAsync for each target device to command."""
+    return _pass_targets(f, Target.get_vizio)
+
+
+def _read_inventory(file: IO[str], auth: str, device_type: str) -> list[Target]:
+    """Return devices listed in CSV inventory with `ip`, `device_type` and `auth` columns.
+
+    Missing or empty `device_type` and `auth` values fall back to the
+    `--device_type` and `--auth` options. Blank lines and `#` comments are
+    skipped.
+    """
+    lines = (line for line in file if line.strip() and not line.startswith("#"))
+    targets = []
+    for row_num, row in enumerate(csv.DictReader(lines), 1):
+        row = {
+            key.strip().lower(): (value or "").strip()
+            for key, value in row.items()
+            if key
+        }
+        if not row.get("ip"):
+            raise click.BadParameter(
+                f"row {row_num} has no ip", param_hint="--inventory"
+            )
+        row_device_type = row.get("device_type", "").lower() or device_type
+        if row_device_type not in DEVICE_CONFIGS:
+            raise click.BadParameter(
+                f"row {row_num} has invalid device_type '{row_device_type}'",
+                param_hint="--inventory",
+            )
+        targets.append(Target(row["ip"], row.get("auth") or auth, row_device_type))
+    return targets
+
+
+def _log_result(result: bool | None) -> None:
+    """Log whether or not a command succeeded."""
+    if result:
+        _LOGGER.info("OK")
+    else:
+        _LOGGER.error("ERROR")
+
+
+async def _async_get_latest_apps() -> list[dict]:
+    """Refresh shared app catalog if it is stale and return it."""
+    from pyvizio.catalog import get_app_catalog
+
+    catalog = get_app_catalog()
+    if catalog.is_stale():
+        await catalog.async_refresh()
+    return catalog.apps
 
 
 @click.group(invoke_without_command=False)
 @click.option(
     "--ip",
     envvar="VIZIO_IP",
-    required=True,
+    multiple=True,
     help=(
         "IP of the device to connect to (optionally add custom port by specifying "
-        "'<IP>:<PORT>')"
+        "'<IP>:<PORT>'). Repeat to run the command on several devices"
+    ),
+    show_envvar=True,
+)
+@click.option(
+    "--inventory",
+    envvar="VIZIO_INVENTORY",
+    required=False,
+    default=None,
+    type=click.File("r"),
+    help=(
+        "CSV file of devices to run the command on, with an 'ip' column and "
+        "optional 'device_type' and 'auth' columns"
     ),
-    show_default=True,
     show_envvar=True,
 )
 @click.option(
@@ -61,11 +316,52 @@ pass_vizio = click.make_pass_decorator(VizioAsync)
     show_default=True,
     show_envvar=True,
 )
+@click.option(
+    "--max_concurrent_devices",
+    envvar="VIZIO_MAX_CONCURRENT_DEVICES",
+    required=False,
+    default=16,
+    type=click.IntRange(min=1),
+    help="Maximum number of devices to run the command on at once",
+    show_default=True,
+    show_envvar=True,
+)
+@click.option(
+    "--output",
+    required=False,
+    default="table",
+    type=click.Choice(["table", "ndjson"]),
+    help="How to report results when running on several devices",
+    show_default=True,
+)
 @click.pass_context
-def cli(ctx, ip: str, auth: str, device_type: str) -> None:
+def cli(
+    ctx,
+    ip: tuple[str, ...],
+    inventory: IO[str] | None,
+    auth: str,
+    device_type: str,
+    max_concurrent_devices: int,
+    output: str,
+) -> None:
     logging.basicConfig(level=logging.INFO)
+    # Messages must reach the capture handler to be reported per device
+    _LOGGER.setLevel(logging.INFO)
+    capture_loggers = [logging.getLogger("pyvizio")]
+    if not _LOGGER.name.startswith("pyvizio."):
+        # Run as `python -m pyvizio.cli`
+        capture_loggers.append(_LOGGER)
+    for logger in capture_loggers:
+        logger.addHandler(_CAPTURE_HANDLER)
+        logger.propagate = False
+
+    targets = [Target(device_ip, auth, device_type) for device_ip in ip]
+    if inventory is not None:
+        targets.extend(_read_inventory(inventory, auth, device_type))
+    if not targets:
+        raise click.UsageError("Missing option '--ip' or '--inventory'.")
 
-    ctx.obj = VizioAsync(DEFAULT_DEVICE_ID, ip, DEFAULT_DEVICE_NAME, auth, device_type)
+    ctx.obj = Targets(targets, max_concurrent_devices, output)
 
 
 @cli.command()
@@ -87,30 +383,44 @@ def cli(ctx, ip: str, auth: str, device_type: str) -> None:
     show_default=True,
     show_envvar=True,
 )
-def discover(include_device_type: bool, timeout: int) -> None:
-    devices: list = VizioAsync.discovery_zeroconf(timeout)
-
-    data = []
-
-    if devices:
-        data = [
-            {"IP": dev.ip, "Port": dev.port, "Model": dev.model, "Name": dev.name}
-            for dev in devices
-        ]
-    else:
-        _LOGGER.info("Couldn't find any devices using zeroconf, trying SSDP")
-        devices = VizioAsync.discovery_ssdp(timeout)
-        if devices:
+@click.option(
+    "--network",
+    required=False,
+    default=None,
+    type=click.STRING,
+    help="Sweep this IPv4 CIDR range (e.g. 192.168.0.0/22) instead of using multicast",
+    show_envvar=True,
+)
+def discover(include_device_type: bool, timeout: int, network: str | None) -> None:
+    if network:
+        swept = asyncio.run(async_sweep(network, timeout=timeout))
+        if swept:
             data = [
-                {"IP": dev.ip, "Model": dev.model, "Name": dev.name} for dev in devices
+                {
+                    "IP": dev.ip,
+                    "Port": dev.port,
+                    "Model": dev.model,
+                    "Device Type": dev.device_type,
+                }
+                for dev in swept
             ]
+            _LOGGER.info("\n%s", tabulate(data, "keys"))
+        else:
+            _LOGGER.info("No Vizio devices discoverd.")
+        return
+
+    devices = asyncio.run(VizioAsync.discovery(timeout))
+
+    data = [
+        {"IP": dev.ip, "Port": dev.port, "Model": dev.model, "Name": dev.name}
+        for dev in devices
+    ]
 
     if devices:
         if include_device_type:
-            for dev in data:
-                dev["Guessed Device Type"] = guess_device_type(
-                    dev["IP"], dev.get("Port")
-                )
+            device_types = asyncio.run(async_guess_device_types(devices, timeout))
+            for row, device_type in zip(data, device_types):
+                row["Guessed Device Type"] = device_type
 
         _LOGGER.info("\n%s", tabulate(data, "keys"))
     else:
@@ -129,7 +439,7 @@ async def pair(vizio: VizioAsync) -> None:
         _LOGGER.info("Challenge type: %s", pair_data.ch_type)
         _LOGGER.info("Challenge token: %s", pair_data.token)
     else:
-        _LOGGER.info("ERROR")
+        _LOGGER.error("ERROR")
 
 
 @cli.command()
@@ -140,7 +450,7 @@ async def pair_stop(vizio: VizioAsync) -> None:
 
     result = await vizio.stop_pair()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -179,7 +489,7 @@ async def pair_finish(vizio: VizioAsync, ch_type: int, token: int, pin: str) ->
     if pair_data is not None:
         _LOGGER.info("Authorization token: %s", pair_data.auth_token)
     else:
-        _LOGGER.info("ERROR")
+        _LOGGER.error("ERROR")
 
 
 @cli.command()
@@ -262,7 +572,7 @@ async def power(vizio: VizioAsync, state: str) -> None:
         _LOGGER.info("Toggling Power")
         result = await vizio.pow_toggle()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -282,7 +592,7 @@ async def volume(vizio: VizioAsync, state: str, amount: int) -> None:
         _LOGGER.info("Decreasing volume")
         result = await vizio.vol_down(amount)
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -321,7 +631,7 @@ async def channel(vizio: VizioAsync, state: str, amount: int) -> None:
         _LOGGER.info("Previous channel")
         result = await vizio.ch_prev()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -344,7 +654,7 @@ async def mute(vizio: VizioAsync, state: str) -> None:
         _LOGGER.info("Toggling mute")
         result = await vizio.mute_toggle()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -355,7 +665,7 @@ async def next_input(vizio: VizioAsync) -> None:
 
     result = await vizio.next_input()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command(name="input")
@@ -367,7 +677,7 @@ async def input(vizio: VizioAsync, input_name: str) -> None:
 
     result = await vizio.set_input(input_name)
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -376,7 +686,7 @@ async def input(vizio: VizioAsync, input_name: str) -> None:
 async def play(vizio: VizioAsync) -> None:
     result = await vizio.play()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -385,7 +695,7 @@ async def play(vizio: VizioAsync) -> None:
 async def pause(vizio: VizioAsync) -> None:
     result = await vizio.pause()
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -397,7 +707,7 @@ async def key_press(vizio: VizioAsync, key: str) -> None:
 
     result = await vizio.remote(key.upper())
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -495,7 +805,7 @@ async def setting(
     except ValueError:
         result = await vizio.set_setting(setting_type, setting_name, new_value)
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -606,7 +916,7 @@ async def audio_setting(
     except ValueError:
         result = await vizio.set_audio_setting(setting_name, new_value)
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -622,7 +932,9 @@ async def audio_setting(
 @async_to_sync
 @pass_vizio
 async def get_apps_list(vizio: VizioAsync, country: str = "all") -> None:
-    apps = await VizioAsync.get_apps_list(country)
+    apps = await VizioAsync.get_apps_list(
+        country, apps_list=await _async_get_latest_apps()
+    )
     if apps:
         table = tabulate([{"Name": app} for app in apps], headers="keys")
         _LOGGER.info("\n%s", table)
@@ -632,13 +944,22 @@ async def get_apps_list(vizio: VizioAsync, country: str = "all") -> None:
 
 @cli.command()
 @click.argument("app_name", required=True, type=click.STRING)
+@click.option(
+    "--fuzzy",
+    is_flag=True,
+    default=False,
+    help="Launch the closest matching app if no app has exactly this name",
+    show_default=True,
+)
 @async_to_sync
 @pass_vizio
-async def launch_app(vizio: VizioAsync, app_name: str) -> None:
+async def launch_app(vizio: VizioAsync, app_name: str, fuzzy: bool) -> None:
     _LOGGER.info("Attempting to launch '%s' app", app_name)
-    result = await vizio.launch_app(app_name)
+    result = await vizio.launch_app(
+        app_name, apps_list=await _async_get_latest_apps(), fuzzy=fuzzy
+    )
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -657,7 +978,7 @@ async def launch_app_config(
 
     result = await vizio.launch_app_config(app_id, name_space, message)
 
-    _LOGGER.info("OK" if result else "ERROR")
+    _log_result(result)
 
 
 @cli.command()
@@ -665,8 +986,8 @@ async def launch_app_config(
 @pass_vizio
 async def get_current_app(vizio: VizioAsync) -> None:
     app_config = await vizio.get_current_app_config()
-    apps_list = await gen_apps_list_from_url() or APPS
-    app_name = find_app_name(app_config, [APP_HOME, *apps_list])
+    apps_list = await _async_get_latest_apps()
+    app_name = get_app_index(apps_list, include_home=True).find_app_name(app_config)
 
     if app_name:
         if app_name == NO_APP_RUNNING:
@@ -732,5 +1053,271 @@ async def get_serial_number(vizio: VizioAsync) -> None:
         _LOGGER.info("Serial Number: %s", item)
 
 
+@cli.command("run")
+@click.argument("script", type=click.File("r"), default="-")
+@click.option(
+    "--concurrency",
+    required=False,
+    default=4,
+    type=click.IntRange(min=1),
+    help="Maximum requests in flight at once for commands marked parallel",
+    show_default=True,
+)
+@click.option(
+    "--stop-on-error",
+    is_flag=True,
+    default=False,
+    help="Don't start any more commands after one fails",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print one JSON object per command instead of a table",
+)
+@async_to_sync
+@click.pass_obj
+async def run_script(
+    targets: Targets, script, concurrency: int, stop_on_error: bool, as_json: bool
+) -> None:
+    """Run commands from SCRIPT (or stdin) on one connection.
+
+    Each line is a VizioAsync method name followed by its arguments (e.g.
+    `set_input HDMI-1`) or a JSON object with `method`, `args`, `kwargs` and
+    `parallel` keys. The whole script may also be a JSON array of such
+    objects. End a line with `&` to run it in parallel with its neighbours.
+    """
+    try:
+        commands = parse_script(script.read())
+    except VizioInvalidParameterError as err:
+        raise click.UsageError(str(err)) from err
+
+    async def async_run_target(target: Target) -> None:
+        async with ClientSession() as session:
+            vizio = target.get_vizio(
+                session=session, max_concurrent_requests=concurrency
+            )
+            results = await async_run_script(vizio, commands, stop_on_error)
+
+        if as_json:
+            for result in results:
+                row = {
+                    "ip": target.ip,
+                    "line": result.command.line,
+                    "method": result.command.method,
+                    "ok": result.ok,
+                    "result": result.result,
+                    "error": result.error,
+                    "elapsed_ms": round(result.elapsed * 1000, 3),
+                }
+                click.echo(json.dumps(row, default=str))
+        elif results:
+            data = [
+                {
+                    "Line": result.command.line,
+                    "Command": str(result.command),
+                    "Status": "ok" if result.ok else "error",
+                    "Result": result.result if result.ok else result.error,
+                    "Time (ms)": round(result.elapsed * 1000, 1),
+                }
+                for result in results
+            ]
+            _LOGGER.info("\n%s", tabulate(data, "keys"))
+
+        failed = sum(not result.ok for result in results)
+        if failed:
+            raise click.ClickException(f"{failed} of {len(results)} commands failed")
+
+    await targets.async_run(async_run_target)
+
+
+@cli.command()
+@click.option(
+    "--interval",
+    required=False,
+    default=DEFAULT_WATCH_INTERVAL,
+    type=click.FloatRange(min=0.1),
+    help="Seconds between polls",
+    show_default=True,
+)
+@click.option(
+    "--count",
+    required=False,
+    default=None,
+    type=click.IntRange(min=1),
+    help="Stop after this many polls instead of running until interrupted",
+)
+@click.option(
+    "--concurrency",
+    required=False,
+    default=4,
+    type=click.IntRange(min=1),
+    help="Maximum requests in flight at once during a poll",
+    show_default=True,
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print one JSON object per change instead of a line of text",
+)
+@click.pass_obj
+def watch(
+    targets: Targets,
+    interval: float,
+    count: int | None,
+    concurrency: int,
+    as_json: bool,
+) -> None:
+    """Poll power, volume, mute, input and app and print what changes.
+
+    Every poll reuses one connection. Each change is printed with when it was
+    seen and how long the poll took.
+    """
+
+    async def async_watch_target(target: Target) -> None:
+        async with ClientSession() as session:
+            vizio = target.get_vizio(
+                session=session, max_concurrent_requests=concurrency
+            )
+            async for event in async_watch(vizio, interval, count):
+                if as_json:
+                    row = {
+                        "ip": target.ip,
+                        "time": event.time.isoformat(),
+                        "latency_ms": round(event.latency * 1000, 3),
+                        "changes": {
+                            name: {"old": old, "new": new}
+                            for name, (old, new) in event.changes.items()
+                        },
+                    }
+                    click.echo(json.dumps(row, default=str))
+                elif len(targets) > 1:
+                    click.echo(f"{target.ip} {event}")
+                else:
+                    click.echo(str(event))
+
+    try:
+        asyncio.run(targets.async_run(async_watch_target))
+    except KeyboardInterrupt:
+        pass
+
+
+@cli.command()
+@click.option(
+    "--endpoint",
+    "endpoints",
+    multiple=True,
+    type=click.Choice(list(BENCH_ENDPOINTS)),
+    help=(
+        "Endpoint to benchmark, repeat for several (default: every endpoint but "
+        "key_press, which alternates VOL_UP and VOL_DOWN)"
+    ),
+)
+@click.option(
+    "--requests",
+    required=False,
+    default=20,
+    type=click.IntRange(min=1),
+    help="Number of requests to send to each endpoint",
+    show_default=True,
+)
+@click.option(
+    "--concurrency",
+    required=False,
+    default=1,
+    type=click.IntRange(min=1),
+    help="Maximum requests in flight at once (used as max_concurrent_requests)",
+    show_default=True,
+)
+@click.option(
+    "--timeout",
+    required=False,
+    default=DEFAULT_TIMEOUT,
+    type=click.IntRange(min=1),
+    help="Seconds to wait for each response",
+    show_default=True,
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print one JSON object per endpoint instead of a table",
+)
+@async_to_sync
+@click.pass_obj
+async def bench(
+    targets: Targets,
+    endpoints: tuple[str, ...],
+    requests: int,
+    concurrency: int,
+    timeout: int,
+    as_json: bool,
+) -> None:
+    """Report throughput, latency percentiles and connection reuse per endpoint.
+
+    Works against a device or anything serving the SmartCast API, such as a
+    local simulator.
+    """
+
+    async def async_bench_target(target: Target) -> None:
+        connections = ConnectionStats()
+        async with ClientSession(trace_configs=[connections.trace_config]) as session:
+            vizio = target.get_vizio(
+                session=session, timeout=timeout, max_concurrent_requests=concurrency
+            )
+            results = await async_bench(
+                vizio,
+                endpoints or READ_ONLY_ENDPOINTS,
+                requests,
+                concurrency,
+                connections,
+            )
+
+        if as_json:
+            for stats in results:
+                row = {
+                    "ip": target.ip,
+                    "endpoint": stats.endpoint,
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "concurrency": concurrency,
+                    "throughput": round(stats.throughput, 3),
+                    **{
+                        f"p{percent}_ms": round(stats.latency(percent) * 1000, 3)
+                        for percent in (50, 95, 99, 100)
+                    },
+                    "connections_created": stats.connections_created,
+                    "connections_reused": stats.connections_reused,
+                }
+                click.echo(json.dumps(row))
+        else:
+            data = [
+                {
+                    "Endpoint": stats.endpoint,
+                    "Requests": stats.requests,
+                    "Errors": stats.errors,
+                    "Req/s": round(stats.throughput, 1),
+                    "p50 (ms)": round(stats.latency(50) * 1000, 1),
+                    "p95 (ms)": round(stats.latency(95) * 1000, 1),
+                    "p99 (ms)": round(stats.latency(99) * 1000, 1),
+                    "Max (ms)": round(stats.latency(100) * 1000, 1),
+                    "New Conns": stats.connections_created,
+                    "Reused Conns": stats.connections_reused,
+                }
+                for stats in results
+            ]
+            _LOGGER.info("\n%s", tabulate(data, "keys"))
+
+        failed = sum(stats.errors for stats in results)
+        if failed:
+            _LOGGER.error("%s requests failed", failed)
+
+    await targets.async_run(async_bench_target)
+
+
 if __name__ == "__main__":
     cli()
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from importlib import resources
-import json
+from typing import TYPE_CHECKING, Any
+
+from pyvizio.data import load_bundled_apps
 
 DEVICE_CLASS_SPEAKER = "speaker"
 DEVICE_CLASS_TV = "tv"
@@ -14,6 +15,8 @@ DEFAULT_DEVICE_ID = "pyvizio"
 DEFAULT_DEVICE_CLASS = DEVICE_CLASS_TV
 DEFAULT_DEVICE_NAME = "Python Vizio"
 DEFAULT_PORTS = [7345, 9000]
+# Only TVs (SmartCast 4.0+) serve the API on this port, speakers use 9000
+TV_ONLY_PORT = 7345
 DEFAULT_TIMEOUT = 5
 
 MAX_VOLUME = {
@@ -25,6 +28,9 @@ MAX_VOLUME = {
 # Current Input when app is active
 INPUT_APPS = ["SMARTCAST", "CAST"]
 
+# Device type guessed for devices that couldn't be reached
+DEVICE_TYPE_UNKNOWN = "unknown"
+
 # App name returned when it is not in app dictionary
 UNKNOWN_APP = "_UNKNOWN_APP"
 NO_APP_RUNNING = "_NO_APP_RUNNING"
@@ -48,13 +54,15 @@ APP_HOME = {
 }
 
 
-def _load_apps() -> list[dict]:
-    """Load apps list from bundled JSON data."""
-    ref = resources.files("pyvizio.data").joinpath("apps.json")
-    return json.loads(ref.read_text(encoding="utf-8"))
+if TYPE_CHECKING:
+    APPS: list[dict]
 
 
-APPS: list[dict] = _load_apps()
+def __getattr__(name: str) -> Any:
+    """Load bundled `APPS` list lazily on first access."""
+    if name == "APPS":
+        return load_bundled_apps()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,77 @@
+"""Bundled pyvizio data files."""
+
+from __future__ import annotations
+
+from functools import cache
+from importlib import resources
+import json
+import marshal
+from pathlib import Path
+import sys
+from typing import Any
+
+APPS_JSON_FILE = "apps.json"
+APPS_MARSHAL_FILE = "apps.marshal"
+
+# Bump when the layout of the rows in APPS_MARSHAL_FILE changes
+APPS_MARSHAL_FORMAT = 1
+
+AppRow = tuple[str, tuple[str, ...], tuple[str, ...], tuple[tuple[int, str, Any], ...]]
+
+
+def apps_to_rows(apps: list[dict[str, Any]]) -> tuple[AppRow, ...]:
+    """Convert list of app dicts to compact rows of tuples."""
+    return tuple(
+        (
+            app["name"],
+            tuple(app["country"]),
+            tuple(app["id"]),
+            tuple(
+                (config["NAME_SPACE"], config["APP_ID"], config["MESSAGE"])
+                for config in app["config"]
+            ),
+        )
+        for app in apps
+    )
+
+
+def rows_to_apps(rows: tuple[AppRow, ...]) -> list[dict[str, Any]]:
+    """Convert compact rows back to the list of app dicts used throughout pyvizio."""
+    return [
+        {
+            "name": name,
+            "country": [sys.intern(country) for country in countries],
+            "id": list(ids),
+            "config": [
+                {"NAME_SPACE": name_space, "APP_ID": app_id, "MESSAGE": message}
+                for name_space, app_id, message in configs
+            ],
+        }
+        for name, countries, ids, configs in rows
+    ]
+
+
+def compile_apps(apps: list[dict[str, Any]], path: str | Path) -> None:
+    """Write precompiled apps artifact that `load_bundled_apps` reads in place of JSON."""
+    Path(path).write_bytes(marshal.dumps((APPS_MARSHAL_FORMAT, apps_to_rows(apps))))
+
+
+def _load_apps_json() -> list[dict[str, Any]]:
+    """Load apps list from bundled JSON data."""
+    ref = resources.files(__name__).joinpath(APPS_JSON_FILE)
+    return rows_to_apps(apps_to_rows(json.loads(ref.read_text(encoding="utf-8"))))
+
+
+@cache
+def load_bundled_apps() -> list[dict[str, Any]]:
+    """Load bundled apps list on first use, preferring the precompiled artifact."""
+    ref = resources.files(__name__).joinpath(APPS_MARSHAL_FILE)
+    try:
+        version, rows = marshal.loads(ref.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return _load_apps_json()
+
+    if version != APPS_MARSHAL_FORMAT:
+        return _load_apps_json()
+
+    return rows_to_apps(rows)
@@ -0,0 +1,460 @@
+"""Merged zeroconf and SSDP discovery of Vizio SmartCast devices, one-shot or continuous."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Callable
+
+from aiohttp import ClientSession
+from zeroconf import IPVersion, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
+
+from pyvizio.const import DEFAULT_TIMEOUT
+from pyvizio.discovery.ssdp import (
+    SSDP_DIAL_SERVICE,
+    SSDP_GROUP,
+    SSDPDescriptionCache,
+    SSDPDevice,
+    SSDPNotify,
+    async_confirm_device,
+    async_discover as async_discover_ssdp,
+    async_listen,
+    get_description_cache,
+)
+from pyvizio.discovery.zeroconf import (
+    VIZIO_SERVICE_TYPE,
+    ZeroconfDevice,
+    async_discover as async_discover_zeroconf,
+    info_to_device,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_ADDED = "added"
+DEVICE_UPDATED = "updated"
+DEVICE_REMOVED = "removed"
+
+SSDP_BYEBYE = "ssdp:byebye"
+# Minimum max-age UPnP allows, used for devices found by searching
+SSDP_DEFAULT_MAX_AGE = 1800
+
+# How often devices that stopped advertising over SSDP are checked for expiry
+EXPIRY_INTERVAL = 30
+
+
+class DiscoveredDevice:
+    """Vizio device seen via zeroconf and/or SSDP."""
+
+    def __init__(
+        self,
+        ip: str,
+        name: str | None = None,
+        port: int | None = None,
+        model: str | None = None,
+        id: str | None = None,
+        udn: str | None = None,
+    ) -> None:
+        self.ip = ip
+        self.name = name
+        self.port = port
+        self.model = model
+        self.id = id
+        self.udn = udn
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__dict__})"
+
+    def __eq__(self, other) -> bool:
+        return self is other or self.__dict__ == other.__dict__
+
+    @property
+    def host(self) -> str:
+        """Address to pass to VizioAsync (`ip:port` when the port is known)."""
+        return f"{self.ip}:{self.port}" if self.port else self.ip
+
+
+class _TableEntry:
+    """Device table row tracking which sources currently advertise the device."""
+
+    __slots__ = ("device", "ssdp_expires", "udn", "zeroconf_name")
+
+    def __init__(self, device: DiscoveredDevice) -> None:
+        self.device = device
+        self.zeroconf_name: str | None = None
+        self.udn: str | None = None
+        self.ssdp_expires: float | None = None
+
+
+DeviceEvent = tuple[str, DiscoveredDevice]
+
+
+class DeviceTable:
+    """Vizio devices merged from zeroconf and SSDP observations.
+
+    Observations are matched to a known device by the source's own key
+    (zeroconf service name or SSDP UDN), then by device ID or UDN, then by IP.
+    Every change returns the `(event, device)` it caused, or None if nothing
+    changed. A device is removed once no source advertises it anymore.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty device table."""
+        self._entries: list[_TableEntry] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.devices})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def devices(self) -> list[DiscoveredDevice]:
+        """Return devices currently in the table."""
+        return [entry.device for entry in self._entries]
+
+    def _find(
+        self,
+        zeroconf_name: str | None = None,
+        udn: str | None = None,
+        id: str | None = None,
+        ip: str | None = None,
+    ) -> _TableEntry | None:
+        """Return entry matching the most specific key given."""
+        for matches in (
+            lambda entry: zeroconf_name and entry.zeroconf_name == zeroconf_name,
+            lambda entry: udn and entry.udn == udn,
+            lambda entry: id and entry.device.id == id,
+            lambda entry: udn and entry.device.udn == udn,
+            lambda entry: ip and entry.device.ip == ip,
+        ):
+            for entry in self._entries:
+                if matches(entry):
+                    return entry
+        return None
+
+    def _upsert(
+        self, entry: _TableEntry | None, ip: str, **fields: str | int | None
+    ) -> tuple[_TableEntry, DeviceEvent | None]:
+        """Add device or update its fields, returning the entry and resulting event."""
+        if entry is None:
+            entry = _TableEntry(DiscoveredDevice(ip, **fields))  # type: ignore[arg-type]
+            self._entries.append(entry)
+            return entry, (DEVICE_ADDED, entry.device)
+
+        device = entry.device
+        changed = device.ip != ip
+        device.ip = ip
+        for key, value in fields.items():
+            if value is not None and getattr(device, key) != value:
+                setattr(device, key, value)
+                changed = True
+        return entry, (DEVICE_UPDATED, device) if changed else None
+
+    def update_zeroconf(
+        self, zeroconf_name: str, device: ZeroconfDevice
+    ) -> DeviceEvent | None:
+        """Add or update device from a resolved zeroconf service."""
+        entry = self._find(zeroconf_name=zeroconf_name, id=device.id, ip=device.ip)
+        entry, event = self._upsert(
+            entry,
+            device.ip,
+            name=device.name,
+            port=device.port or None,
+            model=device.model or None,
+            id=device.id or None,
+        )
+        entry.zeroconf_name = zeroconf_name
+        return event
+
+    def update_ssdp(
+        self, device: SSDPDevice, max_age: int | None = None
+    ) -> DeviceEvent | None:
+        """Add or update device from a confirmed SSDP description."""
+        entry = self._find(udn=device.udn, ip=device.ip)
+        # Zeroconf names and models are more specific, only fill in what's missing
+        entry, event = self._upsert(
+            entry,
+            device.ip,
+            name=None if entry and entry.device.name else device.name,
+            model=None if entry and entry.device.model else device.model,
+            udn=device.udn,
+        )
+        entry.udn = device.udn
+        entry.ssdp_expires = time.time() + max_age if max_age else None
+        return event
+
+    def remove_zeroconf(self, zeroconf_name: str) -> DeviceEvent | None:
+        """Forget zeroconf service, removing its device if SSDP doesn't advertise it."""
+        entry = self._find(zeroconf_name=zeroconf_name)
+        if entry is None:
+            return None
+        entry.zeroconf_name = None
+        return self._remove_if_unadvertised(entry)
+
+    def remove_ssdp(self, udn: str) -> DeviceEvent | None:
+        """Forget SSDP device, removing it if zeroconf doesn't advertise it."""
+        entry = self._find(udn=udn)
+        if entry is None or entry.udn is None:
+            return None
+        entry.udn = None
+        entry.ssdp_expires = None
+        return self._remove_if_unadvertised(entry)
+
+    def expire(self, now: float | None = None) -> list[DeviceEvent]:
+        """Forget SSDP devices whose last advertisement is older than its max-age."""
+        now = time.time() if now is None else now
+        events = []
+        for entry in list(self._entries):
+            if entry.udn and entry.ssdp_expires and entry.ssdp_expires <= now:
+                event = self.remove_ssdp(entry.udn)
+                if event:
+                    events.append(event)
+        return events
+
+    def _remove_if_unadvertised(self, entry: _TableEntry) -> DeviceEvent | None:
+        """Remove entry once neither source advertises it."""
+        if entry.zeroconf_name or entry.udn:
+            return None
+        self._entries.remove(entry)
+        return (DEVICE_REMOVED, entry.device)
+
+
+async def async_discover(
+    timeout: float = DEFAULT_TIMEOUT,
+    session: ClientSession | None = None,
+    aiozc: AsyncZeroconf | None = None,
+    ssdp_cache: SSDPDescriptionCache | None = None,
+) -> list[DiscoveredDevice]:
+    """Discover Vizio devices using zeroconf and SSDP at the same time.
+
+    Both searches share the same `timeout` window. Devices found by both are
+    merged (port and ID from zeroconf, UDN from SSDP). If one source fails,
+    the devices found by the other are still returned.
+    """
+    table = DeviceTable()
+
+    async def async_discover_zc() -> None:
+        async for device in async_discover_zeroconf(
+            VIZIO_SERVICE_TYPE, timeout=timeout, aiozc=aiozc
+        ):
+            table.update_zeroconf(device.name, device)
+
+    async def async_discover_ssdp_devices() -> None:
+        async for device in async_discover_ssdp(
+            SSDP_DIAL_SERVICE, timeout=timeout, session=session, cache=ssdp_cache
+        ):
+            table.update_ssdp(device)
+
+    results = await asyncio.gather(
+        async_discover_zc(), async_discover_ssdp_devices(), return_exceptions=True
+    )
+    for source, result in zip(("zeroconf", "SSDP"), results):
+        if isinstance(result, Exception):
+            _LOGGER.warning("Unable to discover devices using %s: %s", source, result)
+
+    return table.devices
+
+
+class DiscoveryService:
+    """Long-running discovery keeping a live table of Vizio devices.
+
+    Zeroconf service updates and SSDP advertisements (NOTIFY alive/byebye) are
+    listened to passively, so IP and port changes are picked up without
+    repeating active discovery. Listeners added with `add_listener` are called
+    with `(event, device)` whenever a device is added, updated or removed.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession | None = None,
+        aiozc: AsyncZeroconf | None = None,
+        ssdp_cache: SSDPDescriptionCache | None = None,
+        zeroconf: bool = True,
+        ssdp: bool = True,
+        search: bool = True,
+        ssdp_address: tuple[str, int] = SSDP_GROUP,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize discovery service.
+
+        Set `zeroconf` or `ssdp` to False to skip a source and `search` to
+        False to skip the SSDP search sent on start.
+        """
+        self._session = session
+        self._aiozc = aiozc
+        self._owns_aiozc = aiozc is None
+        self._ssdp_cache = ssdp_cache
+        self._use_zeroconf = zeroconf
+        self._use_ssdp = ssdp
+        self._search = search
+        self._ssdp_address = ssdp_address
+        self.timeout = timeout
+        self.table = DeviceTable()
+        self._listeners: list[Callable[[str, DiscoveredDevice], None]] = []
+        self._browser: AsyncServiceBrowser | None = None
+        self._ssdp_transport: asyncio.DatagramTransport | None = None
+        self._local_session: ClientSession | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._running = False
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(running={self._running}, devices={len(self.table)})"
+        )
+
+    async def __aenter__(self) -> DiscoveryService:
+        await self.async_start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.async_stop()
+
+    @property
+    def devices(self) -> list[DiscoveredDevice]:
+        """Return devices currently known to be on the network."""
+        return self.table.devices
+
+    def add_listener(
+        self, callback: Callable[[str, DiscoveredDevice], None]
+    ) -> Callable[[], None]:
+        """Call `callback(event, device)` on every device change. Return function to remove it."""
+        self._listeners.append(callback)
+        return lambda: self._listeners.remove(callback)
+
+    async def async_start(self) -> None:
+        """Start listening for devices."""
+        if self._running:
+            return
+        self._running = True
+
+        if self._session is None or self._session.closed:
+            self._session = self._local_session = ClientSession()
+
+        if self._use_zeroconf:
+            if self._aiozc is None:
+                self._aiozc = AsyncZeroconf(ip_version=IPVersion.V4Only)
+            self._browser = AsyncServiceBrowser(
+                self._aiozc.zeroconf,
+                VIZIO_SERVICE_TYPE,
+                handlers=[self._on_zeroconf_change],
+            )
+
+        if self._use_ssdp:
+            try:
+                self._ssdp_transport = await async_listen(
+                    self._on_ssdp_notify, self._ssdp_address
+                )
+            except OSError as err:
+                _LOGGER.warning("Unable to listen for SSDP advertisements: %s", err)
+            if self._search:
+                self._create_task(self._async_search_ssdp())
+            self._create_task(self._async_expire_ssdp())
+
+    async def async_stop(self) -> None:
+        """Stop listening for devices. The device table is kept as it was."""
+        if not self._running:
+            return
+        self._running = False
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        if self._ssdp_transport is not None:
+            self._ssdp_transport.close()
+            self._ssdp_transport = None
+        if self._browser is not None:
+            await self._browser.async_cancel()
+            self._browser = None
+        if self._aiozc is not None and self._owns_aiozc:
+            await self._aiozc.async_close()
+            self._aiozc = None
+        if self._local_session is not None:
+            await self._local_session.close()
+            self._session = self._local_session = None
+
+    def _create_task(self, coro) -> None:
+        """Run coroutine in the background until the service stops."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _fire(self, event: DeviceEvent | None) -> None:
+        """Pass device change to every listener."""
+        if event is None:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(*event)
+            except Exception:
+                _LOGGER.exception("Error in discovery listener %s", callback)
+
+    def _on_zeroconf_change(
+        self,
+        zeroconf: Zeroconf,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        """Resolve added or updated services and forget removed ones."""
+        if state_change is ServiceStateChange.Removed:
+            self._fire(self.table.remove_zeroconf(name))
+        else:
+            self._create_task(self._async_resolve_zeroconf(service_type, name))
+
+    async def _async_resolve_zeroconf(self, service_type: str, name: str) -> None:
+        """Resolve zeroconf service and add or update its device."""
+        info = AsyncServiceInfo(service_type, name)
+        if self._aiozc is None or not await info.async_request(
+            self._aiozc.zeroconf, self.timeout * 1000
+        ):
+            return
+        device = info_to_device(info)
+        if device is not None:
+            self._fire(self.table.update_zeroconf(name, device))
+
+    @property
+    def _cache(self) -> SSDPDescriptionCache:
+        """SSDP description cache used by this service."""
+        if self._ssdp_cache is not None:
+            return self._ssdp_cache
+        return get_description_cache()
+
+    def _on_ssdp_notify(self, notify: SSDPNotify) -> None:
+        """Confirm alive DIAL devices and forget ones saying byebye."""
+        if notify.nt != SSDP_DIAL_SERVICE or not notify.usn:
+            return
+
+        if notify.nts == SSDP_BYEBYE:
+            self._fire(self.table.remove_ssdp(notify.usn.split("::")[0]))
+        elif notify.location:
+            self._create_task(self._async_confirm_ssdp(notify))
+
+    async def _async_confirm_ssdp(self, notify: SSDPNotify) -> None:
+        """Add or update device advertised over SSDP if it's a Vizio device."""
+        if self._session is None:
+            return
+        device = await async_confirm_device(
+            self._session, notify, self._cache, self.timeout
+        )
+        if device is not None:
+            self._fire(self.table.update_ssdp(device, notify.max_age))
+
+    async def _async_search_ssdp(self) -> None:
+        """Actively search for SSDP devices once, to fill the table on start."""
+        async for device in async_discover_ssdp(
+            SSDP_DIAL_SERVICE,
+            timeout=self.timeout,
+            session=self._session,
+            cache=self._cache,
+        ):
+            self._fire(self.table.update_ssdp(device, SSDP_DEFAULT_MAX_AGE))
+
+    async def _async_expire_ssdp(self) -> None:
+        """Periodically forget SSDP devices that stopped advertising."""
+        while True:
+            await asyncio.sleep(EXPIRY_INTERVAL)
+            for event in self.table.expire():
+                self._fire(event)
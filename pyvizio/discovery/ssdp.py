@@ -15,16 +15,61 @@ from __future__ import annotations
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
+import asyncio
+from collections.abc import AsyncIterator
 import http.client
 import io
+import ipaddress
+import json
+import logging
+import os
+from pathlib import Path
+import random
+import re
 import socket
+import time
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+import ifaddr
 
 from pyvizio.const import DEFAULT_TIMEOUT
+from pyvizio.helpers import slots_to_dict
+
+_LOGGER = logging.getLogger(__name__)
+
+SSDP_GROUP = ("239.255.255.250", 1900)
+SSDP_DIAL_SERVICE = "urn:dial-multiscreen-org:device:dial:1"
+SSDP_MULTICAST_TTL = 2
+VIZIO_MANUFACTURER = "VIZIO"
+
+# Times an M-SEARCH is sent per search
+SEARCH_RETRIES = 3
+# Seconds between M-SEARCH attempts, stretched by up to SEARCH_JITTER
+SEARCH_INTERVAL = 1.0
+SEARCH_JITTER = 0.5
+# Receive buffer large enough for a burst of responses from a busy network
+SEARCH_RECEIVE_BUFFER = 256 * 1024
+
+M_SEARCH_MESSAGE = "\r\n".join(
+    [
+        "M-SEARCH * HTTP/1.1",
+        "HOST: {0}:{1}",
+        'MAN: "ssdp:discover"',
+        "ST: {st}",
+        "MX: {mx}",
+        "",
+        "",
+    ]
+)
 
 
 class SSDPDevice:
     """Representation of Vizio device discovered via SSDP."""
 
+    __slots__ = ("ip", "name", "model", "udn")
+
     def __init__(self, ip, name, model, udn) -> None:
         self.ip = ip
         self.name = name
@@ -32,10 +77,16 @@ class SSDPDevice:
         self.udn = udn
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
+
+
+def _parse_max_age(cache: str | None) -> int | None:
+    """Return number of seconds from the value of a cache-control max-age directive."""
+    match = re.match(r"\s*(\d+)", cache or "")
+    return int(match.group(1)) if match else None
 
 
 class SSDPResponse:
@@ -56,6 +107,11 @@ class SSDPResponse:
         self.st = r.getheader("st")
         self.cache = r.getheader("cache-control").split("=")[1]
 
+    @property
+    def max_age(self) -> int | None:
+        """Number of seconds the response (and the description it points to) stays valid."""
+        return _parse_max_age(self.cache)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.__dict__})"
 
@@ -63,34 +119,472 @@ class SSDPResponse:
         return self is other or self.__dict__ == other.__dict__
 
 
-def discover(service, timeout=DEFAULT_TIMEOUT, retries=1, mx=3):
-    """Return all discovered SSDP services of a given service name over given timeout period."""
-    group = ("239.255.255.250", 1900)
-    message = "\r\n".join(
-        [
-            "M-SEARCH * HTTP/1.1",
-            "HOST: {0}:{1}",
-            'MAN: "ssdp:discover"',
-            "ST: {st}",
-            "MX: {mx}",
-            "",
-            "",
+class SSDPNotify:
+    """SSDP advertisement (NOTIFY) message."""
+
+    def __init__(self, message: bytes) -> None:
+        """Initialize SSDP advertisement, raising ValueError if it isn't one."""
+        start_line, _, headers_raw = message.partition(b"\r\n")
+        if not start_line.upper().startswith(b"NOTIFY "):
+            raise ValueError("Not an SSDP NOTIFY message")
+
+        headers = http.client.parse_headers(io.BytesIO(headers_raw))
+        self.location = headers.get("location")
+        self.usn = headers.get("usn")
+        self.nt = headers.get("nt")
+        self.nts = headers.get("nts")
+        self.cache = headers.get("cache-control", "").partition("=")[2]
+
+    @property
+    def max_age(self) -> int | None:
+        """Number of seconds the advertisement (and the description it points to) stays valid."""
+        return _parse_max_age(self.cache)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__dict__})"
+
+    def __eq__(self, other) -> bool:
+        return self is other or self.__dict__ == other.__dict__
+
+
+class SSDPDescriptionCache:
+    """Parsed device descriptions keyed by (USN, location), each valid for its max-age.
+
+    Locations that don't describe a Vizio device are cached too (as None), so
+    other DIAL devices are rejected without fetching their description again.
+    Set `path` to persist the cache between processes.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """Initialize description cache, loading persisted entries from `path`."""
+        self.path = Path(path) if path is not None else None
+        self._entries: dict[tuple[str, str], tuple[float, SSDPDevice | None]] = {}
+        self._load()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={self.path!r}, entries={len(self._entries)})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, response: SSDPResponse | SSDPNotify) -> bool:
+        return self._get_entry(response) is not None
+
+    def get(self, response: SSDPResponse | SSDPNotify) -> SSDPDevice | None:
+        """Return cached device for response (None if not cached or not a Vizio device)."""
+        entry = self._get_entry(response)
+        return entry[1] if entry else None
+
+    def set(
+        self, response: SSDPResponse | SSDPNotify, device: SSDPDevice | None
+    ) -> None:
+        """Cache parsed description for response's max-age (nothing is cached without one)."""
+        if not response.max_age or response.location is None:
+            return
+        self._entries[(response.usn or "", response.location)] = (
+            time.time() + response.max_age,
+            device,
+        )
+
+    def clear(self) -> None:
+        """Remove all cached descriptions."""
+        self._entries.clear()
+
+    def _get_entry(
+        self, response: SSDPResponse | SSDPNotify
+    ) -> tuple[float, SSDPDevice | None] | None:
+        """Return unexpired entry for response, dropping it if it has expired."""
+        if response.location is None:
+            return None
+        key = (response.usn or "", response.location)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del self._entries[key]
+            return None
+        return entry
+
+    def _load(self) -> None:
+        """Load unexpired entries persisted by `save`."""
+        if self.path is None:
+            return
+
+        now = time.time()
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            for usn, location, expires, device in data:
+                if expires > now:
+                    self._entries[(usn, location)] = (
+                        expires,
+                        SSDPDevice(**device) if device else None,
+                    )
+        except (OSError, ValueError, TypeError) as err:
+            _LOGGER.debug("Unable to load SSDP description cache: %s", err)
+
+    def save(self) -> None:
+        """Atomically persist unexpired entries to `path`, if set."""
+        if self.path is None:
+            return
+
+        now = time.time()
+        data = [
+            [usn, location, expires, slots_to_dict(device) if device else None]
+            for (usn, location), (expires, device) in self._entries.items()
+            if expires > now
         ]
+        tmp_file = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_file, self.path)
+        except OSError as err:
+            _LOGGER.debug("Unable to persist SSDP description cache: %s", err)
+
+
+_DESCRIPTION_CACHE: SSDPDescriptionCache | None = None
+
+
+def get_description_cache() -> SSDPDescriptionCache:
+    """Return the SSDP description cache shared by all discoveries in this process."""
+    global _DESCRIPTION_CACHE
+    if _DESCRIPTION_CACHE is None:
+        _DESCRIPTION_CACHE = SSDPDescriptionCache()
+    return _DESCRIPTION_CACHE
+
+
+def set_description_cache(cache: SSDPDescriptionCache | None) -> None:
+    """Replace the shared SSDP description cache (None restores the default on next use)."""
+    global _DESCRIPTION_CACHE
+    _DESCRIPTION_CACHE = cache
+
+
+def parse_description(location: str, description: str) -> SSDPDevice | None:
+    """Return SSDPDevice for a device description XML document, or None if it isn't a Vizio device."""
+    import xmltodict
+
+    try:
+        data: dict[str, Any] = xmltodict.parse(description)
+    except Exception:  # xmltodict raises expat errors for malformed documents
+        return None
+
+    if not isinstance(data.get("root"), dict) or "device" not in data["root"]:
+        return None
+
+    root = data["root"]["device"]
+    if not isinstance(root, dict) or root.get("manufacturer") != VIZIO_MANUFACTURER:
+        return None
+
+    return SSDPDevice(
+        urlsplit(location).hostname,
+        root.get("friendlyName"),
+        root.get("modelName"),
+        root.get("UDN"),
     )
-    socket.setdefaulttimeout(timeout)
+
+
+def discover(service, timeout=DEFAULT_TIMEOUT, retries=SEARCH_RETRIES, mx=3):
+    """Return all discovered SSDP services of a given service name over given timeout period."""
     responses = {}
-    for _ in range(retries):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+
+    def on_response(response: SSDPResponse) -> None:
+        responses.setdefault(response.location, response)
+
+    asyncio.run(
+        async_search(on_response, service, timeout=timeout, retries=retries, mx=mx)
+    )
+    return list(responses.values())
+
+
+def get_ipv4_interfaces() -> list[str]:
+    """Return addresses of local non-loopback IPv4 interfaces ("" if none are found)."""
+    addresses = [
+        ip.ip
+        for adapter in ifaddr.get_adapters()
+        for ip in adapter.ips
+        # IPv4 addresses are always str (IPv6 ones are tuples)
+        if isinstance(ip.ip, str)
+        and ip.is_IPv4
+        and not ipaddress.IPv4Address(ip.ip).is_loopback
+    ]
+    return list(dict.fromkeys(addresses)) or [""]
+
+
+def _create_search_socket(interface: str) -> socket.socket:
+    """Return non-blocking socket sending multicast searches out of `interface`."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SEARCH_RECEIVE_BUFFER)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, SSDP_MULTICAST_TTL)
+        if interface:
+            sock.setsockopt(
+                socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+            )
+        sock.bind((interface, 0))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class SSDPSearchProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol passing parsed M-SEARCH responses to a callback."""
+
+    def __init__(self, func: Callable[[SSDPResponse], None]) -> None:
+        """Initialize SSDP search protocol with function callback."""
+        self._func = func
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Parse SSDP response and pass it to callback, ignoring malformed ones."""
+        try:
+            response = SSDPResponse(data)
+        except (http.client.HTTPException, AttributeError, IndexError) as err:
+            _LOGGER.debug("Ignoring invalid SSDP response from %s: %r", addr[0], err)
+            return
+
+        if response.location:
+            self._func(response)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors without stopping the search."""
+        _LOGGER.debug("SSDP search socket error: %r", exc)
+
+
+class SSDPNotifyProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol passing parsed SSDP advertisements to a callback."""
+
+    def __init__(self, func: Callable[[SSDPNotify], None]) -> None:
+        """Initialize SSDP advertisement protocol with function callback."""
+        self._func = func
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Parse SSDP advertisement and pass it to callback, ignoring anything else."""
+        try:
+            notify = SSDPNotify(data)
+        except (http.client.HTTPException, ValueError):
+            # M-SEARCH requests from other control points share the group
+            return
+
+        if notify.usn:
+            self._func(notify)
+
+    def error_received(self, exc: Exception) -> None:
+        """Log socket errors without stopping to listen."""
+        _LOGGER.debug("SSDP listen socket error: %r", exc)
+
+
+async def async_listen(
+    func: Callable[[SSDPNotify], None], address: tuple[str, int] = SSDP_GROUP
+) -> asyncio.DatagramTransport:
+    """Start passing SSDP advertisements received on `address` to `func`.
+
+    Close the returned transport to stop listening.
+    """
+    host, port = address
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    try:
+        sock.setblocking(False)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
-        message_bytes = message.format(*group, st=service, mx=mx).encode("utf-8")
-        sock.sendto(message_bytes, group)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        if ipaddress.ip_address(host).is_multicast:
+            sock.bind(("", port))
+            sock.setsockopt(
+                socket.IPPROTO_IP,
+                socket.IP_ADD_MEMBERSHIP,
+                socket.inet_aton(host) + socket.inet_aton("0.0.0.0"),
+            )
+        else:
+            sock.bind(address)
+    except OSError:
+        sock.close()
+        raise
+
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+        lambda: SSDPNotifyProtocol(func), sock=sock
+    )
+    return transport
+
+
+async def _async_fetch_text(
+    session: ClientSession, location: str, timeout: float
+) -> str | None:
+    """Fetch device description document, or return None if it can't be fetched."""
+    try:
+        async with session.get(
+            location, ssl=False, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            return await response.text()
+    except (ClientError, asyncio.TimeoutError, UnicodeDecodeError) as err:
+        _LOGGER.debug("Unable to fetch SSDP description %s: %r", location, err)
+        return None
+
+
+async def async_fetch_description(
+    session: ClientSession, location: str, timeout: float = DEFAULT_TIMEOUT
+) -> SSDPDevice | None:
+    """Fetch device description and return SSDPDevice if it describes a Vizio device."""
+    description = await _async_fetch_text(session, location, timeout)
+    if description is None:
+        return None
+    return parse_description(location, description)
+
+
+async def async_confirm_device(
+    session: ClientSession,
+    response: SSDPResponse | SSDPNotify,
+    cache: SSDPDescriptionCache,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> SSDPDevice | None:
+    """Return Vizio device described at response's location, from `cache` if possible."""
+    if response.location is None:
+        return None
+    if response in cache:
+        return cache.get(response)
+
+    description = await _async_fetch_text(session, response.location, timeout)
+    if description is None:
+        return None
+
+    device = parse_description(response.location, description)
+    cache.set(response, device)
+    return device
+
+
+async def async_search(
+    func: Callable[[SSDPResponse], None],
+    service: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    retries: int = SEARCH_RETRIES,
+    mx: int = 3,
+    address: tuple[str, int] = SSDP_GROUP,
+    interfaces: list[str] | None = None,
+) -> None:
+    """Pass every response to an SSDP search to `func` until `timeout` expires.
+
+    Multicast searches are sent from every local IPv4 interface (or just
+    `interfaces` if provided) at once and repeated `retries` times at staggered
+    intervals, since a single UDP datagram is easily lost. Responses from all
+    interfaces and attempts are passed on as they arrive, duplicates included.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    if not ipaddress.ip_address(address[0]).is_multicast:
+        # Unicast searches are routed normally, one socket is enough
+        interfaces = [""]
+    elif interfaces is None:
+        interfaces = await loop.run_in_executor(None, get_ipv4_interfaces)
+
+    transports: list[asyncio.DatagramTransport] = []
+    for interface in interfaces:
+        try:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: SSDPSearchProtocol(func),
+                sock=_create_search_socket(interface),
+            )
+        except OSError as err:
+            _LOGGER.debug("Unable to search for SSDP devices on %s: %r", interface, err)
+            continue
+        transports.append(transport)
 
+    # Leave the last attempt enough time to be answered
+    interval = min(SEARCH_INTERVAL, timeout / max(retries, 1) / 2)
+    try:
+        for attempt in range(max(retries, 1)):
+            if attempt:
+                await asyncio.sleep(interval * random.uniform(1, 1 + SEARCH_JITTER))
+            # Devices delay responses by up to MX seconds, keep them inside timeout
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            message = M_SEARCH_MESSAGE.format(
+                *SSDP_GROUP, st=service, mx=max(1, min(mx, int(remaining)))
+            ).encode("utf-8")
+            for transport in transports:
+                transport.sendto(message, address)
+        await asyncio.sleep(max(deadline - loop.time(), 0))
+    finally:
+        for transport in transports:
+            transport.close()
+
+
+async def async_discover(
+    service: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    mx: int = 3,
+    session: ClientSession | None = None,
+    address: tuple[str, int] = SSDP_GROUP,
+    cache: SSDPDescriptionCache | None = None,
+    retries: int = SEARCH_RETRIES,
+    interfaces: list[str] | None = None,
+) -> AsyncIterator[SSDPDevice]:
+    """Yield Vizio devices responding to an SSDP search as soon as they are confirmed.
+
+    The search is sent as described in `async_search`, and each location is
+    only confirmed the first time it responds on any interface.
+
+    Descriptions still valid in `cache` (the shared one if not provided) are
+    reused. The rest are fetched concurrently over `session` (a temporary one
+    is created if not provided) and added to the cache.
+    """
+    if cache is None:
+        cache = get_description_cache()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    local_session = None
+    if session is None or session.closed:
+        session = local_session = ClientSession()
+
+    found: asyncio.Queue[SSDPDevice | None] = asyncio.Queue()
+    pending: set[asyncio.Task[None]] = set()
+    seen_locations: set[str] = set()
+
+    async def async_confirm(response: SSDPResponse) -> None:
+        """Queue device described at location, or None if it isn't a Vizio device."""
+        found.put_nowait(
+            await async_confirm_device(
+                session, response, cache, max(deadline - loop.time(), 0)
+            )
+        )
+
+    def on_response(response: SSDPResponse) -> None:
+        """Confirm location the first time it responds."""
+        if response.location in seen_locations:
+            return
+        seen_locations.add(response.location)
+        task = loop.create_task(async_confirm(response))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    search = loop.create_task(
+        async_search(
+            on_response,
+            service,
+            timeout=timeout,
+            retries=retries,
+            mx=mx,
+            address=address,
+            interfaces=interfaces,
+        )
+    )
+
+    try:
         while True:
             try:
-                response = SSDPResponse(sock.recv(1024))
-                responses[response.location] = response
-            except socket.timeout:
-                break
+                device = await asyncio.wait_for(
+                    found.get(), max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                return
 
-        return list(responses.values())
+            if device is not None:
+                yield device
+    finally:
+        search.cancel()
+        await asyncio.gather(search, return_exceptions=True)
+        for task in pending:
+            task.cancel()
+        if local_session is not None:
+            await local_session.close()
+        cache.save()
@@ -0,0 +1,142 @@
+"""Vizio SmartCast device discovery by sweeping a subnet with unicast probes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+import ipaddress
+from itertools import product
+import logging
+
+from aiohttp import ClientSession
+
+from pyvizio import async_guess_device_type
+from pyvizio.api._protocol import EXTRACT_MODEL, async_invoke_api
+from pyvizio.api.item import GetDeviceInfoCommand
+from pyvizio.const import (
+    DEFAULT_PORTS,
+    DEFAULT_TIMEOUT,
+    DEVICE_CLASS_SPEAKER,
+    DEVICE_CLASS_TV,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Connection attempts in flight at once
+SWEEP_CONCURRENCY = 256
+# Seconds to wait for a TCP connection before treating a port as closed
+CONNECT_TIMEOUT = 0.5
+
+
+class SweepDevice:
+    """Representation of Vizio device found by a subnet sweep."""
+
+    def __init__(self, ip: str, port: int, model: str | None, device_type: str) -> None:
+        self.ip = ip
+        self.port = port
+        self.model = model
+        self.device_type = device_type
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__dict__})"
+
+    def __eq__(self, other) -> bool:
+        return self is other or self.__dict__ == other.__dict__
+
+    @property
+    def host(self) -> str:
+        """Address to pass to VizioAsync."""
+        return f"{self.ip}:{self.port}"
+
+
+def _hosts(network: str) -> Iterator[str]:
+    """Return addresses to probe in network (every address for /31 and /32)."""
+    net = ipaddress.IPv4Network(network, strict=False)
+    hosts = net.hosts() if net.num_addresses > 2 else iter(net)
+    return (str(host) for host in hosts)
+
+
+async def _async_port_open(ip: str, port: int, timeout: float) -> bool:
+    """Return whether or not a TCP connection to ip:port can be opened."""
+    try:
+        _reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, port), timeout
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return True
+
+
+async def async_probe(
+    ip: str,
+    port: int,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: ClientSession | None = None,
+) -> SweepDevice | None:
+    """Return SweepDevice if the SmartCast API answers on ip:port without auth."""
+    host = f"{ip}:{port}"
+    device_info = await async_invoke_api(
+        host,
+        GetDeviceInfoCommand(DEVICE_CLASS_TV),
+        _LOGGER,
+        custom_timeout=timeout,
+        log_api_exception=False,
+        session=session,
+    )
+    if device_info is None:
+        return None
+
+    model = EXTRACT_MODEL[DEVICE_CLASS_TV](device_info) or EXTRACT_MODEL[
+        DEVICE_CLASS_SPEAKER
+    ](device_info)
+    device_type = await async_guess_device_type(
+        ip, str(port), timeout=timeout, session=session, device_info=device_info
+    )
+    return SweepDevice(ip, port, model, device_type)
+
+
+async def async_sweep(
+    network: str,
+    ports: Iterable[int] = DEFAULT_PORTS,
+    concurrency: int = SWEEP_CONCURRENCY,
+    connect_timeout: float = CONNECT_TIMEOUT,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: ClientSession | None = None,
+) -> list[SweepDevice]:
+    """Discover Vizio devices in an IPv4 CIDR range without multicast.
+
+    Every address is probed on every port in `ports` with at most
+    `concurrency` connection attempts in flight. Open ports are confirmed with
+    an unauthenticated device info request.
+    """
+    targets = product(_hosts(network), list(ports))
+    found: list[SweepDevice] = []
+
+    async def async_worker(worker_session: ClientSession) -> None:
+        # Workers share one iterator so only `concurrency` probes exist at a time
+        for ip, port in targets:
+            if not await _async_port_open(ip, port, connect_timeout):
+                continue
+            device = await async_probe(ip, port, timeout, worker_session)
+            if device is not None:
+                found.append(device)
+
+    async def async_run(run_session: ClientSession) -> None:
+        await asyncio.gather(
+            *(async_worker(run_session) for _ in range(max(concurrency, 1)))
+        )
+
+    if session is None or session.closed:
+        async with ClientSession() as local_session:
+            await async_run(local_session)
+    else:
+        await async_run(session)
+
+    found.sort(key=lambda device: (ipaddress.IPv4Address(device.ip), device.port))
+    return found
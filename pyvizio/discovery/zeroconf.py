@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Collection
 import time
 from typing import Callable
 
-from zeroconf import IPVersion, ServiceBrowser, ServiceInfo, ServiceListener, Zeroconf
+from zeroconf import (
+    IPVersion,
+    ServiceBrowser,
+    ServiceInfo,
+    ServiceListener,
+    ServiceStateChange,
+    Zeroconf,
+)
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
 from pyvizio.const import DEFAULT_TIMEOUT
+from pyvizio.helpers import slots_to_dict
+
+VIZIO_SERVICE_TYPE = "_viziocast._tcp.local."
 
 
 class ZeroconfDevice:
+    """Representation of Vizio device discovered via zeroconf."""
+
+    __slots__ = ("name", "ip", "port", "model", "id")
+
     def __init__(self, name: str, ip: str, port: int, model: str, id: str) -> None:
         self.name = name
         self.ip = ip
@@ -19,18 +36,27 @@ class ZeroconfDevice:
         self.id = id
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}({self.__dict__})"
+        return f"{type(self).__name__}({slots_to_dict(self)})"
 
     def __eq__(self, other) -> bool:
-        return self is other or self.__dict__ == other.__dict__
+        return self is other or slots_to_dict(self) == slots_to_dict(other)
 
 
 class ZeroconfListener(ServiceListener):
     """Basic zeroconf listener."""
 
-    def __init__(self, func: Callable[[ServiceInfo], None]) -> None:
-        """Initialize zeroconf listener with function callback."""
+    def __init__(
+        self,
+        func: Callable[[ServiceInfo], None],
+        remove_func: Callable[[str], None] | None = None,
+    ) -> None:
+        """Initialize zeroconf listener with function callbacks.
+
+        `func` gets the resolved info of added and updated services and
+        `remove_func` the name of removed ones.
+        """
         self._func = func
+        self._remove_func = remove_func
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.__dict__})"
@@ -46,43 +72,138 @@ class ZeroconfListener(ServiceListener):
 
     def remove_service(self, zeroconf: Zeroconf, type: str, name: str) -> None:
         """Callback function when zeroconf service is removed."""
+        if self._remove_func is not None:
+            self._remove_func(name)
 
     def update_service(self, zeroconf: Zeroconf, type: str, name: str) -> None:
         """Callback function when zeroconf service is updated."""
+        self.add_service(zeroconf, type, name)
+
+
+def info_to_device(info: ServiceInfo) -> ZeroconfDevice | None:
+    """Return ZeroconfDevice for resolved service info (None if it has no IPv4 address)."""
+    addresses = info.parsed_addresses(IPVersion.V4Only)
+    if not addresses:
+        return None
+
+    name = info.name[: -(len(info.type) + 1)]
+    port = info.port or 0
+    model_raw = info.properties.get(b"name", b"")
+    model = (
+        model_raw.decode("utf-8") if isinstance(model_raw, bytes) else str(model_raw)
+    )
+    id_raw = info.properties.get(b"id")
+
+    # handle id decode for various discovered use cases
+    id_str: str | None = None
+    if isinstance(id_raw, bytes):
+        try:
+            int(id_raw, 16)
+            id_str = id_raw.decode("utf-8")
+        except Exception:
+            id_str = id_raw.hex()
+
+    return ZeroconfDevice(name, addresses[0], port, model, id_str or "")
 
 
 def discover(service_type: str, timeout: int = DEFAULT_TIMEOUT) -> list[ZeroconfDevice]:
     """Return all discovered zeroconf services of a given service type over given timeout period."""
-    services = []
+    services: dict[str, ZeroconfDevice] = {}
 
     def append_service(info: ServiceInfo) -> None:
-        """Append discovered zeroconf service to service list."""
-        name = info.name[: -(len(info.type) + 1)]
-        ip = info.parsed_addresses(IPVersion.V4Only)[0]
-        port = info.port or 0
-        model_raw = info.properties.get(b"name", b"")
-        model = (
-            model_raw.decode("utf-8")
-            if isinstance(model_raw, bytes)
-            else str(model_raw)
-        )
-        id_raw = info.properties.get(b"id")
-
-        # handle id decode for various discovered use cases
-        id_str: str | None = None
-        if isinstance(id_raw, bytes):
-            try:
-                int(id_raw, 16)
-                id_str = id_raw.decode("utf-8")
-            except Exception:
-                id_str = id_raw.hex()
+        """Add or replace discovered zeroconf service in services."""
+        service = info_to_device(info)
+        if service is not None:
+            services[info.name] = service
 
-        service = ZeroconfDevice(name, ip, port, model, id_str or "")
-        services.append(service)
+    def remove_service(name: str) -> None:
+        """Drop zeroconf service that went away before discovery ended."""
+        services.pop(name, None)
 
     zeroconf = Zeroconf()
-    ServiceBrowser(zeroconf, service_type, ZeroconfListener(append_service))
+    ServiceBrowser(
+        zeroconf, service_type, ZeroconfListener(append_service, remove_service)
+    )
     time.sleep(timeout)
     zeroconf.close()
 
-    return services
+    return list(services.values())
+
+
+async def async_discover(
+    service_type: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    expected_count: int | None = None,
+    expected_ids: Collection[str] | None = None,
+    aiozc: AsyncZeroconf | None = None,
+) -> AsyncIterator[ZeroconfDevice]:
+    """Yield zeroconf services of a given service type as soon as they are resolved.
+
+    Services are resolved concurrently. Discovery stops when `timeout` seconds
+    have passed, once `expected_count` services have been yielded, or once every
+    ID in `expected_ids` has been seen, whichever comes first. Pass `aiozc` to
+    reuse a running AsyncZeroconf instance instead of starting a new one.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    owns_aiozc = aiozc is None
+    if aiozc is None:
+        aiozc = AsyncZeroconf(ip_version=IPVersion.V4Only)
+
+    found: asyncio.Queue[ZeroconfDevice | None] = asyncio.Queue()
+    pending: set[asyncio.Task[None]] = set()
+    seen_names: set[str] = set()
+    remaining_ids = set(expected_ids or ())
+
+    async def async_resolve(name: str) -> None:
+        """Resolve service and queue it, or queue None if it can't be resolved."""
+        info = AsyncServiceInfo(service_type, name)
+        time_left_ms = max(deadline - loop.time(), 0) * 1000
+        device = None
+        if await info.async_request(aiozc.zeroconf, time_left_ms):
+            device = info_to_device(info)
+        found.put_nowait(device)
+
+    def on_service_state_change(
+        zeroconf: Zeroconf,
+        service_type: str,
+        name: str,
+        state_change: ServiceStateChange,
+    ) -> None:
+        """Start resolving services the first time they are announced."""
+        if state_change is not ServiceStateChange.Added or name in seen_names:
+            return
+        seen_names.add(name)
+        task = loop.create_task(async_resolve(name))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    browser = AsyncServiceBrowser(
+        aiozc.zeroconf, service_type, handlers=[on_service_state_change]
+    )
+    try:
+        yielded = 0
+        while True:
+            try:
+                device = await asyncio.wait_for(
+                    found.get(), max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                return
+
+            if device is None:
+                continue
+
+            yield device
+            yielded += 1
+            remaining_ids.discard(device.id)
+            if (expected_count is not None and yielded >= expected_count) or (
+                expected_ids and not remaining_ids
+            ):
+                return
+    finally:
+        for task in pending:
+            task.cancel()
+        await browser.async_cancel()
+        if owns_aiozc:
+            await aiozc.async_close()
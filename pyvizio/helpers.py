@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from functools import wraps
 import sys
-from typing import Any
+from typing import Any, Callable
+
+Extractor = Callable[[Any], Any]
 
 # Fix for Windows ProactorEventLoop cleanup issue causing
 # "RuntimeError: Event loop is closed" on exit.
@@ -24,6 +27,15 @@ def async_to_sync(f):
     return wrapper
 
 
+def slots_to_dict(obj: Any) -> dict[str, Any]:
+    """Return attributes of an object whose class uses `__slots__`, like `__dict__`."""
+    return {
+        name: getattr(obj, name)
+        for cls in reversed(type(obj).__mro__)
+        for name in cls.__dict__.get("__slots__", ())
+    }
+
+
 def dict_get_case_insensitive(
     in_dict: dict[str, Any], key: str, default_return: Any = None
 ) -> Any:
@@ -48,6 +60,73 @@ def get_value_from_path(
     return None
 
 
+def compile_key_getter(key: str) -> Extractor:
+    """Return function doing a case insensitive lookup of `key` in a dict.
+
+    Upper and lower case spellings are tried directly before falling back to
+    comparing every key, so the common case doesn't copy the dict like
+    `dict_get_case_insensitive`. Returns None if `key` is missing or the
+    object isn't a dict.
+    """
+    lower = key.lower()
+    spellings = tuple(dict.fromkeys((key.upper(), lower, key)))
+
+    def get(obj: Any) -> Any:
+        if not isinstance(obj, dict):
+            return None
+        for spelling in spellings:
+            if spelling in obj:
+                return obj[spelling]
+        for k, v in obj.items():
+            if isinstance(k, str) and k.lower() == lower:
+                return v
+        return None
+
+    return get
+
+
+def _compile_index_getter(index: int) -> Extractor:
+    """Return function getting item at `index` of a list, or None."""
+
+    def get(obj: Any) -> Any:
+        if isinstance(obj, list) and -len(obj) <= index < len(obj):
+            return obj[index]
+        return None
+
+    return get
+
+
+def compile_extractor(paths: Sequence[Sequence[str | int]]) -> Extractor:
+    """Return function walking `paths` through nested dicts and lists once compiled.
+
+    Steps are dict keys (matched case insensitively) or list indexes. The
+    value at the end of the first path to resolve to something other than
+    None is returned, otherwise None.
+    """
+    compiled = tuple(
+        tuple(
+            _compile_index_getter(step)
+            if isinstance(step, int)
+            else compile_key_getter(step)
+            for step in path
+        )
+        for path in paths
+    )
+
+    def extract(obj: Any) -> Any:
+        for getters in compiled:
+            value = obj
+            for getter in getters:
+                value = getter(value)
+                if value is None:
+                    break
+            else:
+                return value
+        return None
+
+    return extract
+
+
 # Adapted from https://gist.github.com/betrcode/0248f0fda894013382d7#gistcomment-3161499
 async def open_port(host, port):
     """Return whether or not host's port is open.
@@ -0,0 +1,234 @@
+"""Run scripts of Vizio commands against one device over a single session."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+import inspect
+import json
+import shlex
+import time
+from typing import Any
+
+from pyvizio import VizioAsync
+from pyvizio.errors import VizioError, VizioInvalidParameterError
+
+# Trailing marker for a text command that runs in parallel with its neighbours
+PARALLEL_MARKER = "&"
+
+
+@dataclass(frozen=True)
+class ScriptCommand:
+    """VizioAsync method call parsed from one line of a script."""
+
+    line: int
+    method: str
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    parallel: bool = False
+
+    def __str__(self) -> str:
+        return " ".join(
+            [
+                self.method,
+                *(str(arg) for arg in self.args),
+                *(f"{key}={value}" for key, value in self.kwargs.items()),
+            ]
+        )
+
+
+@dataclass(frozen=True)
+class ScriptResult:
+    """Outcome of running one ScriptCommand."""
+
+    command: ScriptCommand
+    result: Any
+    elapsed: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether or not the command ran without raising or failing."""
+        return self.error is None
+
+
+def script_methods() -> list[str]:
+    """Return names of the VizioAsync methods a script can call."""
+    return sorted(
+        name
+        for name, raw in vars(VizioAsync).items()
+        if not name.startswith("_")
+        and callable(raw)
+        and not isinstance(raw, (staticmethod, classmethod))
+    )
+
+
+def _convert(value: str) -> int | str:
+    """Return text argument as int if it is one, like the `setting` command."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _parse_json_command(line: int, obj: Any) -> ScriptCommand:
+    """Return ScriptCommand for a JSON command object."""
+    if not isinstance(obj, dict) or not isinstance(obj.get("method"), str):
+        raise VizioInvalidParameterError(
+            f"line {line}: JSON commands need a 'method' string"
+        )
+    args = obj.get("args", [])
+    kwargs = obj.get("kwargs", {})
+    if not isinstance(args, list) or not isinstance(kwargs, dict):
+        raise VizioInvalidParameterError(
+            f"line {line}: 'args' must be a list and 'kwargs' an object"
+        )
+    return ScriptCommand(
+        line, obj["method"], tuple(args), kwargs, bool(obj.get("parallel", False))
+    )
+
+
+def _parse_text_command(line: int, text: str) -> ScriptCommand:
+    """Return ScriptCommand for a `method arg ... [&]` line."""
+    try:
+        words = shlex.split(text, comments=True)
+    except ValueError as err:
+        raise VizioInvalidParameterError(f"line {line}: {err}") from err
+
+    parallel = bool(words) and words[-1] == PARALLEL_MARKER
+    if parallel:
+        words.pop()
+    if not words:
+        raise VizioInvalidParameterError(f"line {line}: missing method name")
+
+    method, *rest = words
+    args = [_convert(word) for word in rest if "=" not in word]
+    kwargs = {
+        key: _convert(value)
+        for key, _, value in (word.partition("=") for word in rest if "=" in word)
+    }
+    return ScriptCommand(line, method, tuple(args), kwargs, parallel)
+
+
+def parse_script(text: str) -> list[ScriptCommand]:
+    """Parse script text into commands.
+
+    A script is either a JSON array of command objects or one command per
+    line. A line is a JSON object (`{"method": ..., "args": [...], "kwargs":
+    {...}, "parallel": true}`) or a method name followed by shell-quoted
+    arguments, where `key=value` words become keyword arguments and a
+    trailing `&` marks the command as parallel. Method names may use dashes
+    like the CLI commands. Blank lines and `#` comments are skipped.
+    """
+    stripped = text.strip()
+    if stripped.startswith("["):
+        try:
+            objs = json.loads(stripped)
+        except ValueError as err:
+            raise VizioInvalidParameterError(f"invalid JSON script: {err}") from err
+        commands = [
+            _parse_json_command(index, obj) for index, obj in enumerate(objs, 1)
+        ]
+    else:
+        commands = []
+        for index, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                try:
+                    obj = json.loads(line)
+                except ValueError as err:
+                    raise VizioInvalidParameterError(f"line {index}: {err}") from err
+                commands.append(_parse_json_command(index, obj))
+            else:
+                commands.append(_parse_text_command(index, line))
+
+    methods = script_methods()
+    parsed = []
+    for command in commands:
+        method = command.method.replace("-", "_")
+        if method not in methods:
+            raise VizioInvalidParameterError(
+                f"line {command.line}: unknown command '{command.method}'"
+            )
+        parsed.append(
+            ScriptCommand(
+                command.line, method, command.args, command.kwargs, command.parallel
+            )
+        )
+    return parsed
+
+
+def group_commands(commands: Iterable[ScriptCommand]) -> Iterator[list[ScriptCommand]]:
+    """Yield runs of consecutive parallel commands, and other commands on their own."""
+    group: list[ScriptCommand] = []
+    for command in commands:
+        if command.parallel:
+            group.append(command)
+            continue
+        if group:
+            yield group
+            group = []
+        yield [command]
+    if group:
+        yield group
+
+
+def _is_failure(method: str, result: Any) -> bool:
+    """Return whether or not a device API method's result means the call failed.
+
+    These methods return None when the request fails, and commands return
+    False when the device rejects them. Getters like `get_power_state` may
+    legitimately return False.
+    """
+    if result is None:
+        return True
+    return result is False and not method.startswith(("get_", "is_"))
+
+
+async def async_run_command(vizio: VizioAsync, command: ScriptCommand) -> ScriptResult:
+    """Run command and return its result and how long it took in seconds.
+
+    Methods that call the device API are run with `log_api_exception=False`
+    and fail the command when they return None (or False for commands).
+    """
+    start = time.perf_counter()
+    method = getattr(vizio, command.method)
+    kwargs = command.kwargs
+    calls_api = "log_api_exception" in inspect.signature(method).parameters
+    if calls_api:
+        kwargs = {"log_api_exception": False, **kwargs}
+    try:
+        result = method(*command.args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+    except (VizioError, TypeError, ValueError) as err:
+        return ScriptResult(command, None, time.perf_counter() - start, str(err))
+    if calls_api and _is_failure(command.method, result):
+        return ScriptResult(
+            command, result, time.perf_counter() - start, "command failed"
+        )
+    return ScriptResult(command, result, time.perf_counter() - start)
+
+
+async def async_run_script(
+    vizio: VizioAsync, commands: Iterable[ScriptCommand], stop_on_error: bool = False
+) -> list[ScriptResult]:
+    """Run commands in order, running each group of parallel commands at once.
+
+    Results are returned in script order. When `stop_on_error` is set, no
+    further groups start after a command fails.
+    """
+    await vizio.connect()
+
+    results: list[ScriptResult] = []
+    for group in group_commands(commands):
+        group_results = await asyncio.gather(
+            *(async_run_command(vizio, command) for command in group)
+        )
+        results.extend(group_results)
+        if stop_on_error and not all(result.ok for result in group_results):
+            break
+    return results
@@ -0,0 +1,142 @@
+"""Shared event loop thread that synchronous pyvizio calls are multiplexed onto."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+from collections.abc import Coroutine
+from functools import wraps
+import threading
+from typing import Any, Callable, TypeVar
+
+from aiohttp import ClientSession
+
+_T = TypeVar("_T")
+
+
+class SyncRunner:
+    """Event loop running in a daemon thread on behalf of synchronous callers.
+
+    Calls from any thread are scheduled onto the one loop, so they share its
+    connection pool and per-device request semaphores. The loop thread is
+    started on first use and can be restarted after `stop`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize runner without starting its loop thread."""
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # Only touched from the loop thread
+        self._session: ClientSession | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(running={self.is_running})"
+
+    @property
+    def is_running(self) -> bool:
+        """Return whether or not the loop thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return runner's loop, starting its thread if needed."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name="pyvizio", daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Run loop until stopped, then close it."""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+    def run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run coroutine on the loop thread and block until it returns."""
+        loop = self._get_loop()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Can't block on the pyvizio loop from its own thread")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def get_session(self) -> ClientSession:
+        """Return session shared by every call. Must be called on the loop thread."""
+        if self._session is None or self._session.closed:
+            self._session = ClientSession()
+        return self._session
+
+    def get_semaphore(self, key: str, limit: int) -> asyncio.Semaphore:
+        """Return semaphore limiting concurrent requests to the device `key`.
+
+        The first caller for a device sets its limit. Must be called on the
+        loop thread.
+        """
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(limit)
+        return self._semaphores[key]
+
+    async def _async_close(self) -> None:
+        """Cancel outstanding tasks, close shared session and forget semaphores."""
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+        self._session = None
+        self._semaphores.clear()
+
+    def stop(self) -> None:
+        """Close shared session and stop the loop thread if it is running."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None or thread is None:
+            return
+
+        if thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._async_close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+
+_RUNNER: SyncRunner | None = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def get_sync_runner() -> SyncRunner:
+    """Return the runner shared by all synchronous calls in this process."""
+    global _RUNNER
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _RUNNER = SyncRunner()
+            atexit.register(_RUNNER.stop)
+        return _RUNNER
+
+
+def set_sync_runner(runner: SyncRunner | None) -> None:
+    """Replace the shared runner (None restores the default on next use)."""
+    global _RUNNER
+    with _RUNNER_LOCK:
+        _RUNNER = runner
+
+
+def run_on_sync_runner(f: Callable[..., Coroutine[Any, Any, _T]]) -> Callable[..., _T]:
+    """Decorator to run async function as sync on the shared runner's loop."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return get_sync_runner().run(f(*args, **kwargs))
+
+    return wrapper
@@ -2,53 +2,99 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession, ClientTimeout
 
+from pyvizio.const import DEFAULT_TIMEOUT
 from pyvizio.util.const import (
     APK_SOURCE_PATH,
     APP_NAMES_FILE,
     APP_NAMES_URL,
     APP_PAYLOADS_FILE,
     APP_PAYLOADS_URL,
+    MAX_APPS_RESPONSE_SIZE,
     RESOURCE_PATH,
 )
 
+READ_CHUNK_SIZE = 64 * 1024
+
+
+async def async_read_json(
+    response: ClientResponse, max_size: int = MAX_APPS_RESPONSE_SIZE
+) -> Any:
+    """Parse JSON from response byte stream, raising ValueError if it exceeds `max_size` bytes."""
+    if response.content_length is not None and response.content_length > max_size:
+        raise ValueError(
+            f"Response from {response.url} is {response.content_length} bytes, "
+            f"limit is {max_size}"
+        )
+
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+        body += chunk
+        if len(body) > max_size:
+            raise ValueError(f"Response from {response.url} exceeds {max_size} bytes")
+
+    return json.loads(body)
+
+
+async def async_get_json(
+    session: ClientSession,
+    url: str,
+    headers: dict[str, str] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_size: int = MAX_APPS_RESPONSE_SIZE,
+) -> Any:
+    """GET a JSON document with its own timeout and size limit."""
+    async with session.get(
+        url,
+        headers=headers or {"Content-Type": "application/json"},
+        raise_for_status=True,
+        timeout=ClientTimeout(total=timeout),
+    ) as response:
+        return await async_read_json(response, max_size)
+
 
 async def gen_apps_list_from_url(
     app_names_url: str = APP_NAMES_URL,
     app_payloads_url: str = APP_PAYLOADS_URL,
     session: ClientSession | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_size: int = MAX_APPS_RESPONSE_SIZE,
 ) -> list[dict[str, Any]] | None:
-    """Get app JSON files from external URLs and return list of apps for use in pyvizio."""
-    headers = {"Content-Type": "application/json"}
+    """Get app JSON files from external URLs and return list of apps for use in pyvizio.
+
+    Both files are fetched concurrently, each with its own `timeout` (in seconds)
+    and `max_size` (in bytes) limit.
+    """
+
+    async def fetch_all(
+        active_session: ClientSession,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        app_names, app_configs = await asyncio.gather(
+            async_get_json(
+                active_session, app_names_url, timeout=timeout, max_size=max_size
+            ),
+            async_get_json(
+                active_session, app_payloads_url, timeout=timeout, max_size=max_size
+            ),
+        )
+        return app_names, app_configs
+
     try:
         if session:
-            response = await session.get(
-                app_names_url, headers=headers, raise_for_status=True
-            )
-            app_names = await response.json(content_type=None)
-            response = await session.get(
-                app_payloads_url, headers=headers, raise_for_status=True
-            )
-            app_configs = await response.json(content_type=None)
+            app_names, app_configs = await fetch_all(session)
         else:
             async with ClientSession() as local_session:
-                response = await local_session.get(
-                    app_names_url, headers=headers, raise_for_status=True
-                )
-                app_names = await response.json(content_type=None)
-                response = await local_session.get(
-                    app_payloads_url, headers=headers, raise_for_status=True
-                )
-                app_configs = await response.json(content_type=None)
-
-        return gen_apps_list(app_names, app_configs)
-    except ClientError:
+                app_names, app_configs = await fetch_all(local_session)
+    except (ClientError, asyncio.TimeoutError, ValueError):
         return None
 
+    return gen_apps_list(app_names, app_configs)
+
 
 def gen_apps_list_from_src(
     apk_source_path: str = APK_SOURCE_PATH, resource_path: str = RESOURCE_PATH
@@ -13,3 +13,6 @@ APP_PAYLOADS_FILE = "apps_availability.json"
 APP_NAMES_URL = "http://scfs.vizio.com/appservice/vizio_apps_prod.json"
 # DEFAULT_AVAILABILITY_PATH_PROD
 APP_PAYLOADS_URL = "http://scfs.vizio.com/appservice/app_availability_prod.json"
+
+# Upper bound for each app JSON file; the real files are a few hundred KB
+MAX_APPS_RESPONSE_SIZE = 4 * 1024 * 1024
@@ -0,0 +1,109 @@
+"""Poll a Vizio device's state and report what changes between polls."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime
+import time
+from typing import Any
+
+from pyvizio import VizioAsync
+from pyvizio.const import DEVICE_CONFIGS
+
+DEFAULT_WATCH_INTERVAL = 1.0
+
+# State field and VizioAsync method polled for it
+WATCH_FIELDS = {
+    "power": "get_power_state",
+    "volume": "get_current_volume",
+    "mute": "is_muted",
+    "input": "get_current_input",
+    "app": "get_current_app",
+}
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    """Fields that changed between two polls of a device."""
+
+    time: datetime
+    latency: float
+    changes: dict[str, tuple[Any, Any]]
+
+    def __str__(self) -> str:
+        changes = ", ".join(
+            f"{name}: {old} -> {new}" for name, (old, new) in self.changes.items()
+        )
+        return (
+            f"{self.time.isoformat(timespec='milliseconds')} "
+            f"[{self.latency * 1000:.1f} ms] {changes}"
+        )
+
+
+def watch_fields(vizio: VizioAsync) -> list[str]:
+    """Return state fields that can be polled on vizio's device type."""
+    endpoints = DEVICE_CONFIGS[vizio.device_type].endpoints
+    return [
+        name for name in WATCH_FIELDS if name != "app" or "CURRENT_APP" in endpoints
+    ]
+
+
+async def async_poll_state(
+    vizio: VizioAsync, fields: list[str] | None = None
+) -> dict[str, Any]:
+    """Return current value of each state field, fetched concurrently.
+
+    Fields that couldn't be fetched are None.
+    """
+    if fields is None:
+        fields = watch_fields(vizio)
+    values = await asyncio.gather(
+        *(
+            getattr(vizio, WATCH_FIELDS[name])(log_api_exception=False)
+            for name in fields
+        )
+    )
+    return dict(zip(fields, values))
+
+
+async def async_watch(
+    vizio: VizioAsync,
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    count: int | None = None,
+    fields: list[str] | None = None,
+) -> AsyncIterator[WatchEvent]:
+    """Poll device every `interval` seconds and yield events for changes.
+
+    The first poll reports every field. Polls are scheduled on a fixed
+    cadence, so a slow poll delays only the next one. Stops after `count`
+    polls, or never if `count` is None.
+    """
+    if fields is None:
+        fields = watch_fields(vizio)
+    await vizio.connect()
+
+    loop = asyncio.get_running_loop()
+    next_poll = loop.time()
+    previous: dict[str, Any] = {}
+    polls = 0
+    while count is None or polls < count:
+        start = time.perf_counter()
+        state = await async_poll_state(vizio, fields)
+        latency = time.perf_counter() - start
+        polls += 1
+
+        changes = {
+            name: (previous.get(name), value)
+            for name, value in state.items()
+            if name not in previous or previous[name] != value
+        }
+        previous = state
+        if changes:
+            yield WatchEvent(datetime.now().astimezone(), latency, changes)
+
+        if count is not None and polls >= count:
+            break
+        next_poll = max(next_poll + interval, loop.time())
+        await asyncio.sleep(next_poll - loop.time())
@@ -1,10 +1,16 @@
 """Shared fixtures and mock response factories for pyvizio tests."""
 
+import json
+
 from aioresponses import aioresponses
 import pytest
 
 from pyvizio import Vizio, VizioAsync
 from pyvizio.api._protocol import ENDPOINT
+from pyvizio.catalog import AppCatalog, set_app_catalog
+from pyvizio.discovery.ssdp import SSDPDescriptionCache, set_description_cache
+from pyvizio.sync import SyncRunner, set_sync_runner
+from pyvizio.util.const import APP_NAMES_URL, APP_PAYLOADS_URL
 
 # Device configuration constants
 TV_IP = "192.168.1.100"
@@ -21,10 +27,55 @@ CRAVE_IP_PORT = f"{CRAVE_IP}:{CRAVE_PORT}"
 
 AUTH_TOKEN = "auth123"
 
+# Minimal app service documents (names and availability payloads)
+APP_NAMES = [{"id": "1", "name": "Netflix", "country": ["USA"]}]
+APP_PAYLOADS = [
+    {
+        "id": "1",
+        "chipsets": {
+            "mtk": [
+                {
+                    "app_type_payload": json.dumps(
+                        {"NAME_SPACE": 3, "APP_ID": "1", "MESSAGE": None}
+                    )
+                }
+            ]
+        },
+    }
+]
+
 
 # ---- Fixtures ----
 
 
+@pytest.fixture(autouse=True)
+def app_catalog(tmp_path):
+    """Give every test its own shared app catalog cached under a temp dir."""
+    catalog = AppCatalog(cache_dir=tmp_path / "cache")
+    set_app_catalog(catalog)
+    yield catalog
+    set_app_catalog(None)
+
+
+@pytest.fixture(autouse=True)
+def description_cache():
+    """Give every test its own shared SSDP description cache."""
+    cache = SSDPDescriptionCache()
+    set_description_cache(cache)
+    yield cache
+    set_description_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def sync_runner():
+    """Give every test its own shared sync runner and stop it afterwards."""
+    runner = SyncRunner()
+    set_sync_runner(runner)
+    yield runner
+    runner.stop()
+    set_sync_runner(None)
+
+
 @pytest.fixture
 def vizio_tv():
     return VizioAsync("pyvizio", TV_IP_PORT, "TV", AUTH_TOKEN, "tv")
@@ -97,6 +148,13 @@ def settings_url(device_type, ip_port, setting_type, setting_name=None):
     return base
 
 
+def mock_catalog_urls(mock_aio, etag=None, repeat=False):
+    """Mock both app service documents the app catalog is built from."""
+    headers = {"ETag": etag} if etag else None
+    mock_aio.get(APP_NAMES_URL, payload=APP_NAMES, headers=headers, repeat=repeat)
+    mock_aio.get(APP_PAYLOADS_URL, payload=APP_PAYLOADS, headers=headers, repeat=repeat)
+
+
 # ---- Response factories ----
 
 
@@ -1,7 +1,23 @@
 """Tests for AppConfig and find_app_name."""
 
-from pyvizio.api.apps import AppConfig, find_app_name
-from pyvizio.const import APP_CAST, APP_HOME, APPS, NO_APP_RUNNING, UNKNOWN_APP
+import pytest
+
+from pyvizio.api.apps import (
+    AppConfig,
+    AppIndex,
+    LaunchAppNameCommand,
+    find_app_name,
+    get_app_index,
+)
+from pyvizio.const import (
+    APP_CAST,
+    APP_HOME,
+    APPS,
+    DEVICE_CLASS_TV,
+    NO_APP_RUNNING,
+    UNKNOWN_APP,
+)
+from pyvizio.errors import VizioInvalidParameterError
 
 
 class TestAppConfig:
@@ -115,3 +131,92 @@ class TestFindAppName:
         ]
         config = AppConfig("5", 2, None)
         assert find_app_name(config, apps) == "DictApp"
+
+
+class TestAppIndex:
+    def test_matches_find_app_name_for_bundled_apps(self):
+        index = AppIndex(APPS)
+        for app in APPS:
+            for config in app["config"]:
+                app_config = AppConfig(config["APP_ID"], config["NAME_SPACE"])
+                assert index.find_app_name(app_config) == find_app_name(
+                    app_config, APPS
+                )
+
+    def test_first_definition_wins(self):
+        apps = [
+            {"name": "First", "config": [{"APP_ID": "1", "NAME_SPACE": 3}]},
+            {"name": "Second", "config": [{"APP_ID": "1", "NAME_SPACE": 3}]},
+        ]
+        assert AppIndex(apps).find_app_name(AppConfig("1", 3)) == "First"
+
+    def test_include_home(self):
+        config = AppConfig("1", 4, "http://127.0.0.1:12345/scfs/sctv/main.html")
+        assert AppIndex([]).find_app_name(config) == UNKNOWN_APP
+        assert AppIndex([], include_home=True).find_app_name(config) == APP_HOME["name"]
+
+    def test_index_reused_for_same_list(self):
+        assert get_app_index(APPS) is get_app_index(APPS)
+        assert get_app_index(APPS) is not get_app_index(APPS, include_home=True)
+
+    def test_index_rebuilt_when_list_grows(self):
+        apps = [{"name": "A", "config": [{"APP_ID": "1", "NAME_SPACE": 3}]}]
+        index = get_app_index(apps)
+        apps.append({"name": "B", "config": [{"APP_ID": "2", "NAME_SPACE": 3}]})
+        assert get_app_index(apps) is not index
+        assert get_app_index(apps).find_app_name(AppConfig("2", 3)) == "B"
+
+    def test_get_app_case_insensitive(self):
+        index = AppIndex(APPS)
+        assert index.get_app("netflix")["name"] == "Netflix"
+        assert index.get_app("NETFLIX")["name"] == "Netflix"
+        assert index.get_app("Netflx") is None
+
+    def test_get_app_fuzzy(self):
+        index = AppIndex(APPS)
+        assert index.get_app("Netflx", fuzzy=True)["name"] == "Netflix"
+        assert index.get_app("disney plus", fuzzy=True)["name"] == "Disney+"
+        assert index.get_app("zzzzzzzz", fuzzy=True) is None
+
+    def test_suggest_app_names_prefers_prefix(self):
+        apps = [
+            {"name": "Prime Video", "config": [{"APP_ID": "1", "NAME_SPACE": 3}]},
+            {"name": "Pluto TV", "config": [{"APP_ID": "2", "NAME_SPACE": 3}]},
+        ]
+        assert AppIndex(apps).suggest_app_names("prime")[0] == "Prime Video"
+        assert AppIndex(apps).suggest_app_names("plutotv") == ["Pluto TV"]
+
+    def test_app_names_by_country(self):
+        apps = [
+            {"name": "b", "country": ["usa"], "config": []},
+            {"name": "c", "country": ["*"], "config": []},
+            {"name": "a", "country": ["can", "usa"], "config": []},
+        ]
+        index = AppIndex(apps)
+        assert index.app_names() == ("a", "b", "c")
+        assert index.app_names("USA") == ("a", "b", "c")
+        assert index.app_names("can") == ("a", "c")
+        assert index.app_names("nowhere") == ("c",)
+
+    def test_app_names_match_filtering_bundled_apps(self):
+        index = AppIndex(APPS)
+        for country in {code for app in APPS for code in app["country"]}:
+            assert list(index.app_names(country)) == sorted(
+                app["name"]
+                for app in APPS
+                if "*" in app["country"] or country in app["country"]
+            )
+
+    def test_app_names_built_once(self):
+        index = AppIndex(APPS)
+        assert index.app_names("usa") is index.app_names("usa")
+
+
+class TestLaunchAppNameCommand:
+    def test_unknown_app_suggests_names(self):
+        with pytest.raises(VizioInvalidParameterError, match="Netflix"):
+            LaunchAppNameCommand(DEVICE_CLASS_TV, "Netflx", APPS)
+
+    def test_fuzzy_resolves_closest_app(self):
+        cmd = LaunchAppNameCommand(DEVICE_CLASS_TV, "Netflx", APPS, fuzzy=True)
+        assert cmd.VALUE.APP_ID == "1"
@@ -1,10 +1,14 @@
 """Tests for VizioAsync public API methods."""
 
+from unittest.mock import patch
+
 import pytest
 
-from pyvizio import VizioAsync
+from pyvizio import DEVICE_TYPE_UNKNOWN, VizioAsync
+from pyvizio.api import settings
 from pyvizio.api.apps import AppConfig
 from pyvizio.api.input import InputItem
+from pyvizio.api.item import Item, ItemView
 from pyvizio.api.pair import BeginPairResponse, PairChallengeResponse
 from pyvizio.const import (
     APP_HOME,
@@ -13,6 +17,7 @@ from pyvizio.const import (
     DEVICE_CLASS_TV,
     NO_APP_RUNNING,
 )
+from pyvizio.discovery.service import DiscoveredDevice
 from tests.conftest import (
     AUTH_TOKEN,
     TV_IP_PORT,
@@ -293,6 +298,12 @@ class TestPairing:
         assert isinstance(result, PairChallengeResponse)
         assert result.auth_token == "new_auth_token"
 
+    async def test_pair_responses_without_item(self, vizio_tv, mock_aio):
+        mock_aio.put(tv_url("BEGIN_PAIR"), payload=make_response())
+        mock_aio.put(tv_url("FINISH_PAIR"), payload=make_response())
+        assert await vizio_tv.start_pair() is None
+        assert await vizio_tv.pair(1, 54321, "1234") is None
+
     async def test_stop_pair(self, vizio_tv, mock_aio):
         mock_aio.put(tv_url("CANCEL_PAIR"), payload=make_response())
         result = await vizio_tv.stop_pair()
@@ -432,6 +443,50 @@ class TestSettings:
         result = await vizio_tv.get_setting_options("audio", "volume")
         assert result == {"min": 0, "max": 100}
 
+    async def test_get_setting_options_builds_only_matching_item(
+        self, vizio_tv, mock_aio, monkeypatch
+    ):
+        built = []
+
+        class TrackedItem(Item):
+            __slots__ = ()
+
+            def __init__(self, json_obj):
+                super().__init__(json_obj)
+                built.append(self.c_name)
+
+        monkeypatch.setattr(settings, "Item", TrackedItem)
+        mock_aio.get(
+            tv_settings_options_url("audio"),
+            payload=make_response(
+                items=[
+                    make_item(f"setting_{index}", index, item_type="T_VALUE_ABS_V1")
+                    for index in range(20)
+                ]
+                + [make_item("eq", "Normal", item_type="T_LIST_V1", ELEMENTS=["A"])]
+            ),
+        )
+        assert await vizio_tv.get_setting_options("audio", "eq") == ["A"]
+        assert built == ["eq"]
+
+    def test_item_view_case_insensitive(self):
+        view = ItemView({"cname": "volume", "Type": "T_VALUE_ABS_V1", "VALUE": 5})
+        assert view.c_name == "volume"
+        assert view.is_type("t_value_abs_v1")
+        assert view.get("value") == 5
+        assert view.get("missing", 0) == 0
+        assert Item(view) == Item(view.json_obj)
+
+    async def test_get_all_settings_skips_items_without_name(self, vizio_tv, mock_aio):
+        nameless = {"TYPE": "T_VALUE_ABS_V1", "VALUE": 3, "HASHVAL": 1}
+        mock_aio.get(
+            tv_settings_url("audio"),
+            payload=make_response(
+                items=[nameless, make_item("volume", 20, item_type="T_VALUE_ABS_V1")]
+            ),
+        )
+        assert await vizio_tv.get_all_settings("audio") == {"volume": 20}
+
     async def test_get_setting_options_xlist(self, vizio_tv, mock_aio):
         mock_aio.get(
             tv_settings_url("audio"),
@@ -572,6 +627,16 @@ class TestApps:
         result = await vizio_tv.launch_app("Netflix", apps_list=APPS)
         assert result is True
 
+    async def test_launch_app_unknown_no_request(self, vizio_tv, mock_aio):
+        result = await vizio_tv.launch_app("Netflx", apps_list=APPS)
+        assert result is False
+        assert not mock_aio.requests
+
+    async def test_launch_app_fuzzy(self, vizio_tv, mock_aio):
+        mock_aio.put(tv_url("LAUNCH_APP"), payload=make_response())
+        result = await vizio_tv.launch_app("netflx", apps_list=APPS, fuzzy=True)
+        assert result is True
+
     async def test_launch_app_config(self, vizio_tv, mock_aio):
         mock_aio.put(tv_url("LAUNCH_APP"), payload=make_response())
         result = await vizio_tv.launch_app_config("1", 3, None)
@@ -736,7 +801,7 @@ class TestGuessDeviceType:
         from pyvizio import async_guess_device_type
 
         ip = "192.168.1.50:9000"
-        url = settings_url("speaker", ip, "audio")
+        url = settings_url("speaker", ip, "audio", "volume")
         if status == 200:
             mock_aio.get(
                 url,
@@ -746,3 +811,82 @@ class TestGuessDeviceType:
             mock_aio.get(url, status=status)
         result = await async_guess_device_type(ip)
         assert result == expected
+
+    async def test_guess_unreachable_device_unknown(self, mock_aio):
+        from pyvizio import DEVICE_TYPE_UNKNOWN, async_guess_device_type
+
+        assert await async_guess_device_type("192.168.1.50", "9000") == (
+            DEVICE_TYPE_UNKNOWN
+        )
+
+    async def test_guess_without_probe(self, mock_aio):
+        from pyvizio import async_guess_device_type
+
+        assert await async_guess_device_type("192.168.1.50", "7345") == (
+            DEVICE_CLASS_TV
+        )
+        device_info = make_device_info_response({"MODEL_NAME": "V505"})["ITEMS"][0]
+        assert (
+            await async_guess_device_type(
+                "192.168.1.50", "9000", device_info=device_info
+            )
+            == DEVICE_CLASS_TV
+        )
+        assert not mock_aio.requests
+
+    @pytest.mark.parametrize(
+        "open_ports,expected",
+        [
+            ({9000}, DEVICE_CLASS_SPEAKER),
+            ({7345, 9000}, DEVICE_CLASS_TV),
+            (set(), DEVICE_TYPE_UNKNOWN),
+        ],
+    )
+    async def test_guess_without_port(self, mock_aio, open_ports, expected):
+        from pyvizio import async_guess_device_type
+
+        mock_aio.get(
+            settings_url("speaker", "192.168.1.50:9000", "audio", "volume"),
+            payload=make_settings_response([("volume", 10, "T_VALUE_ABS_V1", 1)]),
+        )
+
+        async def open_port(host, port):
+            return port in open_ports
+
+        with patch("pyvizio.open_port", open_port):
+            assert await async_guess_device_type("192.168.1.50") == expected
+
+    async def test_guess_device_types_batched_and_cached(self, mock_aio):
+        from pyvizio import (
+            DEVICE_TYPE_UNKNOWN,
+            async_guess_device_types,
+            clear_guessed_device_types,
+        )
+
+        speaker = DiscoveredDevice("192.168.1.50", port=9000, id="speaker-id")
+        tv = DiscoveredDevice("192.168.1.51", port=9000, id="tv-id")
+        mock_aio.get(
+            settings_url("speaker", speaker.host, "audio", "volume"),
+            payload=make_settings_response([("volume", 10, "T_VALUE_ABS_V1", 1)]),
+        )
+        mock_aio.get(settings_url("speaker", tv.host, "audio", "volume"), status=500)
+
+        try:
+            assert await async_guess_device_types([speaker, tv]) == [
+                DEVICE_CLASS_SPEAKER,
+                DEVICE_CLASS_TV,
+            ]
+            # Repeat scans are answered from the cache without any request
+            assert await async_guess_device_types([tv, speaker]) == [
+                DEVICE_CLASS_TV,
+                DEVICE_CLASS_SPEAKER,
+            ]
+            assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+            # Unreachable devices aren't remembered
+            offline = DiscoveredDevice("192.168.1.52", port=9000, id="offline-id")
+            assert await async_guess_device_types([offline]) == [DEVICE_TYPE_UNKNOWN]
+            assert await async_guess_device_types([offline]) == [DEVICE_TYPE_UNKNOWN]
+            assert sum(len(calls) for calls in mock_aio.requests.values()) == 4
+        finally:
+            clear_guessed_device_types()
@@ -0,0 +1,84 @@
+"""Tests for benchmarking SmartCast API endpoints."""
+
+from unittest.mock import AsyncMock, patch
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+import pytest
+
+from pyvizio import VizioAsync
+from pyvizio.bench import (
+    ConnectionStats,
+    async_bench,
+    async_bench_endpoint,
+    percentile,
+)
+from tests.conftest import make_power_response, tv_url
+
+
+@pytest.mark.parametrize(
+    "percent,expected", [(0, 1), (50, 5), (95, 10), (99, 10), (100, 10)]
+)
+def test_percentile(percent, expected):
+    assert percentile(list(range(1, 11)), percent) == expected
+
+
+def test_percentile_empty():
+    assert percentile([], 50) == 0.0
+
+
+class TestBenchEndpoint:
+    async def test_requests_and_errors(self, vizio_tv, mock_aio):
+        mock_aio.get(tv_url("POWER_MODE"), payload=make_power_response(0), repeat=5)
+        mock_aio.get(tv_url("POWER_MODE"), status=500, repeat=True)
+
+        stats = await async_bench_endpoint(vizio_tv, "power_mode", 8, concurrency=3)
+
+        assert stats.requests == 8
+        assert stats.errors == 3
+        assert stats.latency(50) <= stats.latency(99) <= stats.latency(100)
+        assert stats.throughput > 0
+
+    async def test_key_press_alternates(self, vizio_tv):
+        remote = AsyncMock(side_effect=[True, True, False])
+        with patch.object(VizioAsync, "remote", remote):
+            stats = await async_bench_endpoint(vizio_tv, "key_press", 3)
+
+        assert [call.args[0] for call in remote.await_args_list] == [
+            "VOL_UP",
+            "VOL_DOWN",
+            "VOL_UP",
+        ]
+        assert stats.errors == 1
+
+    async def test_bench_runs_each_endpoint(self, vizio_tv):
+        with (
+            patch.object(VizioAsync, "get_power_state", AsyncMock(return_value=True)),
+            patch.object(VizioAsync, "get_current_input", AsyncMock(return_value=None)),
+        ):
+            results = await async_bench(
+                vizio_tv, ["power_mode", "current_input"], requests=4
+            )
+
+        assert [(s.endpoint, s.requests, s.errors) for s in results] == [
+            ("power_mode", 4, 0),
+            ("current_input", 4, 4),
+        ]
+
+
+async def test_connection_stats():
+    async def handler(request):
+        return web.json_response(make_power_response(1))
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    connections = ConnectionStats()
+    async with (
+        TestServer(app) as server,
+        ClientSession(trace_configs=[connections.trace_config]) as session,
+    ):
+        for _ in range(3):
+            async with session.get(server.make_url("/")) as response:
+                await response.read()
+
+    assert (connections.created, connections.reused) == (1, 2)
@@ -0,0 +1,111 @@
+"""Tests for the shared app catalog."""
+
+import asyncio
+from datetime import timedelta
+
+from yarl import URL
+
+from pyvizio import VizioAsync
+from pyvizio.catalog import AppCatalog, get_app_catalog
+from pyvizio.const import APPS
+from pyvizio.util.const import APP_NAMES_URL, APP_PAYLOADS_URL
+from tests.conftest import (
+    TV_IP_PORT,
+    make_response,
+    mock_catalog_urls,
+    tv_url,
+)
+
+
+class TestAppCatalog:
+    def test_bundled_apps_before_first_fetch(self, tmp_path):
+        catalog = AppCatalog(cache_dir=tmp_path)
+        assert catalog.apps is APPS
+        assert catalog.is_stale()
+
+    async def test_fetch_and_persist(self, tmp_path, mock_aio):
+        mock_catalog_urls(mock_aio, etag='"v1"')
+        catalog = AppCatalog(cache_dir=tmp_path)
+
+        assert await catalog.async_refresh()
+        apps = catalog.apps
+
+        assert [app["name"] for app in apps] == ["Netflix"]
+        assert not catalog.is_stale()
+        assert catalog.cache_file.exists()
+
+        # A second process reuses the persisted copy without any request
+        other = AppCatalog(cache_dir=tmp_path)
+        assert not other.is_stale()
+        assert await other.async_get_apps() == apps
+        assert len(mock_aio.requests) == 2
+
+    async def test_stale_catalog_served_without_waiting(self, mock_aio):
+        mock_catalog_urls(mock_aio)
+        catalog = AppCatalog(cache_dir=None)
+
+        # Served immediately from the bundled list while refreshing in background
+        assert await catalog.async_get_apps() is APPS
+        assert await catalog.async_get_apps() is APPS
+        await catalog.async_refresh()
+
+        assert [app["name"] for app in await catalog.async_get_apps()] == ["Netflix"]
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    async def test_concurrent_refreshes_single_flight(self, mock_aio):
+        mock_catalog_urls(mock_aio)
+        catalog = AppCatalog(cache_dir=None)
+
+        results = await asyncio.gather(*(catalog.async_refresh() for _ in range(5)))
+
+        assert results == [True] * 5
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    async def test_conditional_refresh_not_modified(self, tmp_path, mock_aio):
+        mock_catalog_urls(mock_aio, etag='"v1"')
+        catalog = AppCatalog(cache_dir=tmp_path, ttl=timedelta(0))
+        await catalog.async_refresh()
+        apps = catalog.apps
+
+        mock_aio.get(APP_NAMES_URL, status=304)
+        mock_aio.get(APP_PAYLOADS_URL, status=304)
+        assert await catalog.async_refresh()
+
+        assert catalog.apps is apps
+        second_request = mock_aio.requests[("GET", URL(APP_NAMES_URL))][1]
+        assert second_request.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    async def test_offline_falls_back_to_bundled(self, tmp_path, mock_aio):
+        catalog = AppCatalog(cache_dir=tmp_path)
+        assert not await catalog.async_refresh()
+        assert catalog.apps is APPS
+        assert not catalog.is_stale()
+        assert not catalog.cache_file.exists()
+
+    async def test_offline_keeps_last_known(self, tmp_path, mock_aio):
+        mock_catalog_urls(mock_aio)
+        catalog = AppCatalog(cache_dir=tmp_path, ttl=timedelta(0))
+        await catalog.async_refresh()
+        apps = catalog.apps
+
+        assert not await catalog.async_refresh()
+        assert catalog.apps is apps
+
+    def test_corrupt_cache_ignored(self, tmp_path):
+        (tmp_path / "app_catalog.json").write_text("not json")
+        catalog = AppCatalog(cache_dir=tmp_path)
+        assert catalog.apps is APPS
+
+
+class TestSharedCatalog:
+    async def test_devices_share_one_fetch(self, mock_aio, vizio_tv):
+        mock_catalog_urls(mock_aio)
+        mock_aio.put(tv_url("LAUNCH_APP"), payload=make_response(), repeat=True)
+        other_tv = VizioAsync("other", TV_IP_PORT, "Other TV", "token", "tv")
+
+        assert await vizio_tv.launch_app("Netflix")
+        assert await other_tv.launch_app("Netflix")
+        await get_app_catalog()._refresh_task
+
+        assert len(mock_aio.requests[("GET", URL(APP_NAMES_URL))]) == 1
+        assert get_app_catalog().apps[0]["name"] == "Netflix"
@@ -1,5 +1,7 @@
 """Tests for pyvizio CLI commands."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from click.testing import CliRunner
@@ -9,7 +11,14 @@ from pyvizio.api.apps import AppConfig
 from pyvizio.api.input import InputItem
 from pyvizio.api.pair import BeginPairResponse, PairChallengeResponse
 from pyvizio.cli import cli
-from pyvizio.discovery.zeroconf import ZeroconfDevice
+from pyvizio.discovery.service import DiscoveredDevice
+from pyvizio.discovery.sweep import SweepDevice
+from tests.conftest import (
+    TV_IP_PORT,
+    make_power_response,
+    mock_catalog_urls,
+    tv_url,
+)
 
 
 def invoke(*args):
@@ -27,10 +36,10 @@ class TestCliHelp:
 
 
 class TestCliDiscover:
-    @patch("pyvizio.cli.VizioAsync.discovery_zeroconf")
+    @patch("pyvizio.cli.VizioAsync.discovery", new_callable=AsyncMock)
     def test_discover(self, mock_discover):
         mock_discover.return_value = [
-            ZeroconfDevice(
+            DiscoveredDevice(
                 name="LivingRoom",
                 ip="192.168.1.100",
                 port=7345,
@@ -42,6 +51,15 @@ class TestCliDiscover:
         assert result.exit_code == 0
         mock_discover.assert_called_once()
 
+    @patch("pyvizio.cli.async_sweep", new_callable=AsyncMock)
+    def test_discover_network(self, mock_sweep):
+        mock_sweep.return_value = [
+            SweepDevice("192.168.1.100", 7345, "V505", "tv"),
+        ]
+        result = invoke("discover", "--network", "192.168.1.0/24")
+        assert result.exit_code == 0
+        assert mock_sweep.await_args.args == ("192.168.1.0/24",)
+
 
 class TestCliKeyPressCommands:
     """Tests for CLI commands that map to simple key-press API calls."""
@@ -239,8 +257,13 @@ class TestCliSettings:
 
 
 class TestCliApps:
+    @patch(
+        "pyvizio.catalog.AppCatalog.async_refresh",
+        new_callable=AsyncMock,
+        return_value=False,
+    )
     @patch("pyvizio.cli.VizioAsync.get_apps_list", new_callable=AsyncMock)
-    def test_get_apps_list(self, mock_apps):
+    def test_get_apps_list(self, mock_apps, mock_refresh):
         mock_apps.return_value = ["Netflix", "Hulu"]
         result = invoke("get-apps-list")
         assert result.exit_code == 0
@@ -253,7 +276,12 @@ class TestCliApps:
             ("launch_app_config", ["launch-app-config", "1", "3"]),
         ],
     )
-    def test_launch_commands(self, method, cli_args):
+    @patch(
+        "pyvizio.catalog.AppCatalog.async_refresh",
+        new_callable=AsyncMock,
+        return_value=False,
+    )
+    def test_launch_commands(self, mock_refresh, method, cli_args):
         with patch(
             f"pyvizio.cli.VizioAsync.{method}",
             new_callable=AsyncMock,
@@ -263,8 +291,22 @@ class TestCliApps:
             assert result.exit_code == 0
             mock_method.assert_awaited_once()
 
+    def test_launch_app_uses_refreshed_catalog(self, mock_aio):
+        mock_catalog_urls(mock_aio)
+        with patch(
+            "pyvizio.cli.VizioAsync.launch_app",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as mock_launch:
+            result = invoke("launch-app", "Netflix")
+        assert result.exit_code == 0
+        apps_list = mock_launch.await_args.kwargs["apps_list"]
+        assert [app["name"] for app in apps_list] == ["Netflix"]
+
     @patch(
-        "pyvizio.cli.gen_apps_list_from_url", new_callable=AsyncMock, return_value=None
+        "pyvizio.catalog.AppCatalog.async_refresh",
+        new_callable=AsyncMock,
+        return_value=False,
     )
     @patch("pyvizio.cli.VizioAsync.get_current_app_config", new_callable=AsyncMock)
     def test_get_current_app(self, mock_config, mock_gen):
@@ -279,3 +321,236 @@ class TestCliApps:
         result = invoke("get-current-app-config")
         assert result.exit_code == 0
         mock_config.assert_awaited_once()
+
+
+class TestCliRun:
+    def test_run_script(self):
+        runner = CliRunner()
+        with (
+            patch(
+                "pyvizio.cli.VizioAsync.get_power_state",
+                new_callable=AsyncMock,
+                return_value=True,
+            ),
+            patch("pyvizio.cli.VizioAsync.vol_up", new_callable=AsyncMock) as mock_vol,
+        ):
+            result = runner.invoke(
+                cli,
+                ["--ip", "192.168.1.100:7345", "run", "--json"],
+                input="get-power-state\nvol_up 2 &\nvol_up 3 &\n",
+            )
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert [(row["line"], row["method"], row["ok"]) for row in rows] == [
+            (1, "get_power_state", True),
+            (2, "vol_up", True),
+            (3, "vol_up", True),
+        ]
+        assert rows[0]["result"] is True
+        assert [call.args for call in mock_vol.await_args_list] == [(2,), (3,)]
+
+    def test_run_failure_exit_code(self):
+        result = CliRunner().invoke(
+            cli, ["--ip", "192.168.1.100:7345", "run"], input="pow_on too many\n"
+        )
+        assert result.exit_code == 1
+
+    def test_run_unreachable_device(self, mock_aio):
+        result = CliRunner().invoke(
+            cli,
+            ["--ip", "192.168.1.100:7345", "--auth", "token", "run", "--json"],
+            input="pow_on\n",
+        )
+        assert result.exit_code == 1
+        row = json.loads(result.output.splitlines()[0])
+        assert (row["ok"], row["error"]) == (False, "command failed")
+
+    def test_run_unknown_command(self):
+        result = CliRunner().invoke(
+            cli, ["--ip", "192.168.1.100:7345", "run"], input="self_destruct\n"
+        )
+        assert result.exit_code == 2
+        assert "unknown command 'self_destruct'" in result.output
+
+
+class TestCliFanOut:
+    """Tests for running one command against several devices."""
+
+    IPS = ["--ip", "192.168.1.100:7345", "--ip", "192.168.1.101:7345"]
+
+    def test_requires_device(self):
+        result = CliRunner().invoke(cli, ["get-power-state"])
+        assert result.exit_code == 2
+        assert "--inventory" in result.output
+
+    def test_multiple_ips_ndjson(self):
+        async def pow_off(vizio, *args, **kwargs):
+            return vizio.ip.startswith("192.168.1.100")
+
+        with patch("pyvizio.cli.VizioAsync.pow_off", pow_off):
+            result = CliRunner().invoke(
+                cli, [*self.IPS, "--output", "ndjson", "power", "off"]
+            )
+        assert result.exit_code == 1
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert [(row["ip"], row["ok"], row["output"]) for row in rows] == [
+            ("192.168.1.100:7345", True, ["Turning OFF", "OK"]),
+            ("192.168.1.101:7345", False, ["Turning OFF", "ERROR"]),
+        ]
+        assert rows[1]["error"] == "ERROR"
+
+    def test_unreachable_device_fails(self, mock_aio):
+        mock_aio.get(tv_url("POWER_MODE"), payload=make_power_response(1))
+        result = CliRunner().invoke(
+            cli,
+            [
+                "--ip",
+                TV_IP_PORT,
+                "--ip",
+                "127.0.0.1:1",
+                "--auth",
+                "token",
+                "--output",
+                "ndjson",
+                "get-power-state",
+            ],
+        )
+        assert result.exit_code == 1
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert [(row["ip"], row["ok"]) for row in rows] == [
+            (TV_IP_PORT, True),
+            ("127.0.0.1:1", False),
+        ]
+        assert rows[1]["error"].startswith("Failed to execute command")
+
+    def test_inventory_table(self, tmp_path):
+        inventory = tmp_path / "devices.csv"
+        inventory.write_text(
+            "ip,device_type,auth\n"
+            "# lobby\n"
+            "192.168.1.102:7345,speaker,\n"
+            "192.168.1.103:7345,,secret\n"
+        )
+        vizios = []
+
+        async def get_power_state(vizio, *args, **kwargs):
+            vizios.append(vizio)
+            return True
+
+        with patch("pyvizio.cli.VizioAsync.get_power_state", get_power_state):
+            result = CliRunner().invoke(
+                cli,
+                [
+                    *self.IPS,
+                    "--auth",
+                    "token",
+                    "--inventory",
+                    str(inventory),
+                    "get-power-state",
+                ],
+            )
+        assert result.exit_code == 0
+        assert result.output.count("Device is on") == 4
+        assert sorted(
+            (vizio.ip, vizio.device_type, vizio._auth_token) for vizio in vizios
+        ) == [
+            ("192.168.1.100:7345", "tv", "token"),
+            ("192.168.1.101:7345", "tv", "token"),
+            ("192.168.1.102:7345", "speaker", "token"),
+            ("192.168.1.103:7345", "tv", "secret"),
+        ]
+
+    def test_invalid_inventory(self, tmp_path):
+        inventory = tmp_path / "devices.csv"
+        inventory.write_text("ip,device_type\n192.168.1.102,fridge\n")
+        result = CliRunner().invoke(cli, ["--inventory", str(inventory), "play"])
+        assert result.exit_code == 2
+        assert "invalid device_type 'fridge'" in result.output
+
+    def test_max_concurrent_devices(self):
+        running = 0
+        peak = 0
+
+        async def pow_on(vizio, *args, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return True
+
+        ips = [arg for n in range(10) for arg in ("--ip", f"192.168.1.{n}:7345")]
+        with patch("pyvizio.cli.VizioAsync.pow_on", pow_on):
+            result = CliRunner().invoke(
+                cli, [*ips, "--max_concurrent_devices", "3", "power", "on"]
+            )
+        assert result.exit_code == 0
+        assert peak == 3
+
+    def test_sync_command(self):
+        result = CliRunner().invoke(cli, [*self.IPS, "get-volume-max"])
+        assert result.exit_code == 0
+        assert result.output.count("Max volume: 100") == 2
+
+
+class TestCliWatch:
+    def test_watch_json(self):
+        with (
+            patch(
+                "pyvizio.cli.VizioAsync.get_power_state",
+                new_callable=AsyncMock,
+                side_effect=[False, True],
+            ),
+            patch(
+                "pyvizio.cli.VizioAsync.get_current_volume",
+                new_callable=AsyncMock,
+                return_value=10,
+            ),
+            patch(
+                "pyvizio.cli.VizioAsync.is_muted",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "pyvizio.cli.VizioAsync.get_current_input",
+                new_callable=AsyncMock,
+                return_value="HDMI-1",
+            ),
+            patch(
+                "pyvizio.cli.VizioAsync.get_current_app",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+        ):
+            result = invoke("watch", "--interval", "0.1", "--count", "2", "--json")
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.output.splitlines()]
+        assert len(rows) == 2
+        assert rows[0]["changes"]["volume"] == {"old": None, "new": 10}
+        assert rows[1]["changes"] == {"power": {"old": False, "new": True}}
+        assert rows[1]["ip"] == "192.168.1.100:7345"
+
+
+class TestCliBench:
+    @patch(
+        "pyvizio.cli.VizioAsync.get_power_state",
+        new_callable=AsyncMock,
+        return_value=False,
+    )
+    def test_bench_json(self, mock_power):
+        result = invoke(
+            "bench",
+            "--endpoint",
+            "power_mode",
+            "--requests",
+            "6",
+            "--concurrency",
+            "2",
+            "--json",
+        )
+        assert result.exit_code == 0
+        (row,) = [json.loads(line) for line in result.output.splitlines()]
+        assert row["endpoint"] == "power_mode"
+        assert (row["requests"], row["errors"], row["concurrency"]) == (6, 0, 2)
+        assert row["p50_ms"] <= row["p99_ms"]
+        assert mock_power.await_count == 6
@@ -1,5 +1,11 @@
 """Tests for pyvizio constants validation."""
 
+from importlib import resources
+import json
+import marshal
+import subprocess
+import sys
+
 from pyvizio.const import (
     APP_HOME,
     APPS,
@@ -11,6 +17,16 @@ from pyvizio.const import (
     EQUIVALENT_NAME_SPACES,
     MAX_VOLUME,
 )
+from pyvizio.data import (
+    APPS_JSON_FILE,
+    APPS_MARSHAL_FILE,
+    APPS_MARSHAL_FORMAT,
+    _load_apps_json,
+    apps_to_rows,
+    compile_apps,
+    load_bundled_apps,
+    rows_to_apps,
+)
 
 
 class TestAppsListStructure:
@@ -40,6 +56,41 @@ class TestAppsListStructure:
             )
 
 
+class TestBundledApps:
+    def test_marshal_artifact_matches_json(self):
+        """apps.marshal must be regenerated (see `compile_apps`) whenever apps.json changes."""
+        ref = resources.files("pyvizio.data").joinpath(APPS_JSON_FILE)
+        artifact = resources.files("pyvizio.data").joinpath(APPS_MARSHAL_FILE)
+        assert marshal.loads(artifact.read_bytes()) == (
+            APPS_MARSHAL_FORMAT,
+            apps_to_rows(json.loads(ref.read_text(encoding="utf-8"))),
+        )
+
+    def test_json_fallback_matches_artifact(self):
+        assert _load_apps_json() == APPS
+
+    def test_compile_apps_round_trip(self, tmp_path):
+        compile_apps(APPS, tmp_path / "apps.marshal")
+        version, rows = marshal.loads((tmp_path / "apps.marshal").read_bytes())
+        assert version == APPS_MARSHAL_FORMAT
+        assert rows_to_apps(rows) == APPS
+
+    def test_apps_loaded_once(self):
+        assert load_bundled_apps() is APPS
+
+    def test_country_codes_interned(self):
+        countries = [c for app in APPS for c in app["country"] if c == "usa"]
+        assert all(c is countries[0] for c in countries)
+
+    def test_apps_not_loaded_on_import(self):
+        code = (
+            "import pyvizio, pyvizio.cli\n"
+            "from pyvizio.data import load_bundled_apps\n"
+            "assert load_bundled_apps.cache_info().currsize == 0"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
 class TestDeviceClassConstants:
     def test_device_class_tv(self):
         assert DEVICE_CLASS_TV == "tv"
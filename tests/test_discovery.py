@@ -0,0 +1,611 @@
+"""Tests for zeroconf and SSDP discovery."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aioresponses import CallbackResult
+import pytest
+from zeroconf import ServiceStateChange
+
+from pyvizio import Vizio, VizioAsync
+from pyvizio.discovery import ssdp
+from pyvizio.discovery.service import (
+    DEVICE_ADDED,
+    DEVICE_REMOVED,
+    DEVICE_UPDATED,
+    DeviceTable,
+    DiscoveredDevice,
+    DiscoveryService,
+    async_discover as async_discover_all,
+)
+from pyvizio.discovery.ssdp import (
+    SSDP_DIAL_SERVICE,
+    SSDP_GROUP,
+    SSDPDescriptionCache,
+    SSDPDevice,
+    SSDPResponse,
+    async_discover as async_discover_ssdp,
+    async_search,
+    get_description_cache,
+    get_ipv4_interfaces,
+    parse_description,
+)
+from pyvizio.discovery.zeroconf import ZeroconfDevice, async_discover
+
+SERVICE_TYPE = "_viziocast._tcp.local."
+
+
+class FakeServiceInfo:
+    """Stand-in for AsyncServiceInfo resolving after a per-service delay."""
+
+    services: dict = {}
+
+    def __init__(self, type_, name):
+        self.type = type_
+        self.name = name
+        self.port = 7345
+        self.properties = {}
+        self._ip = None
+
+    async def async_request(self, zc, timeout):
+        delay, ip, properties = self.services[self.name]
+        await asyncio.sleep(delay)
+        if ip is None:
+            return False
+        self._ip = ip
+        self.properties = properties
+        return True
+
+    def parsed_addresses(self, version=None):
+        return [self._ip]
+
+
+class FakeServiceBrowser:
+    """Stand-in for AsyncServiceBrowser announcing every fake service at once."""
+
+    last = None
+
+    def __init__(self, zeroconf, type_, handlers):
+        FakeServiceBrowser.last = self
+        self.zeroconf = zeroconf
+        self.type = type_
+        self.handlers = handlers
+        for name in FakeServiceInfo.services:
+            for handler in handlers:
+                handler(zeroconf, type_, name, ServiceStateChange.Added)
+
+    def announce(self, name, state_change):
+        for handler in self.handlers:
+            handler(self.zeroconf, self.type, name, state_change)
+
+    async def async_cancel(self):
+        pass
+
+
+@pytest.fixture
+def fake_zeroconf(monkeypatch):
+    aiozc = MagicMock()
+    aiozc.async_close = AsyncMock()
+    for module in ("pyvizio.discovery.zeroconf", "pyvizio.discovery.service"):
+        monkeypatch.setattr(f"{module}.AsyncZeroconf", MagicMock(return_value=aiozc))
+        monkeypatch.setattr(f"{module}.AsyncServiceBrowser", FakeServiceBrowser)
+        monkeypatch.setattr(f"{module}.AsyncServiceInfo", FakeServiceInfo)
+    monkeypatch.setattr(FakeServiceInfo, "services", {})
+    return FakeServiceInfo.services
+
+
+def service(name):
+    return f"{name}.{SERVICE_TYPE}"
+
+
+class TestAsyncZeroconfDiscover:
+    async def test_yields_devices_as_resolved(self, fake_zeroconf):
+        fake_zeroconf.update(
+            {
+                service("Slow TV"): (0.05, "192.168.1.11", {b"id": b"bb"}),
+                service("Fast TV"): (0, "192.168.1.10", {b"name": b"M55"}),
+                service("Broken"): (0, None, {}),
+            }
+        )
+
+        devices = [dev async for dev in async_discover(SERVICE_TYPE, timeout=1)]
+
+        assert devices == [
+            ZeroconfDevice("Fast TV", "192.168.1.10", 7345, "M55", ""),
+            ZeroconfDevice("Slow TV", "192.168.1.11", 7345, "", "bb"),
+        ]
+
+    async def test_stops_at_expected_count(self, fake_zeroconf):
+        fake_zeroconf.update(
+            {
+                service("Fast TV"): (0, "192.168.1.10", {}),
+                service("Slow TV"): (10, "192.168.1.11", {}),
+            }
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        devices = [
+            dev async for dev in async_discover(SERVICE_TYPE, 5, expected_count=1)
+        ]
+
+        assert [dev.name for dev in devices] == ["Fast TV"]
+        assert loop.time() - start < 1
+
+    async def test_stops_when_expected_ids_found(self, fake_zeroconf):
+        fake_zeroconf.update(
+            {
+                service("A"): (0, "192.168.1.10", {b"id": b"aa"}),
+                service("B"): (0.01, "192.168.1.11", {b"id": b"bb"}),
+                service("C"): (10, "192.168.1.12", {b"id": b"cc"}),
+            }
+        )
+
+        devices = [
+            dev
+            async for dev in async_discover(SERVICE_TYPE, 5, expected_ids={"aa", "bb"})
+        ]
+
+        assert {dev.id for dev in devices} == {"aa", "bb"}
+
+    async def test_times_out(self, fake_zeroconf):
+        fake_zeroconf[service("Slow TV")] = (10, "192.168.1.10", {})
+        assert [dev async for dev in async_discover(SERVICE_TYPE, 0.05)] == []
+
+
+def make_description(name, manufacturer="VIZIO"):
+    return (
+        "<root><device>"
+        f"<manufacturer>{manufacturer}</manufacturer>"
+        f"<friendlyName>{name}</friendlyName>"
+        "<modelName>M55</modelName>"
+        f"<UDN>uuid:{name}</UDN>"
+        "</device></root>"
+    )
+
+
+def make_ssdp_response(location, max_age=1800):
+    return (
+        "HTTP/1.1 200 OK\r\n"
+        f"CACHE-CONTROL: max-age={max_age}\r\n"
+        f"LOCATION: {location}\r\n"
+        f"ST: {SSDP_DIAL_SERVICE}\r\n"
+        "USN: uuid:test\r\n"
+        "\r\n"
+    ).encode()
+
+
+class FakeResponder(asyncio.DatagramProtocol):
+    """Answer every M-SEARCH with one response per location (plus some garbage)."""
+
+    def __init__(self, locations):
+        self.locations = locations
+        self.max_age = 1800
+        self.searches = []
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.searches.append(data.decode())
+        self.transport.sendto(b"not an ssdp response", addr)
+        for location in self.locations:
+            self.transport.sendto(make_ssdp_response(location, self.max_age), addr)
+
+
+@pytest.fixture
+async def ssdp_responder():
+    loop = asyncio.get_running_loop()
+    responder = FakeResponder([])
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: responder, local_addr=("127.0.0.1", 0)
+    )
+    responder.address = transport.get_extra_info("sockname")
+    yield responder
+    transport.close()
+
+
+class TestParseDescription:
+    def test_vizio_device(self):
+        assert parse_description(
+            "http://192.168.1.10:8008/ssdp/device-desc.xml", make_description("TV")
+        ) == SSDPDevice("192.168.1.10", "TV", "M55", "uuid:TV")
+
+    @pytest.mark.parametrize(
+        "description",
+        [make_description("TV", "Google Inc."), "<root/>", "not xml"],
+    )
+    def test_rejected(self, description):
+        assert parse_description("http://192.168.1.10/desc.xml", description) is None
+
+
+class TestAsyncSSDPDiscover:
+    async def test_fetches_descriptions_concurrently(self, ssdp_responder, mock_aio):
+        in_flight = 0
+        max_in_flight = 0
+
+        def delayed(body):
+            async def callback(url, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.05)
+                in_flight -= 1
+                return CallbackResult(body=body)
+
+            return callback
+
+        for index, manufacturer in enumerate(["VIZIO", "VIZIO", "Roku"]):
+            location = f"http://192.168.1.{10 + index}:8008/desc.xml"
+            ssdp_responder.locations.append(location)
+            mock_aio.get(
+                location, callback=delayed(make_description(f"TV{index}", manufacturer))
+            )
+
+        devices = [
+            dev
+            async for dev in async_discover_ssdp(
+                SSDP_DIAL_SERVICE, timeout=0.5, address=ssdp_responder.address
+            )
+        ]
+
+        assert sorted(dev.name for dev in devices) == ["TV0", "TV1"]
+        assert max_in_flight == 3
+        assert f"ST: {SSDP_DIAL_SERVICE}" in ssdp_responder.searches[0]
+
+    async def test_unreachable_description_skipped(self, ssdp_responder, mock_aio):
+        ssdp_responder.locations.append("http://192.168.1.10:8008/desc.xml")
+        devices = [
+            dev
+            async for dev in async_discover_ssdp(
+                SSDP_DIAL_SERVICE, timeout=0.2, address=ssdp_responder.address
+            )
+        ]
+        assert devices == []
+
+    async def test_search_retried(self, ssdp_responder, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        ssdp_responder.locations.append(location)
+        mock_aio.get(location, body=make_description("TV"))
+
+        devices = [
+            dev
+            async for dev in async_discover_ssdp(
+                SSDP_DIAL_SERVICE,
+                timeout=0.3,
+                address=ssdp_responder.address,
+                retries=3,
+            )
+        ]
+
+        assert len(ssdp_responder.searches) == 3
+        assert len(devices) == 1
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 1
+
+    async def test_mx_within_timeout(self, ssdp_responder):
+        await async_search(
+            lambda response: None,
+            SSDP_DIAL_SERVICE,
+            timeout=0.1,
+            retries=1,
+            mx=5,
+            address=ssdp_responder.address,
+        )
+        assert "MX: 1\r\n" in ssdp_responder.searches[0]
+
+    async def test_multicast_sent_from_every_interface(self, monkeypatch):
+        interfaces = []
+
+        def create_socket(interface):
+            interfaces.append(interface)
+            raise OSError("unavailable")
+
+        monkeypatch.setattr(ssdp, "_create_search_socket", create_socket)
+        monkeypatch.setattr(
+            ssdp, "get_ipv4_interfaces", lambda: ["192.168.1.2", "10.0.0.2"]
+        )
+
+        await async_search(lambda response: None, SSDP_DIAL_SERVICE, timeout=0.05)
+        assert interfaces == ["192.168.1.2", "10.0.0.2"]
+
+        interfaces.clear()
+        await async_search(
+            lambda response: None,
+            SSDP_DIAL_SERVICE,
+            timeout=0.05,
+            address=SSDP_GROUP,
+            interfaces=["172.16.0.2"],
+        )
+        assert interfaces == ["172.16.0.2"]
+
+    def test_ipv4_interfaces(self, monkeypatch):
+        def adapter(*ips):
+            return MagicMock(
+                ips=[MagicMock(ip=ip, is_IPv4=isinstance(ip, str)) for ip in ips]
+            )
+
+        monkeypatch.setattr(
+            ssdp.ifaddr,
+            "get_adapters",
+            lambda: [
+                adapter("127.0.0.1"),
+                adapter("192.168.1.2", ("fe80::1", 0, 2)),
+                adapter("10.0.0.2", "192.168.1.2"),
+            ],
+        )
+        assert get_ipv4_interfaces() == ["192.168.1.2", "10.0.0.2"]
+
+        monkeypatch.setattr(ssdp.ifaddr, "get_adapters", lambda: [adapter("127.0.0.1")])
+        assert get_ipv4_interfaces() == [""]
+
+
+def discover_ssdp(responder, **kwargs):
+    return async_discover_ssdp(
+        SSDP_DIAL_SERVICE, timeout=0.2, address=responder.address, **kwargs
+    )
+
+
+class TestSSDPDescriptionCache:
+    def test_max_age(self):
+        response = SSDPResponse(make_ssdp_response("http://192.168.1.10/", 60))
+        assert response.max_age == 60
+
+    async def test_repeat_discovery_skips_fetch(self, ssdp_responder, mock_aio):
+        vizio = "http://192.168.1.10:8008/desc.xml"
+        roku = "http://192.168.1.11:8008/desc.xml"
+        ssdp_responder.locations.extend([vizio, roku])
+        mock_aio.get(vizio, body=make_description("TV"))
+        mock_aio.get(roku, body=make_description("Roku", "Roku"))
+
+        first = [dev async for dev in discover_ssdp(ssdp_responder)]
+        second = [dev async for dev in discover_ssdp(ssdp_responder)]
+
+        assert first == second == [SSDPDevice("192.168.1.10", "TV", "M55", "uuid:TV")]
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    async def test_unreachable_not_cached(self, ssdp_responder, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        ssdp_responder.locations.append(location)
+        assert [dev async for dev in discover_ssdp(ssdp_responder)] == []
+
+        mock_aio.get(location, body=make_description("TV"))
+        assert len([dev async for dev in discover_ssdp(ssdp_responder)]) == 1
+
+    async def test_expired_entries_refetched(self, ssdp_responder, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        ssdp_responder.locations.append(location)
+        ssdp_responder.max_age = 0
+        mock_aio.get(location, body=make_description("TV"), repeat=True)
+
+        for _ in range(2):
+            assert len([dev async for dev in discover_ssdp(ssdp_responder)]) == 1
+
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 2
+
+    async def test_persisted(self, tmp_path, ssdp_responder, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        ssdp_responder.locations.append(location)
+        mock_aio.get(location, body=make_description("TV"))
+        path = tmp_path / "ssdp.json"
+
+        cache = SSDPDescriptionCache(path)
+        devices = [dev async for dev in discover_ssdp(ssdp_responder, cache=cache)]
+
+        other = SSDPDescriptionCache(path)
+        assert len(other) == 1
+        assert [
+            dev async for dev in discover_ssdp(ssdp_responder, cache=other)
+        ] == devices
+        assert sum(len(calls) for calls in mock_aio.requests.values()) == 1
+
+
+def make_notify(location, nts="ssdp:alive", udn="uuid:TV"):
+    return (
+        "NOTIFY * HTTP/1.1\r\n"
+        "HOST: 239.255.255.250:1900\r\n"
+        "CACHE-CONTROL: max-age=1800\r\n"
+        f"LOCATION: {location}\r\n"
+        f"NT: {SSDP_DIAL_SERVICE}\r\n"
+        f"NTS: {nts}\r\n"
+        f"USN: {udn}::{SSDP_DIAL_SERVICE}\r\n"
+        "\r\n"
+    ).encode()
+
+
+class TestDeviceTable:
+    def test_zeroconf_ip_change_updates_device(self):
+        table = DeviceTable()
+        tv = ZeroconfDevice("TV", "192.168.1.10", 7345, "M55", "aa")
+
+        assert table.update_zeroconf("TV._viziocast", tv) == (
+            DEVICE_ADDED,
+            DiscoveredDevice("192.168.1.10", "TV", 7345, "M55", "aa"),
+        )
+        assert table.update_zeroconf("TV._viziocast", tv) is None
+
+        tv.ip = "192.168.1.20"
+        event, device = table.update_zeroconf("TV._viziocast", tv)
+        assert event == DEVICE_UPDATED
+        assert device.host == "192.168.1.20:7345"
+        assert len(table) == 1
+
+    def test_sources_merged_by_ip(self):
+        table = DeviceTable()
+        table.update_zeroconf(
+            "TV._viziocast", ZeroconfDevice("TV", "192.168.1.10", 7345, "M55", "aa")
+        )
+
+        event, device = table.update_ssdp(
+            SSDPDevice("192.168.1.10", "Living Room", "M55-F", "uuid:TV")
+        )
+
+        assert event == DEVICE_UPDATED
+        assert device == DiscoveredDevice(
+            "192.168.1.10", "TV", 7345, "M55", "aa", "uuid:TV"
+        )
+
+        # Only removed once neither source advertises it
+        assert table.remove_ssdp("uuid:TV") is None
+        assert table.remove_zeroconf("TV._viziocast") == (DEVICE_REMOVED, device)
+        assert not table.devices
+
+    def test_ssdp_devices_expire(self):
+        table = DeviceTable()
+        table.update_ssdp(SSDPDevice("192.168.1.10", "TV", "M55", "uuid:TV"), 10)
+
+        assert table.expire(now=0) == []
+        [(event, _)] = table.expire(now=float("inf"))
+        assert event == DEVICE_REMOVED
+
+
+class TestDiscoveryService:
+    async def test_zeroconf_updates(self, fake_zeroconf):
+        fake_zeroconf[service("TV")] = (0, "192.168.1.10", {b"id": b"aa"})
+        events = []
+
+        async with DiscoveryService(ssdp=False) as discovery:
+            discovery.add_listener(lambda event, dev: events.append((event, dev.ip)))
+            await asyncio.sleep(0.01)
+            fake_zeroconf[service("TV")] = (0, "192.168.1.20", {b"id": b"aa"})
+            FakeServiceBrowser.last.announce(service("TV"), ServiceStateChange.Updated)
+            await asyncio.sleep(0.01)
+            FakeServiceBrowser.last.announce(service("TV"), ServiceStateChange.Removed)
+
+        assert events == [
+            (DEVICE_ADDED, "192.168.1.10"),
+            (DEVICE_UPDATED, "192.168.1.20"),
+            (DEVICE_REMOVED, "192.168.1.20"),
+        ]
+
+    async def test_ssdp_notify(self, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        mock_aio.get(location, body=make_description("TV"))
+        events = []
+        loop = asyncio.get_running_loop()
+
+        async with DiscoveryService(
+            zeroconf=False, search=False, ssdp_address=("127.0.0.1", 0)
+        ) as discovery:
+            discovery.add_listener(lambda event, dev: events.append((event, dev.ip)))
+            address = discovery._ssdp_transport.get_extra_info("sockname")
+            sender, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=address
+            )
+            sender.sendto(b"M-SEARCH * HTTP/1.1\r\n\r\n")
+            sender.sendto(make_notify(location))
+            await asyncio.sleep(0.05)
+            assert [dev.udn for dev in discovery.devices] == ["uuid:TV"]
+
+            sender.sendto(make_notify(location, nts="ssdp:byebye"))
+            await asyncio.sleep(0.05)
+            sender.close()
+
+        assert events == [
+            (DEVICE_ADDED, "192.168.1.10"),
+            (DEVICE_REMOVED, "192.168.1.10"),
+        ]
+
+    async def test_empty_ssdp_cache_is_used(self, mock_aio):
+        location = "http://192.168.1.10:8008/desc.xml"
+        mock_aio.get(location, body=make_description("TV"))
+        cache = SSDPDescriptionCache()
+        loop = asyncio.get_running_loop()
+
+        async with DiscoveryService(
+            zeroconf=False,
+            search=False,
+            ssdp_address=("127.0.0.1", 0),
+            ssdp_cache=cache,
+        ) as discovery:
+            assert discovery._cache is cache
+            address = discovery._ssdp_transport.get_extra_info("sockname")
+            sender, _ = await loop.create_datagram_endpoint(
+                asyncio.DatagramProtocol, remote_addr=address
+            )
+            sender.sendto(make_notify(location))
+            await asyncio.sleep(0.05)
+            sender.close()
+
+        assert len(cache) == 1
+        assert len(get_description_cache()) == 0
+
+
+class TestUnifiedDiscover:
+    @pytest.fixture
+    def ssdp_devices(self, monkeypatch):
+        devices = []
+
+        async def fake_discover(service, timeout, session=None, cache=None):
+            for device in devices:
+                if isinstance(device, Exception):
+                    raise device
+                await asyncio.sleep(0.01)
+                yield device
+
+        monkeypatch.setattr(
+            "pyvizio.discovery.service.async_discover_ssdp", fake_discover
+        )
+        return devices
+
+    async def test_merges_sources_concurrently(self, fake_zeroconf, ssdp_devices):
+        fake_zeroconf[service("TV")] = (0.05, "192.168.1.10", {b"id": b"aa"})
+        ssdp_devices.extend(
+            [
+                SSDPDevice("192.168.1.10", "TV", "M55", "uuid:TV"),
+                SSDPDevice("192.168.1.11", "Bar", "SB36", "uuid:Bar"),
+            ]
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        devices = await async_discover_all(timeout=0.2)
+
+        assert loop.time() - start < 0.4
+        assert devices == [
+            DiscoveredDevice("192.168.1.10", "TV", 7345, "M55", "aa", "uuid:TV"),
+            DiscoveredDevice("192.168.1.11", "Bar", None, "SB36", None, "uuid:Bar"),
+        ]
+
+    async def test_one_source_failing(self, fake_zeroconf, ssdp_devices):
+        fake_zeroconf[service("TV")] = (0, "192.168.1.10", {})
+        ssdp_devices.append(OSError("No route to host"))
+
+        devices = await async_discover_all(timeout=0.1)
+
+        assert [dev.ip for dev in devices] == ["192.168.1.10"]
+
+    async def test_vizio_async_discovery(self, fake_zeroconf, ssdp_devices):
+        fake_zeroconf[service("TV")] = (0, "192.168.1.10", {b"id": b"aa"})
+
+        devices = await VizioAsync.discovery(timeout=0.1)
+
+        assert [dev.ip for dev in devices] == ["192.168.1.10"]
+
+    def test_vizio_sync_discovery(self, fake_zeroconf, ssdp_devices):
+        ssdp_devices.append(SSDPDevice("192.168.1.11", "Bar", "SB36", "uuid:Bar"))
+
+        devices = Vizio.discovery(timeout=0.1)
+
+        assert [dev.ip for dev in devices] == ["192.168.1.11"]
+
+
+class TestVizioSSDPDiscovery:
+    @pytest.fixture(autouse=True)
+    def ssdp_devices(self, monkeypatch):
+        devices = [SSDPDevice("192.168.1.11", "Bar", "SB36", "uuid:Bar")]
+
+        async def fake_discover(service, timeout):
+            assert service == SSDP_DIAL_SERVICE
+            for device in devices:
+                yield device
+
+        monkeypatch.setattr("pyvizio.discovery.ssdp.async_discover", fake_discover)
+        return devices
+
+    async def test_async_discovery_ssdp(self, ssdp_devices):
+        devices = [device async for device in VizioAsync.async_discovery_ssdp(0.1)]
+        assert devices == ssdp_devices
+        assert await VizioAsync.discovery_ssdp(0.1) == ssdp_devices
+
+    def test_sync_discovery_ssdp(self, ssdp_devices):
+        assert Vizio.discovery_ssdp(0.1) == ssdp_devices
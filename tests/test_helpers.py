@@ -1,13 +1,81 @@
 """Tests for pyvizio.helpers module."""
 
+import os
+import timeit
+import tracemalloc
+
 import pytest
 
+from pyvizio.api._protocol import EXTRACT_MODEL, PATH_MODEL
+from pyvizio.api.apps import AppConfig
+from pyvizio.api.input import InputItem
+from pyvizio.api.item import DefaultReturnItem, Item
+from pyvizio.api.pair import BeginPairResponse
+from pyvizio.api.remote import KeyPressEvent
+from pyvizio.discovery.ssdp import SSDPDevice
+from pyvizio.discovery.zeroconf import ZeroconfDevice
 from pyvizio.helpers import (
     async_to_sync,
+    compile_extractor,
     dict_get_case_insensitive,
     get_value_from_path,
+    slots_to_dict,
 )
 
+ITEM_JSON = {
+    "HASHVAL": 1,
+    "CNAME": "volume",
+    "TYPE": "T_VALUE_ABS_V1",
+    "NAME": "Volume",
+    "VALUE": 10,
+    "MINIMUM": 0,
+    "MAXIMUM": 100,
+    "CENTER": 50,
+}
+
+# Wall-clock comparisons are too noisy for the default run
+BENCHMARK_ENV = "PYVIZIO_BENCHMARK"
+
+
+# Unauthenticated device info response as returned by a TV
+DEVICE_INFO_JSON = {
+    "STATUS": {"RESULT": "SUCCESS", "DETAIL": "Success"},
+    "ITEMS": [
+        {
+            "CNAME": "device_info",
+            "TYPE": "T_DEVICE_INFO_V1",
+            "NAME": "Device Info",
+            "VALUE": {
+                "MODEL_NAME": "V505-G9",
+                "SETTINGS_ROOT": "tv_settings",
+                "SYSTEM_INFO": {
+                    "CHIPSET": 5,
+                    "CHIP_REVISION": 0,
+                    "SERIAL_NUMBER": "LWZQLMDS1234567",
+                    "VERSION": "3.720.9.1-2",
+                    "MODEL_NAME": "V505-G9",
+                },
+                "CAST_NAME": "Living Room",
+                "INPUTS": [
+                    {"NAME": "HDMI-1", "CNAME": "hdmi1"},
+                    {"NAME": "HDMI-2", "CNAME": "hdmi2"},
+                    {"NAME": "COMP", "CNAME": "comp"},
+                ],
+                "ESN": "C0123456789",
+                "API_VERSION": 2,
+                "UID": "00000000-0000-0000-0000-000000000000",
+            },
+        }
+    ],
+    "URI": "/state/device/deviceinfo",
+}
+
+
+def generic_model_walk(device_info):
+    """Read model name the way it was read before extractors were compiled."""
+    value = dict_get_case_insensitive(device_info, "value", {})
+    return get_value_from_path(value, PATH_MODEL["tv"])
+
 
 class TestDictGetCaseInsensitive:
     @pytest.mark.parametrize(
@@ -67,6 +135,54 @@ class TestGetValueFromPath:
         assert get_value_from_path(data, paths) is None
 
 
+class TestCompileExtractor:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"ITEMS": [{"VALUE": {"MODEL_NAME": "V505-G9"}}]},
+            {"items": [{"value": {"model_name": "V505-G9"}}]},
+            {"Items": [{"Value": {"Model_Name": "V505-G9"}}]},
+            {"ITEMS": [{"VALUE": {"SYSTEM_INFO": {"MODEL_NAME": "V505-G9"}}}]},
+        ],
+    )
+    def test_nested_paths(self, data):
+        extract = compile_extractor(
+            [
+                ["items", 0, "value", "model_name"],
+                ["items", 0, "value", "system_info", "model_name"],
+            ]
+        )
+        assert extract(data) == "V505-G9"
+
+    @pytest.mark.parametrize(
+        "data",
+        [None, [], {}, {"ITEMS": []}, {"ITEMS": "not a list"}, {"ITEMS": [None]}],
+    )
+    def test_unresolved_returns_none(self, data):
+        assert compile_extractor([["items", 0, "value"]])(data) is None
+
+    def test_falsy_values_returned(self):
+        extract = compile_extractor([["value"], ["fallback"]])
+        assert extract({"VALUE": 0, "FALLBACK": 1}) == 0
+
+    def test_model_extractor_matches_generic_walk(self):
+        item = DEVICE_INFO_JSON["ITEMS"][0]
+        assert EXTRACT_MODEL["tv"](item) == generic_model_walk(item) == "V505-G9"
+
+    @pytest.mark.skipif(
+        not os.environ.get(BENCHMARK_ENV),
+        reason=f"timing test, set {BENCHMARK_ENV}=1 to run",
+    )
+    def test_model_extractor_faster_than_generic_walk(self):
+        """Guard the speedup of compiled extractors over the generic walk."""
+        item = DEVICE_INFO_JSON["ITEMS"][0]
+
+        def best_time(extract):
+            return min(timeit.repeat(lambda: extract(item), number=2000, repeat=5))
+
+        assert best_time(EXTRACT_MODEL["tv"]) * 1.5 < best_time(generic_model_walk)
+
+
 class TestAsyncToSync:
     def test_converts_async_to_sync(self):
         async def async_add(a, b):
@@ -88,3 +204,54 @@ class TestAsyncToSync:
 
         sync_func = async_to_sync(returns_none)
         assert sync_func() is None
+
+
+class TestSlotsToDict:
+    def test_includes_inherited_slots(self):
+        item = InputItem({**ITEM_JSON, "VALUE": "HDMI-1"}, False)
+        assert slots_to_dict(item) == {
+            "id": 1,
+            "c_name": "volume",
+            "type": "T_VALUE_ABS_V1",
+            "name": "Volume",
+            "value": "HDMI-1",
+            "min": 0,
+            "max": 100,
+            "center": 50,
+            "choices": [],
+            "meta_data": None,
+            "meta_name": "HDMI-1",
+        }
+
+    @pytest.mark.parametrize(
+        "model",
+        [
+            Item(ITEM_JSON),
+            InputItem(ITEM_JSON, False),
+            DefaultReturnItem(None),
+            AppConfig("1", 3, None),
+            BeginPairResponse("1", "1234"),
+            KeyPressEvent((4, 3)),
+            ZeroconfDevice("TV", "192.168.1.10", 7345, "M55", "1"),
+            SSDPDevice("192.168.1.10", "TV", "M55", "uuid:TV"),
+        ],
+    )
+    def test_models_have_no_instance_dict(self, model):
+        assert not hasattr(model, "__dict__")
+        assert repr(model) == f"{type(model).__name__}({slots_to_dict(model)})"
+
+    def test_fleet_settings_memory(self):
+        class DictItem(Item):
+            """Item with a per-instance __dict__, like before it used __slots__."""
+
+        def traced_size(cls):
+            tracemalloc.start()
+            try:
+                fleet = [[cls(ITEM_JSON) for _ in range(5)] for _ in range(1000)]
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(fleet) == 1000
+            return size
+
+        assert traced_size(Item) < traced_size(DictItem)
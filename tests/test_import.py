@@ -0,0 +1,49 @@
+"""Tests for what importing pyvizio costs."""
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = (
+    "pyvizio.catalog",
+    "pyvizio.discovery.service",
+    "pyvizio.discovery.ssdp",
+    "pyvizio.discovery.zeroconf",
+    "xmltodict",
+    "zeroconf",
+)
+
+
+def import_times(module):
+    """Return cumulative microseconds spent importing each module, per -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["pyvizio", "pyvizio.cli"])
+def test_lazy_modules_not_imported(module):
+    times = import_times(module)
+    assert module in times
+    assert [name for name in LAZY_MODULES if name in times] == []
+
+
+def test_lazy_attributes():
+    code = (
+        "import sys, pyvizio\n"
+        "assert 'zeroconf' not in sys.modules\n"
+        "from pyvizio.discovery.zeroconf import ZeroconfDevice\n"
+        "assert pyvizio.ZeroconfDevice is ZeroconfDevice\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
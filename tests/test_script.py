@@ -0,0 +1,172 @@
+"""Tests for running scripts of Vizio commands."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pyvizio import VizioAsync
+from pyvizio.errors import VizioInvalidParameterError
+from pyvizio.script import (
+    ScriptCommand,
+    async_run_script,
+    group_commands,
+    parse_script,
+)
+
+
+@pytest.fixture
+def vizio():
+    return VizioAsync("pyvizio", "192.168.1.100:7345", "Test", "token")
+
+
+class TestParseScript:
+    def test_text_lines(self):
+        commands = parse_script(
+            "# warm up\n"
+            "\n"
+            "get-power-state\n"
+            "set_input 'HDMI 1'\n"
+            "vol_up 3 log_api_exception=0 &\n"
+        )
+        assert commands == [
+            ScriptCommand(3, "get_power_state"),
+            ScriptCommand(4, "set_input", ("HDMI 1",)),
+            ScriptCommand(5, "vol_up", (3,), {"log_api_exception": 0}, True),
+        ]
+
+    def test_json_lines(self):
+        commands = parse_script(
+            '{"method": "set_setting", "args": ["audio", "volume", 10]}\n'
+            '{"method": "get_current_app", "parallel": true}\n'
+        )
+        assert commands == [
+            ScriptCommand(1, "set_setting", ("audio", "volume", 10)),
+            ScriptCommand(2, "get_current_app", parallel=True),
+        ]
+
+    def test_json_array(self):
+        commands = parse_script(
+            '[{"method": "pow_on"}, {"method": "mute_on", "kwargs": {"num": 1}}]'
+        )
+        assert commands == [
+            ScriptCommand(1, "pow_on"),
+            ScriptCommand(2, "mute_on", (), {"num": 1}),
+        ]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "get_power_state\nnot_a_command\n",
+            "_VizioAsync__invoke_api\n",
+            "discovery\n",
+            '{"args": []}\n',
+            '{"method": "pow_on", "args": 1}\n',
+            "set_input 'HDMI\n",
+            "[not json",
+        ],
+    )
+    def test_invalid(self, text):
+        with pytest.raises(VizioInvalidParameterError):
+            parse_script(text)
+
+
+def test_group_commands():
+    commands = parse_script("pow_on\nvol_up &\nch_up &\nmute_on\nplay &\n")
+    assert [
+        [command.method for command in group] for group in group_commands(commands)
+    ] == [
+        ["pow_on"],
+        ["vol_up", "ch_up"],
+        ["mute_on"],
+        ["play"],
+    ]
+
+
+class TestRunScript:
+    async def test_results_in_order(self, vizio):
+        with (
+            patch.object(VizioAsync, "get_power_state", AsyncMock(return_value=True)),
+            patch.object(
+                VizioAsync,
+                "vol_up",
+                AsyncMock(side_effect=VizioInvalidParameterError("no")),
+            ),
+        ):
+            results = await async_run_script(
+                vizio, parse_script("get_power_state\nvol_up 2\nget_max_volume\n")
+            )
+
+        assert [(r.command.method, r.result, r.error) for r in results] == [
+            ("get_power_state", True, None),
+            ("vol_up", None, "no"),
+            ("get_max_volume", 100, None),
+        ]
+        assert all(result.elapsed >= 0 for result in results)
+
+    async def test_parallel_group_runs_concurrently(self, vizio):
+        both_started = asyncio.Event()
+        calls = []
+
+        async def wait_for_other(*args, **kwargs):
+            # Never returns unless both calls in the group are running at once
+            calls.append(args)
+            if len(calls) == 2:
+                both_started.set()
+            await both_started.wait()
+            return len(calls)
+
+        with (
+            patch.object(VizioAsync, "vol_up", wait_for_other),
+            patch.object(VizioAsync, "ch_up", wait_for_other),
+        ):
+            results = await asyncio.wait_for(
+                async_run_script(vizio, parse_script("vol_up &\nch_up &\n")), 1
+            )
+
+        assert [result.result for result in results] == [2, 2]
+
+    async def test_stop_on_error(self, vizio):
+        get_power_state = AsyncMock(return_value=True)
+        with patch.object(VizioAsync, "get_power_state", get_power_state):
+            results = await async_run_script(
+                vizio,
+                parse_script("pow_on too many args\nget_power_state\n"),
+                stop_on_error=True,
+            )
+
+        assert len(results) == 1
+        assert not results[0].ok
+        get_power_state.assert_not_awaited()
+
+    async def test_failed_api_calls_are_errors(self, vizio):
+        calls = []
+
+        async def get_power_state(self, log_api_exception=True):
+            calls.append(log_api_exception)
+            return False
+
+        async def pow_on(self, log_api_exception=True):
+            calls.append(log_api_exception)
+            return False
+
+        async def get_esn(self, log_api_exception=True):
+            calls.append(log_api_exception)
+            return None
+
+        with (
+            patch.object(VizioAsync, "get_power_state", get_power_state),
+            patch.object(VizioAsync, "pow_on", pow_on),
+            patch.object(VizioAsync, "get_esn", get_esn),
+        ):
+            results = await async_run_script(
+                vizio, parse_script("get_power_state\npow_on\nget_esn\n")
+            )
+
+        assert [(r.result, r.ok) for r in results] == [
+            (False, True),
+            (False, False),
+            (None, False),
+        ]
+        assert results[2].error == "command failed"
+        assert calls == [False, False, False]
@@ -0,0 +1,88 @@
+"""Tests for subnet sweep discovery."""
+
+import asyncio
+
+import pytest
+
+from pyvizio.discovery import sweep
+from pyvizio.discovery.sweep import SweepDevice, async_sweep
+from tests.conftest import (
+    make_device_info_response,
+    make_settings_response,
+    settings_url,
+)
+
+
+@pytest.fixture
+async def open_ports():
+    """Start local stand-in servers that accept TCP connections."""
+    servers = []
+
+    async def start():
+        server = await asyncio.start_server(
+            lambda reader, writer: writer.close(), "127.0.0.1", 0
+        )
+        servers.append(server)
+        return server.sockets[0].getsockname()[1]
+
+    yield start
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+
+
+class TestSweep:
+    async def test_confirms_vizio_devices(self, open_ports, mock_aio):
+        tv_port = await open_ports()
+        speaker_port = await open_ports()
+        other_port = await open_ports()
+        for port, value in (
+            (tv_port, {"MODEL_NAME": "V505"}),
+            (speaker_port, {"NAME": "SB3651"}),
+        ):
+            mock_aio.get(
+                f"https://127.0.0.1:{port}/state/device/deviceinfo",
+                payload=make_device_info_response(value),
+            )
+        mock_aio.get(
+            settings_url("speaker", f"127.0.0.1:{speaker_port}", "audio", "volume"),
+            payload=make_settings_response([("volume", 10, "T_VALUE_ABS_V1", 1)]),
+        )
+
+        devices = await async_sweep(
+            "127.0.0.1/32", ports=[tv_port, speaker_port, other_port]
+        )
+
+        assert sorted(devices, key=lambda dev: dev.port) == sorted(
+            [
+                SweepDevice("127.0.0.1", tv_port, "V505", "tv"),
+                SweepDevice("127.0.0.1", speaker_port, "SB3651", "speaker"),
+            ],
+            key=lambda dev: dev.port,
+        )
+
+    async def test_concurrency_bounded(self, monkeypatch):
+        in_flight = 0
+        max_in_flight = 0
+        probed = []
+
+        async def fake_port_open(ip, port, timeout):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            probed.append((ip, port))
+            return False
+
+        monkeypatch.setattr(sweep, "_async_port_open", fake_port_open)
+
+        assert await async_sweep("10.0.0.0/22", concurrency=64) == []
+        assert len(probed) == 1022 * 2
+        assert max_in_flight == 64
+
+    async def test_closed_ports_swept_quickly(self):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await async_sweep("127.0.0.0/24", ports=[1]) == []
+        assert loop.time() - start < 5
@@ -1,12 +1,19 @@
 """Tests for Vizio synchronous wrapper class."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
 
-from aioresponses import aioresponses
+from aiohttp import ClientSession
+from aioresponses import CallbackResult, aioresponses
+import pytest
 
 import pyvizio
 from pyvizio import Vizio, VizioAsync
+from pyvizio.catalog import get_app_catalog
 from pyvizio.const import APPS
+import pyvizio.sync
 from tests.conftest import (
     AUTH_TOKEN,
     TV_IP_PORT,
@@ -16,6 +23,7 @@ from tests.conftest import (
     make_key_press_response,
     make_power_response,
     make_response,
+    mock_catalog_urls,
     tv_settings_url,
     tv_url,
 )
@@ -139,6 +147,17 @@ class TestSyncApps:
             result = vizio_sync.get_current_app(apps_list=APPS)
         assert result == "Hulu"
 
+    def test_sync_get_apps_list_refreshes_catalog(self):
+        catalog = get_app_catalog()
+        with aioresponses() as m:
+            mock_catalog_urls(m)
+            assert "Hulu" in Vizio.get_apps_list()
+            # Refresh started by the call above finishes on the shared loop
+            deadline = time.monotonic() + 5
+            while catalog.is_stale() and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert Vizio.get_apps_list() == ["SmartCast Home", "Netflix"]
+
 
 class TestSyncRemote:
     def test_sync_get_remote_keys_list(self, vizio_sync):
@@ -147,6 +166,132 @@ class TestSyncRemote:
         assert "VOL_UP" in keys
 
 
+class TestSyncRunner:
+    def test_threads_share_loop_session_and_device_limit(self, monkeypatch):
+        in_flight = 0
+        max_in_flight = 0
+        loop_threads = set()
+        sessions = []
+
+        def tracked_session():
+            sessions.append(ClientSession())
+            return sessions[-1]
+
+        monkeypatch.setattr(pyvizio.sync, "ClientSession", tracked_session)
+
+        async def callback(url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            loop_threads.add(threading.current_thread())
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return CallbackResult(payload=make_power_response(1))
+
+        def get_power_state(_):
+            vizio = Vizio(
+                "pyvizio",
+                TV_IP_PORT,
+                "TV",
+                AUTH_TOKEN,
+                "tv",
+                max_concurrent_requests=2,
+            )
+            return vizio.get_power_state()
+
+        with aioresponses() as m:
+            m.get(tv_url("POWER_MODE"), callback=callback, repeat=True)
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(get_power_state, range(8)))
+
+        assert results == [True] * 8
+        assert len(loop_threads) == 1
+        assert threading.current_thread() not in loop_threads
+        assert len(sessions) == 1
+        assert max_in_flight == 2
+
+    def test_blocking_from_loop_thread_raises(self, sync_runner):
+        async def nested():
+            return sync_runner.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            sync_runner.run(nested())
+
+    def test_restart_after_stop(self, sync_runner, vizio_sync):
+        with aioresponses() as m:
+            m.get(tv_url("POWER_MODE"), payload=make_power_response(1), repeat=True)
+            assert vizio_sync.get_power_state() is True
+            sync_runner.stop()
+            assert not sync_runner.is_running
+            assert vizio_sync.get_power_state() is True
+        assert sync_runner.is_running
+
+
+class TestSyncBatch:
+    def mock_state(self, m, delay=0.0):
+        def delayed(payload):
+            async def callback(url, **kwargs):
+                await asyncio.sleep(delay)
+                return CallbackResult(payload=payload)
+
+            return callback
+
+        m.get(tv_url("POWER_MODE"), callback=delayed(make_power_response(1)))
+        m.get(
+            tv_settings_url("audio", "volume"),
+            callback=delayed(
+                make_response(
+                    items=[make_item("volume", 15, item_type="T_VALUE_ABS_V1")]
+                )
+            ),
+        )
+        m.get(
+            tv_url("CURRENT_INPUT"),
+            callback=delayed(make_current_input_response("current_input", "HDMI-1", 5)),
+        )
+
+    def test_gather_results_in_order(self, vizio_sync):
+        with aioresponses() as m:
+            self.mock_state(m)
+            results = vizio_sync.gather(
+                "get_current_input",
+                ("get_setting", "audio", "volume"),
+                "get_power_state",
+            )
+        assert results == ["HDMI-1", 15, True]
+
+    def test_batch_runs_concurrently(self):
+        vizio = Vizio(
+            "pyvizio", TV_IP_PORT, "TV", AUTH_TOKEN, "tv", max_concurrent_requests=3
+        )
+        with aioresponses() as m:
+            self.mock_state(m, delay=0.2)
+            start = time.monotonic()
+            with vizio.batch() as batch:
+                assert batch.get_power_state() == 0
+                assert batch.get_current_volume(log_api_exception=False) == 1
+                assert batch.get_current_input() == 2
+            elapsed = time.monotonic() - start
+
+        assert batch.results == [True, 15, "HDMI-1"]
+        assert elapsed < 0.5
+
+    @pytest.mark.parametrize("name", ["missing", "validate_ha_config", "_timeout"])
+    def test_only_instance_methods_batched(self, vizio_sync, name):
+        with pytest.raises(AttributeError):
+            getattr(vizio_sync.batch(), name)
+
+    def test_first_exception_raised(self, vizio_sync, monkeypatch):
+        async def fail(self, log_api_exception=True):
+            raise ValueError("boom")
+
+        monkeypatch.setattr(VizioAsync, "get_esn", fail)
+        with aioresponses() as m:
+            self.mock_state(m)
+            with pytest.raises(ValueError):
+                vizio_sync.gather("get_power_state", "get_esn")
+
+
 class TestSyncWrapperGeneration:
     """Tests for the auto-generated sync wrappers."""
 
@@ -0,0 +1,65 @@
+"""Tests for pyvizio.util app list helpers."""
+
+import asyncio
+
+from aioresponses import CallbackResult
+
+from pyvizio.util import gen_apps_list_from_url
+from pyvizio.util.const import APP_NAMES_URL, APP_PAYLOADS_URL
+from tests.conftest import APP_NAMES, APP_PAYLOADS
+
+
+class TestGenAppsListFromUrl:
+    async def test_fetches_and_merges(self, mock_aio):
+        mock_aio.get(APP_NAMES_URL, payload=APP_NAMES)
+        mock_aio.get(APP_PAYLOADS_URL, payload=APP_PAYLOADS)
+
+        apps = await gen_apps_list_from_url()
+
+        assert apps == [
+            {
+                "name": "Netflix",
+                "country": ["usa"],
+                "id": ["1"],
+                "config": [{"NAME_SPACE": 3, "APP_ID": "1", "MESSAGE": None}],
+            }
+        ]
+
+    async def test_fetches_concurrently(self, mock_aio):
+        in_flight = 0
+        max_in_flight = 0
+
+        def delayed(payload):
+            async def callback(url, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.05)
+                in_flight -= 1
+                return CallbackResult(payload=payload)
+
+            return callback
+
+        mock_aio.get(APP_NAMES_URL, callback=delayed(APP_NAMES))
+        mock_aio.get(APP_PAYLOADS_URL, callback=delayed(APP_PAYLOADS))
+
+        assert await gen_apps_list_from_url()
+        assert max_in_flight == 2
+
+    async def test_oversized_response_rejected(self, mock_aio):
+        mock_aio.get(APP_NAMES_URL, payload=APP_NAMES)
+        mock_aio.get(APP_PAYLOADS_URL, payload=APP_PAYLOADS)
+
+        assert await gen_apps_list_from_url(max_size=16) is None
+
+    async def test_invalid_json_returns_none(self, mock_aio):
+        mock_aio.get(APP_NAMES_URL, body="not json")
+        mock_aio.get(APP_PAYLOADS_URL, payload=APP_PAYLOADS)
+
+        assert await gen_apps_list_from_url() is None
+
+    async def test_http_error_returns_none(self, mock_aio):
+        mock_aio.get(APP_NAMES_URL, status=500)
+        mock_aio.get(APP_PAYLOADS_URL, payload=APP_PAYLOADS)
+
+        assert await gen_apps_list_from_url() is None
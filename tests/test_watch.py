@@ -0,0 +1,68 @@
+"""Tests for polling device state for changes."""
+
+from contextlib import ExitStack, contextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from pyvizio import VizioAsync
+from pyvizio.watch import WATCH_FIELDS, async_poll_state, async_watch, watch_fields
+
+
+@contextmanager
+def patch_state(**values):
+    """Patch each polled getter to return successive values from a list."""
+    with ExitStack() as stack:
+        for name, side_effect in values.items():
+            getter = AsyncMock(side_effect=side_effect)
+            stack.enter_context(patch.object(VizioAsync, WATCH_FIELDS[name], getter))
+        yield
+
+
+@pytest.fixture
+def vizio():
+    return VizioAsync("pyvizio", "192.168.1.100:7345", "Test", "token")
+
+
+def test_watch_fields():
+    speaker = VizioAsync("pyvizio", "192.168.1.100:9000", "Test", "", "speaker")
+    assert watch_fields(speaker) == ["power", "volume", "mute", "input"]
+
+
+async def test_poll_state(vizio):
+    with patch_state(
+        power=[True], volume=[12], mute=[False], input=["HDMI-1"], app=[None]
+    ):
+        state = await async_poll_state(vizio)
+    assert state == {
+        "power": True,
+        "volume": 12,
+        "mute": False,
+        "input": "HDMI-1",
+        "app": None,
+    }
+
+
+async def test_watch_reports_changes_only(vizio):
+    with patch_state(
+        power=[True, True, True, True],
+        volume=[10, 10, 12, 12],
+        mute=[False, False, False, True],
+        input=["HDMI-1"] * 4,
+        app=["Netflix"] * 4,
+    ):
+        events = [event async for event in async_watch(vizio, interval=0.001, count=4)]
+
+    assert [event.changes for event in events] == [
+        {
+            "power": (None, True),
+            "volume": (None, 10),
+            "mute": (None, False),
+            "input": (None, "HDMI-1"),
+            "app": (None, "Netflix"),
+        },
+        {"volume": (10, 12)},
+        {"mute": (False, True)},
+    ]
+    assert all(event.latency >= 0 for event in events)
+    assert "volume: 10 -> 12" in str(events[1])